@@ -8,6 +8,7 @@ from pathlib import Path
 from config import password, username
 
 from spond import spond
+from spond.attendance import AttendanceMatrix
 
 EXPORT_DIRPATH = Path("./exports")
 
@@ -37,6 +38,7 @@ args = parser.parse_args()
 async def main() -> None:
     session = spond.Spond(username=username, password=password)
     events = await session.get_events(min_start=args.f, max_start=args.t)
+    matrix = AttendanceMatrix(events, await session.get_groups())
     EXPORT_DIRPATH.mkdir(exist_ok=True)
 
     for e in events:
@@ -51,84 +53,33 @@ async def main() -> None:
                 ["Start", "End", "Description", "Name", "Answer", "Organizer"]
             )
             for o in e["owners"]:
-                name = await _derive_member_name(session, o["id"])
                 spamwriter.writerow(
                     [
                         e["startTimestamp"],
                         e["endTimestamp"],
                         e["heading"],
-                        name,
+                        matrix.name(o["id"]),
                         o["response"],
                         "X",
                     ]
                 )
             if args.a is True:
-                for r in e["responses"]["acceptedIds"]:
-                    name = await _derive_member_name(session, r)
-                    spamwriter.writerow(
-                        [
-                            e["startTimestamp"],
-                            e["endTimestamp"],
-                            e["heading"],
-                            name,
-                            "accepted",
-                        ]
-                    )
-                for r in e["responses"]["declinedIds"]:
-                    name = await _derive_member_name(session, r)
-                    spamwriter.writerow(
-                        [
-                            e["startTimestamp"],
-                            e["endTimestamp"],
-                            e["heading"],
-                            name,
-                            "declined",
-                        ]
-                    )
-                for r in e["responses"]["unansweredIds"]:
-                    name = await _derive_member_name(session, r)
-                    spamwriter.writerow(
-                        [
-                            e["startTimestamp"],
-                            e["endTimestamp"],
-                            e["heading"],
-                            name,
-                            "unanswered",
-                        ]
-                    )
-                for r in e["responses"]["unconfirmedIds"]:
-                    name = await _derive_member_name(session, r)
-                    spamwriter.writerow(
-                        [
-                            e["startTimestamp"],
-                            e["endTimestamp"],
-                            e["heading"],
-                            name,
-                            "unconfirmed",
-                        ]
-                    )
-                for r in e["responses"]["waitinglistIds"]:
-                    name = await _derive_member_name(session, r)
-                    spamwriter.writerow(
-                        [
-                            e["startTimestamp"],
-                            e["endTimestamp"],
-                            e["heading"],
-                            name,
-                            "waitinglist",
-                        ]
-                    )
-
-    await session.clientsession.close()
+                for answer in AttendanceMatrix.KNOWN_STATES:
+                    for r in e["responses"][f"{answer}Ids"]:
+                        spamwriter.writerow(
+                            [
+                                e["startTimestamp"],
+                                e["endTimestamp"],
+                                e["heading"],
+                                matrix.name(r),
+                                answer,
+                            ]
+                        )
 
+    with (EXPORT_DIRPATH / "attendance.csv").open("w", newline="") as csvfile:
+        matrix.to_csv(csvfile)
 
-async def _derive_member_name(spond_session, member_id: str) -> str:
-    """Return full name, or id if member can't be matched."""
-    try:
-        person = await spond_session.get_person(member_id)
-    except KeyError:
-        return member_id
-    return f"{person['firstName']} {person['lastName']}"
+    await session.clientsession.close()
 
 
 def _sanitise_filename(input_str: str) -> str:
@@ -0,0 +1,126 @@
+"""Measure how long decoding a large response blocks the event loop.
+
+Decodes a synthetic `groups/` body with offloading disabled, then with the
+default `DecodeOptions`, while a ticker coroutine records the longest gap
+between its ticks. Also tries `orjson` if it is installed. Offloading only
+shortens the stall for decoders that let go of the GIL while they run.
+
+Runs entirely offline, so no credentials or `config.py` are needed.
+"""
+
+import argparse
+import asyncio
+import json
+import timeit
+
+from spond import spond
+from spond.base import DecodeOptions
+
+parser = argparse.ArgumentParser(
+    description="Benchmark event-loop blocking while decoding large JSON bodies."
+)
+parser.add_argument(
+    "-m",
+    "--members",
+    help="Number of members in the synthetic groups response",
+    type=int,
+    dest="members",
+    default=20_000,
+)
+args = parser.parse_args()
+
+
+class _Response:
+    """The parts of `aiohttp.ClientResponse` that `_read_json` uses."""
+
+    content_type = "application/json"
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.content_length = len(body)
+
+    async def read(self) -> bytes:
+        return self.body
+
+    async def text(self) -> str:
+        return self.body.decode()
+
+    async def json(self, loads=json.loads):
+        return loads(self.body.decode())
+
+
+def _groups(members: int) -> bytes:
+    member = {
+        "firstName": "Ola",
+        "lastName": "Nordmann",
+        "email": "ola@example.invalid",
+        "phoneNumber": "+4700000000",
+        "subGroups": ["SGID1", "SGID2"],
+        "guardians": [
+            {"id": "GUID", "firstName": "Kari", "lastName": "Nordmann"},
+        ],
+    }
+    group = {
+        "id": "GID1",
+        "name": "Club",
+        "members": [
+            {**member, "id": f"MID{i:08d}", "profile": {"id": f"PID{i:08d}"}}
+            for i in range(members)
+        ],
+    }
+    return json.dumps([group]).encode()
+
+
+async def _measure(options: DecodeOptions, body: bytes) -> tuple[float, float]:
+    """Return (seconds the decode took, longest event-loop stall)."""
+    s = spond.Spond(username="benchmark", password="benchmark", decode_options=options)
+    stall = 0.0
+    done = False
+
+    async def ticker() -> None:
+        nonlocal stall
+        last = timeit.default_timer()
+        while not done:
+            await asyncio.sleep(0.001)
+            now = timeit.default_timer()
+            stall = max(stall, now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)  # let the ticker settle
+    started = timeit.default_timer()
+    await s._read_json(_Response(body))
+    elapsed = timeit.default_timer() - started
+    done = True
+    await task
+    await s.close()
+    return elapsed, stall
+
+
+async def main() -> None:
+    body = _groups(args.members)
+    variants = {
+        "json, on the loop": DecodeOptions(offload_threshold=None),
+        "json, offloaded": DecodeOptions(),
+    }
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        variants["orjson, on the loop"] = DecodeOptions(
+            loads=orjson.loads, offload_threshold=None
+        )
+        variants["orjson, offloaded"] = DecodeOptions(loads=orjson.loads)
+
+    print(f"Decoding {len(body) / 1e6:.1f} MB ({args.members} members):")
+    for name, options in variants.items():
+        elapsed, stall = await _measure(options, body)
+        print(
+            f"  {name:20} {elapsed * 1e3:7.1f} ms total, "
+            f"longest loop stall {stall * 1e3:6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
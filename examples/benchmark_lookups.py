@@ -0,0 +1,67 @@
+"""Compare cached `get_event()` lookups against a linear scan of the cache.
+
+Runs entirely offline: the events cache is filled with synthetic events, so no
+credentials or `config.py` are needed.
+"""
+
+import argparse
+import asyncio
+import random
+import timeit
+
+from spond import JSONDict, spond
+
+parser = argparse.ArgumentParser(
+    description="Benchmark get_event() against a linear scan of cached events."
+)
+parser.add_argument(
+    "-n",
+    "--events",
+    help="Number of cached events",
+    type=int,
+    dest="events",
+    default=10_000,
+)
+parser.add_argument(
+    "-l",
+    "--lookups",
+    help="Number of lookups to time",
+    type=int,
+    dest="lookups",
+    default=1_000,
+)
+args = parser.parse_args()
+
+
+def _linear_scan(events: list[JSONDict], uid: str) -> JSONDict:
+    """The lookup `_get_entity` used before the cache was indexed."""
+    for event in events:
+        if event["id"] == uid:
+            return event
+    raise KeyError(uid)
+
+
+async def main() -> None:
+    s = spond.Spond(username="benchmark", password="benchmark")
+    s.token = "benchmark"  # skip login; every lookup is served from the cache
+    s.events = [{"id": f"EID{i:08d}"} for i in range(args.events)]
+    uids = [f"EID{random.randrange(args.events):08d}" for _ in range(args.lookups)]
+
+    started = timeit.default_timer()
+    for uid in uids:
+        _linear_scan(s.events, uid)
+    scan = timeit.default_timer() - started
+
+    started = timeit.default_timer()
+    for uid in uids:
+        await s.get_event(uid)
+    indexed = timeit.default_timer() - started
+
+    print(f"{args.lookups} lookups in {args.events} cached events:")
+    print(f"  linear scan: {scan * 1000:9.2f} ms")
+    print(f"  get_event(): {indexed * 1000:9.2f} ms (includes building the index)")
+    await s.clientsession.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+"""Compare the memory held by raw group dicts and by `spond.models`.
+
+Builds a synthetic `groups/` response, decodes it, and measures with
+`tracemalloc` how much memory the plain dicts take and how much the same
+data takes wrapped in `Group` models, then checks `raw` round-trips.
+
+Runs entirely offline, so no credentials or `config.py` are needed.
+"""
+
+import argparse
+import json
+import tracemalloc
+
+from spond.models import Group
+
+parser = argparse.ArgumentParser(
+    description="Benchmark memory use of raw dicts against typed models."
+)
+parser.add_argument(
+    "-m",
+    "--members",
+    help="Number of members in the synthetic groups response",
+    type=int,
+    dest="members",
+    default=10_000,
+)
+args = parser.parse_args()
+
+
+def _groups(members: int) -> str:
+    group = {
+        "id": "GID1",
+        "name": "Club",
+        "members": [
+            {
+                "id": f"MID{i:08d}",
+                "firstName": f"Ola{i % 500}",
+                "lastName": f"Nordmann{i % 2000}",
+                "email": f"ola{i}@example.invalid",
+                "phoneNumber": f"+47{i:08d}",
+                "profile": {"id": f"PID{i:08d}"},
+                "subGroups": [f"SGID{i % 10}"],
+                "roles": [],
+                "guardians": [
+                    {
+                        "id": f"GUID{i:08d}",
+                        "firstName": f"Kari{i % 500}",
+                        "lastName": f"Nordmann{i % 2000}",
+                        "profile": {"id": f"PGID{i:08d}"},
+                    }
+                ],
+            }
+            for i in range(members)
+        ],
+    }
+    return json.dumps([group])
+
+
+def _traced(build):
+    """Return (what `build()` returned, bytes it still holds)."""
+    tracemalloc.start()
+    try:
+        result = build()
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    body = _groups(args.members)
+    raw, raw_bytes = _traced(lambda: json.loads(body))
+    typed, typed_bytes = _traced(lambda: Group.from_list(json.loads(body)))
+    assert [g.raw for g in typed] == raw
+
+    print(f"{args.members} members:")
+    print(f"  raw dicts   {raw_bytes / 1e6:6.1f} MB")
+    print(
+        f"  models      {typed_bytes / 1e6:6.1f} MB "
+        f"({1 - typed_bytes / raw_bytes:.0%} less)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -20,13 +20,23 @@ parser.add_argument(
     dest="max",
     default=1000,
 )
+parser.add_argument(
+    "-c",
+    "--concurrency",
+    help="The number of pages of transactions to request at once",
+    type=int,
+    dest="concurrency",
+    default=4,
+)
 
 args = parser.parse_args()
 
 
 async def main() -> None:
     s = SpondClub(username=username, password=password)
-    transactions = await s.get_transactions(club_id=club_id, max_items=args.max)
+    transactions = await s.get_transactions(
+        club_id=club_id, max_items=args.max, concurrency=args.concurrency
+    )
     if not transactions:
         print("No transactions found.")
         await s.clientsession.close()
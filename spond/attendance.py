@@ -0,0 +1,224 @@
+"""Member × event attendance matrices.
+
+An `AttendanceMatrix` turns a list of events (from `spond.spond.Spond.get_events`
+or `iter_events`) and the groups they belong to (from `get_groups`) into one
+table of every member's response to every event. It is built in a single pass
+over the events' `responses`, with names resolved once from the groups, and
+stores one byte per cell:
+
+```python
+from spond.attendance import AttendanceMatrix
+
+matrix = AttendanceMatrix(
+    await s.get_events(group_id=gid, min_start=season_start, max_events=500),
+    await s.get_groups(),
+)
+matrix.state("MEMBER_ID", "EVENT_ID")  # e.g. "accepted"
+matrix.counts("MEMBER_ID")  # e.g. Counter({"accepted": 12, "declined": 3})
+with open("attendance.csv", "w", newline="") as f:
+    matrix.to_csv(f)
+```
+"""
+
+from __future__ import annotations
+
+import csv
+from collections import Counter
+from typing import TYPE_CHECKING, ClassVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import TextIO
+
+    from . import JSONDict
+
+
+class AttendanceMatrix:
+    """Every member's response to every event of a set of events.
+
+    Rows are the members who appear in any event's `responses`: first those
+    found in the groups, in group and member order, then any unknown ids in
+    the order they were first seen. Columns are the events, in the order
+    given. A cell holds the member's response state, named after the
+    `responses` key without its `Ids` suffix (`"accepted"`, `"declined"`,
+    ...), or `None` where the member wasn't invited.
+    """
+
+    KNOWN_STATES: ClassVar = (
+        "accepted",
+        "declined",
+        "unanswered",
+        "unconfirmed",
+        "waitinglist",
+    )
+    """States in the order they are listed; others follow as first seen."""
+
+    def __init__(
+        self, events: Iterable[JSONDict], groups: Iterable[JSONDict] | None = None
+    ) -> None:
+        """Build the matrix.
+
+        Parameters
+        ----------
+        events : Iterable[JSONDict]
+            Events as returned by `get_events()`. Only their `id`,
+            `responses`, and for `to_csv()` their `startTimestamp` and
+            `heading`, are used.
+        groups : Iterable[JSONDict], optional
+            Groups as returned by `get_groups()`, used to order the rows and
+            to resolve names. Without them, rows are in order of first
+            appearance and `name()` returns ids.
+        """
+        self.events: list[JSONDict] = list(events)
+        """The events, one per column."""
+        self.event_ids: list[str] = [e["id"] for e in self.events]
+        """Event id of each column."""
+        self.states: list[str] = list(self.KNOWN_STATES)
+        """Every state a cell can hold."""
+        self._names: dict[str, str] = {}
+        roster: dict[str, int] = {}
+        for group in groups or ():
+            for member in group.get("members", ()):
+                roster.setdefault(member["id"], len(roster))
+                for person in (member, *member.get("guardians", ())):
+                    self._add_name(person)
+
+        # One pass over the responses, filling a row per member as it turns
+        # up; the rows are put in roster order afterwards.
+        width = len(self.events)
+        codes = {state: i for i, state in enumerate(self.states, 1)}
+        rows: dict[str, bytearray] = {}
+        for column, event in enumerate(self.events):
+            for state, member_ids in _response_lists(event):
+                code = codes.get(state)
+                if code is None:
+                    self.states.append(state)
+                    code = codes[state] = len(self.states)
+                for member_id in member_ids:
+                    row = rows.get(member_id)
+                    if row is None:
+                        row = rows[member_id] = bytearray(width)
+                    row[column] = code
+
+        unknown = len(roster)
+        self.member_ids: list[str] = sorted(
+            rows, key=lambda member_id: roster.get(member_id, unknown)
+        )
+        """Member id of each row."""
+        self._cells = b"".join(rows[member_id] for member_id in self.member_ids)
+        self._rows = {member_id: i for i, member_id in enumerate(self.member_ids)}
+        self._columns = {event_id: i for i, event_id in enumerate(self.event_ids)}
+
+    def _add_name(self, person: JSONDict) -> None:
+        """Record `person`'s full name under their id and profile id; the
+        first person seen with an id keeps it, as in `get_person()`."""
+        name = f"{person.get('firstName', '')} {person.get('lastName', '')}".strip()
+        self._names.setdefault(person["id"], name)
+        profile = person.get("profile")
+        if isinstance(profile, dict) and "id" in profile:
+            self._names.setdefault(profile["id"], name)
+
+    def name(self, uid: str) -> str:
+        """Full name of the member or guardian with id or profile id `uid`;
+        `uid` itself if no group lists them."""
+        return self._names.get(uid) or uid
+
+    def state(self, member_id: str, event_id: str) -> str | None:
+        """Return a member's response to an event.
+
+        Returns
+        -------
+        str or None
+            The response state; `None` if the member wasn't invited.
+
+        Raises
+        ------
+        KeyError
+            The member or event is not in the matrix.
+        """
+        code = self._cells[self._offset(member_id) + self._columns[event_id]]
+        return self.states[code - 1] if code else None
+
+    def row(self, member_id: str) -> list[str | None]:
+        """Return a member's response to each event, in column order.
+
+        Raises
+        ------
+        KeyError
+            The member is not in the matrix.
+        """
+        start = self._offset(member_id)
+        return [
+            self.states[code - 1] if code else None
+            for code in self._cells[start : start + len(self.event_ids)]
+        ]
+
+    def counts(self, member_id: str) -> Counter[str]:
+        """Return how many of the events a member gave each response to.
+
+        Raises
+        ------
+        KeyError
+            The member is not in the matrix.
+        """
+        start = self._offset(member_id)
+        codes = Counter(self._cells[start : start + len(self.event_ids)])
+        return Counter({self.states[c - 1]: n for c, n in codes.items() if c})
+
+    def event_counts(self, event_id: str) -> Counter[str]:
+        """Return how many members gave each response to an event.
+
+        Raises
+        ------
+        KeyError
+            The event is not in the matrix.
+        """
+        codes = Counter(self._cells[self._columns[event_id] :: len(self.event_ids)])
+        return Counter({self.states[c - 1]: n for c, n in codes.items() if c})
+
+    def __iter__(self) -> Iterator[tuple[str, list[str | None]]]:
+        """Yield `(member_id, row)` for every member, in row order."""
+        for member_id in self.member_ids:
+            yield member_id, self.row(member_id)
+
+    def __len__(self) -> int:
+        return len(self.member_ids)
+
+    def to_csv(self, file: TextIO) -> None:
+        """Write the matrix as CSV: a row per member with their id, name and
+        response to each event (empty where not invited), under a header
+        naming each event by its start time and heading.
+
+        Parameters
+        ----------
+        file : TextIO
+            Open text file to write to, opened with `newline=""`.
+        """
+        writer = csv.writer(file)
+        writer.writerow(
+            [
+                "Member id",
+                "Name",
+                *(
+                    f"{e.get('startTimestamp', '')} {e.get('heading', '')}".strip()
+                    for e in self.events
+                ),
+            ]
+        )
+        for member_id, row in self:
+            writer.writerow([member_id, self.name(member_id), *(s or "" for s in row)])
+
+    def _offset(self, member_id: str) -> int:
+        try:
+            return self._rows[member_id] * len(self.event_ids)
+        except KeyError:
+            errmsg = f"No member with id='{member_id}' in the matrix."
+            raise KeyError(errmsg) from None
+
+
+def _response_lists(event: JSONDict) -> Iterator[tuple[str, list[str]]]:
+    """Yield `(state, member_ids)` for each `<state>Ids` list in an event's
+    `responses`, e.g. `("accepted", [...])` for `acceptedIds`."""
+    for key, member_ids in (event.get("responses") or {}).items():
+        if key.endswith("Ids") and isinstance(member_ids, list):
+            yield key.removesuffix("Ids"), member_ids
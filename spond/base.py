@@ -5,16 +5,33 @@ and `spond.club.SpondClub` (Spond Club finance API). It owns the credentials,
 the underlying aiohttp `ClientSession`, the access token, and the lazy login
 flow used by the `require_authentication` decorator.
 
-Not intended to be instantiated directly — use a subclass.
+`_SpondBase` is not intended to be instantiated directly — use a subclass.
+`ConnectionOptions` tunes the connection pool of the session a client opens;
+alternatively pass an existing `aiohttp.ClientSession` to share one pool
+between several clients. `DecodeOptions` chooses how response bodies are
+decoded from JSON.
 """
 
+import asyncio
+import contextlib
 import functools
+import inspect
+import json
 from abc import ABC
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, ClassVar, TypeVar
 
 import aiohttp
 
 from spond import AuthenticationError
+from spond.cache import ResponseCache, TransferMetrics
+from spond.mirror import SQLiteMirror
+from spond.rate_limit import TokenBucket
+from spond.retry import RetryMetrics, RetryPolicy
+from spond.stream import iter_json_array
+from spond.token_store import StoredToken, TokenStore
 
 # Fields from a login response that are safe to surface in an
 # `AuthenticationError` message. Anything outside this set (notably 2FA
@@ -22,6 +39,120 @@ from spond import AuthenticationError
 # sensitive data into application logs.
 _SAFE_LOGIN_ERROR_FIELDS = ("error", "errorKey", "errorCode", "message")
 
+# A token this close to its expiry is treated as already expired, so a request
+# sent with it doesn't race the deadline.
+_TOKEN_EXPIRY_MARGIN = timedelta(minutes=1)
+
+# Once a token is this close to its expiry, the next authenticated call starts
+# a background login so a fresh token is ready before the old one lapses.
+_TOKEN_REFRESH_AHEAD = timedelta(minutes=10)
+
+_T = TypeVar("_T")
+
+
+def _validators(headers: Mapping[str, str]) -> dict[str, str]:
+    """Return the conditional-request headers that revalidate a response
+    carrying `headers`: `If-None-Match` for an `ETag`, `If-Modified-Since`
+    for a `Last-Modified`."""
+    validators = {}
+    etag = headers.get("ETag")
+    if isinstance(etag, str):
+        validators["If-None-Match"] = etag
+    last_modified = headers.get("Last-Modified")
+    if isinstance(last_modified, str):
+        validators["If-Modified-Since"] = last_modified
+    return validators
+
+
+def _loads_in_thread(body: str | bytes) -> Any:
+    """`json.loads` for use in a worker thread.
+
+    The C decoder holds the GIL for the whole document, which would stall
+    the event loop just as long as decoding on it. Calling back into Python
+    for every object lets the thread hand the GIL back in between.
+    """
+    return json.loads(body, object_hook=_identity)
+
+
+def _identity(value: _T) -> _T:
+    return value
+
+
+def _freeze(value: Any) -> Hashable:
+    """Return a hashable equivalent of `value`, a JSON-like structure of
+    dicts, lists and scalars, for use in a lookup key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True)
+class ConnectionOptions:
+    """Connection-pool settings for the aiohttp session a client opens.
+
+    The defaults match aiohttp's own `TCPConnector` defaults. Pass an instance
+    as `connection_options` to `spond.spond.Spond` or `spond.club.SpondClub`,
+    or call `create_session()` to build a session that several clients then
+    share via their `session` argument.
+    """
+
+    limit: int = 100
+    """Maximum number of simultaneous connections; 0 for no limit."""
+    limit_per_host: int = 0
+    """Maximum simultaneous connections to one host; 0 for no limit."""
+    keepalive_timeout: float = 15.0
+    """Seconds an idle connection is kept open for reuse."""
+    ttl_dns_cache: int | None = 10
+    """Seconds resolved DNS entries are cached; `None` caches forever."""
+
+    def create_session(self) -> aiohttp.ClientSession:
+        """Open an aiohttp session whose connector uses these settings.
+
+        The caller owns the returned session and must close it.
+
+        Returns
+        -------
+        aiohttp.ClientSession
+            A new session with its own cookie jar and connection pool.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+        return aiohttp.ClientSession(
+            connector=connector, cookie_jar=aiohttp.CookieJar()
+        )
+
+
+@dataclass(frozen=True)
+class DecodeOptions:
+    """How a client decodes JSON response bodies.
+
+    Pass an instance as `decode_options` to `spond.spond.Spond` or
+    `spond.club.SpondClub`, e.g. to use a faster decoder:
+
+    ```python
+    import orjson
+
+    s = Spond(username="...", password="...",
+              decode_options=DecodeOptions(loads=orjson.loads))
+    ```
+    """
+
+    loads: Callable[[str | bytes], Any] = json.loads
+    """Decoder called with the response body; must accept `str` and
+    `bytes`, like `json.loads` and `orjson.loads`."""
+    offload_threshold: int | None = 256 * 1024
+    """Bodies of at least this many bytes are decoded in a worker thread;
+    `None` decodes everything on the loop. With the default `json.loads`
+    this keeps a large response from blocking the event loop for most of
+    its decode; a decoder that holds the GIL throughout (such as `orjson`)
+    only gains from being faster."""
+
 
 class _SpondBase(ABC):
     """Abstract base for Spond API clients.
@@ -29,10 +160,28 @@ class _SpondBase(ABC):
     Subclasses provide the API base URL via the third constructor argument
     and inherit lazy authentication, the `auth_headers` property, the
     `require_authentication` decorator, and the `login()` flow.
+
+    Clients can be used as async context managers, which call `close()` on
+    exit.
     """
 
-    def __init__(self, username: str, password: str, api_url: str) -> None:
-        """Initialise credentials and open the aiohttp session.
+    _MIRROR_BATCH_SIZE: ClassVar = 100
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        api_url: str,
+        session: aiohttp.ClientSession | None = None,
+        connection_options: ConnectionOptions | None = None,
+        token_store: TokenStore | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: TokenBucket | None = None,
+        response_cache: ResponseCache | None = None,
+        mirror: SQLiteMirror | None = None,
+        decode_options: DecodeOptions | None = None,
+    ) -> None:
+        """Initialise credentials and open (or adopt) the aiohttp session.
 
         Parameters
         ----------
@@ -44,12 +193,82 @@ class _SpondBase(ABC):
             Base URL for the API family this client targets (consumer or
             club). Must end with a trailing slash so relative paths can be
             concatenated.
+        session : aiohttp.ClientSession, optional
+            Existing session to send requests through, e.g. one shared with
+            other clients. The client does not own it: `close()` leaves it
+            open and the caller must close it. If omitted, the client opens
+            and owns its own session.
+        connection_options : ConnectionOptions, optional
+            Connection-pool settings for the session the client opens.
+            Defaults to `ConnectionOptions()`.
+        token_store : spond.token_store.TokenStore, optional
+            Where to look for a still-valid token before logging in, and to
+            save the token after each login. See `spond.token_store`.
+        retry_policy : spond.retry.RetryPolicy, optional
+            How requests that fail transiently are retried. Defaults to
+            `RetryPolicy()`; see `spond.retry`.
+        rate_limiter : spond.rate_limit.TokenBucket, optional
+            Limiter every request to `api_url` (logins and retries included)
+            waits on. Unlimited if omitted.
+        response_cache : spond.cache.ResponseCache, optional
+            Cache consulted by `_get_json` calls that name an endpoint. No
+            caching if omitted.
+        mirror : spond.mirror.SQLiteMirror, optional
+            Local database that `_save_to_mirror` writes fetched data
+            through to. Nothing is mirrored if omitted.
+        decode_options : DecodeOptions, optional
+            JSON decoder, and the body size above which it runs in a worker
+            thread, used by `_read_json`. Defaults to `DecodeOptions()`.
+
+        Raises
+        ------
+        ValueError
+            Both `session` and `connection_options` were given; the options
+            only apply to a session the client opens itself.
         """
+        if session is not None and connection_options is not None:
+            raise ValueError(
+                "Pass either session or connection_options, not both: "
+                "configure a shared session when creating it."
+            )
         self.username = username
         self.password = password
         self.api_url = api_url
-        self.clientsession = aiohttp.ClientSession(cookie_jar=aiohttp.CookieJar())
+        self._owns_session = session is None
+        if session is None:
+            session = (connection_options or ConnectionOptions()).create_session()
+        self.clientsession = session
         self.token = None
+        self.token_expiration: datetime | None = None
+        self.token_store = token_store
+        self._refresh_task: asyncio.Task | None = None
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_metrics = RetryMetrics()
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.mirror = mirror
+        self.decode_options = decode_options or DecodeOptions()
+        self.transfer_metrics = TransferMetrics()
+
+    async def close(self) -> None:
+        """Close the aiohttp session if this client opened it, and cancel any
+        background token refresh.
+
+        A session passed in via the constructor's `session` argument is left
+        open for its owner to close.
+        """
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._owns_session:
+            await self.clientsession.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
 
     @property
     def auth_headers(self) -> dict:
@@ -63,25 +282,53 @@ class _SpondBase(ABC):
     @staticmethod
     def require_authentication(func: Callable):
         """Decorator that calls `self.login()` before invoking `func` if the
-        client is not yet authenticated. On `AuthenticationError`, closes the
-        underlying aiohttp session before re-raising."""
+        client is not yet authenticated or its token has expired. If the token
+        is merely close to expiry, a login is started in the background
+        instead and the call proceeds with the current token. On
+        `AuthenticationError`, closes the underlying aiohttp session (if the
+        client owns it) before re-raising.
 
-        @functools.wraps(func)
-        async def wrapper(self, *args, **kwargs):
-            if not self.token:
+        Works for both coroutine methods and async-generator methods; for the
+        latter, login happens when iteration starts."""
+
+        async def authenticate(self) -> None:
+            if not self.token and self.token_store is not None:
+                await self._single_flight("token_store", self._load_stored_token)
+            if not self.token or self._is_expired(self.token_expiration):
                 try:
-                    await self.login()
+                    await self._single_flight("login", self.login)
                 except AuthenticationError as e:
-                    await self.clientsession.close()
+                    await self.close()
                     raise e
+            elif self._is_expired(self.token_expiration, _TOKEN_REFRESH_AHEAD):
+                self._start_background_refresh()
+
+        if inspect.isasyncgenfunction(func):
+
+            @functools.wraps(func)
+            async def gen_wrapper(self, *args, **kwargs):
+                await authenticate(self)
+                # Close the wrapped generator along with this one, so its
+                # cleanup (e.g. releasing a response) runs on `aclose()`.
+                async with contextlib.aclosing(func(self, *args, **kwargs)) as agen:
+                    async for item in agen:
+                        yield item
+
+            return gen_wrapper
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            await authenticate(self)
             return await func(self, *args, **kwargs)
 
         return wrapper
 
     async def login(self) -> None:
         """Authenticate against the Spond API and store the access token on
-        `self.token`. Called automatically by the `require_authentication`
-        decorator; rarely needs to be called explicitly.
+        `self.token` (and its expiry on `self.token_expiration`). Called
+        automatically by the `require_authentication` decorator; rarely needs
+        to be called explicitly. If the client has a `token_store`, the new
+        token is saved to it.
 
         Raises
         ------
@@ -90,9 +337,436 @@ class _SpondBase(ABC):
         """
         login_url = f"{self.api_url}auth2/login"
         data = {"email": self.username, "password": self.password}
+        await self._throttle(login_url)
         async with self.clientsession.post(login_url, json=data) as r:
-            login_result = await r.json()
+            login_result = await self._read_json(r)
         self.token = self._extract_access_token(login_result)
+        self.token_expiration = self._extract_access_token_expiration(login_result)
+        if self.token_store is not None:
+            await asyncio.to_thread(
+                self.token_store.save,
+                self._token_store_key,
+                StoredToken(self.token, self.token_expiration),
+            )
+
+    @property
+    def _token_store_key(self) -> str:
+        """Key this client's token is saved under in `token_store`: one per
+        account and API family, since each family has its own login."""
+        return f"{self.username}@{self.api_url}"
+
+    async def _load_stored_token(self) -> None:
+        """Adopt the token saved in `token_store`, unless there is none or it
+        has expired (or is about to)."""
+        stored = await asyncio.to_thread(self.token_store.load, self._token_store_key)
+        if stored is not None and not self._is_expired(stored.expiration):
+            self.token, self.token_expiration = stored
+
+    @staticmethod
+    def _is_expired(
+        expiration: datetime | None, margin: timedelta = _TOKEN_EXPIRY_MARGIN
+    ) -> bool:
+        """Return True if a token expiring at `expiration` is within `margin`
+        of expiry. Tokens with unknown expiry are assumed valid."""
+        if expiration is None:
+            return False
+        return expiration - margin <= datetime.now(UTC)
+
+    def _start_background_refresh(self) -> None:
+        """Log in again in a background task, unless one is already running."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        """Body of the background refresh task. Failures are swallowed: the
+        current token stays in use, and once it expires the next call logs in
+        in the foreground and surfaces the error."""
+        with contextlib.suppress(AuthenticationError, aiohttp.ClientError):
+            await self._single_flight("login", self.login)
+
+    async def _relogin(self, stale_token: str | None) -> None:
+        """Log in again after `stale_token` was rejected, unless another
+        caller has already replaced it."""
+        if self.token == stale_token:
+            await self._single_flight("login", self.login)
+
+    async def _single_flight(
+        self, key: Hashable, operation: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Run `operation()` unless an earlier call with the same `key` is
+        still in flight, in which case wait for that one instead.
+
+        Used for handshakes such as login, so that many coroutines finding
+        the client unauthenticated at once trigger a single request, and for
+        coalescing identical GETs (see `_get_json`). Every waiter gets the
+        operation's result or exception. A waiter being cancelled does not
+        cancel the shared operation.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifies the operation; calls with different keys don't
+            interact.
+        operation : Callable[[], Awaitable[_T]]
+            Starts the operation, e.g. a bound `login` method.
+
+        Returns
+        -------
+        _T
+            The operation's result.
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(operation())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _get_json(
+        self,
+        url: str,
+        headers: dict | None = None,
+        auth: bool = True,
+        raise_for_status: bool = True,
+        cache_as: str | None = None,
+        **kwargs,
+    ) -> Any:
+        """GET `url` via `_request` and return the decoded JSON body.
+
+        Concurrent calls for the same URL, query parameters and credentials
+        share a single request: later callers wait for the one already in
+        flight and receive the same decoded object, so treat results as
+        read-only.
+
+        With `cache_as` set and a `response_cache` configured, a fresh cached
+        response for the same URL and parameters is returned without a
+        request, and new successful responses are cached under that endpoint
+        name along with their `ETag`/`Last-Modified` validators. An expired
+        response with validators is revalidated with a conditional request,
+        and a 304 answer renews it (counted in `transfer_metrics`). Error
+        bodies returned with `raise_for_status=False` are never cached.
+
+        Parameters
+        ----------
+        url : str
+            Absolute request URL.
+        headers : dict, optional
+            Extra headers, as for `_request`.
+        auth : bool, optional
+            As for `_request`. Defaults to True.
+        raise_for_status : bool, optional
+            Raise `ValueError` for an unsuccessful response instead of
+            returning its body. Defaults to True.
+        cache_as : str, optional
+            Endpoint name to cache the response under, e.g. `"events"`.
+            Not cached if omitted.
+        **kwargs
+            Passed through to `_request` (normally just `params`).
+
+        Returns
+        -------
+        Any
+            The decoded response body.
+
+        Raises
+        ------
+        ValueError
+            `raise_for_status` is set and the request failed.
+        """
+
+        cache = self.response_cache if cache_as else None
+        cache_key = (url, _freeze(kwargs))
+        stale = None
+        if cache is not None:
+            hit, value = cache.get(cache_as, cache_key)
+            if hit:
+                return value
+            stale = cache.get_stale(cache_as, cache_key)
+        if stale is not None:
+            headers = {**(headers or {}), **stale.validators}
+
+        async def fetch() -> tuple[bool, Any, dict[str, str], int, bool]:
+            async with self._request(
+                "get", url, headers=headers, auth=auth, **kwargs
+            ) as r:
+                if stale is not None and r.status == 304:
+                    return True, None, {}, 0, True
+                if raise_for_status and not r.ok:
+                    error_details = await r.text()
+                    raise ValueError(
+                        f"Request failed with status {r.status}: {error_details}"
+                    )
+                value = await self._read_json(r)
+                if cache is None or not r.ok:
+                    return False, value, {}, 0, r.ok
+                size = r.content_length or 0
+                return False, value, _validators(r.headers), size, True
+
+        key = (
+            "GET",
+            url,
+            _freeze(kwargs),
+            _freeze(headers or {}),
+            self.token if auth else None,
+        )
+        not_modified, value, validators, size, ok = await self._single_flight(
+            key, fetch
+        )
+        if not_modified:
+            value, validators, size = stale.value, stale.validators, stale.size
+            self.transfer_metrics.not_modified += 1
+            self.transfer_metrics.bytes_saved += size
+        elif not ok:
+            # An error body is returned to the caller but never cached.
+            return value
+        if cache is not None:
+            cache.put(cache_as, cache_key, value, validators, size)
+        return value
+
+    async def _read_json(self, r: aiohttp.ClientResponse) -> Any:
+        """Decode a response body as JSON with `decode_options`.
+
+        Bodies of at least `decode_options.offload_threshold` bytes are
+        decoded in a worker thread. The size is taken from `Content-Length`
+        when the server sends one (for a compressed body, the compressed
+        size); otherwise the body is read first and measured.
+
+        Parameters
+        ----------
+        r : aiohttp.ClientResponse
+            Response whose body to decode.
+
+        Returns
+        -------
+        Any
+            The decoded body; `None` if it is empty.
+        """
+        loads = self.decode_options.loads
+        threshold = self.decode_options.offload_threshold
+        # aiohttp decodes with `json.loads` unless told otherwise.
+        kwargs = {} if loads is json.loads else {"loads": loads}
+        if threshold is None:
+            return await r.json(**kwargs)
+        size = r.content_length
+        if size is None and "json" in r.content_type:
+            # Chunked: the size is only known once the body is in.
+            body = (await r.read()).strip()
+            if not body:
+                return None
+            if len(body) < threshold:
+                return loads(body)
+        elif isinstance(size, int) and size >= threshold:
+            body = await r.text()
+        else:
+            return await r.json(**kwargs)
+        if loads is json.loads:
+            loads = _loads_in_thread
+        return await asyncio.to_thread(loads, body)
+
+    async def _stream_json(
+        self,
+        url: str,
+        headers: dict | None = None,
+        auth: bool = True,
+        save_as: str | None = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """GET `url` and yield the elements of the JSON array it returns as
+        they are decoded from the response stream (see `spond.stream`).
+
+        Unlike `_get_json`, nothing is cached or shared between concurrent
+        callers, and the connection stays checked out until the generator
+        finishes; close it (e.g. with `contextlib.aclosing`) when stopping
+        early.
+
+        Parameters
+        ----------
+        url : str
+            Absolute request URL.
+        headers : dict, optional
+            Extra headers, as for `_request`.
+        auth : bool, optional
+            As for `_request`. Defaults to True.
+        save_as : str, optional
+            Name of a `SQLiteMirror.save_*` method taking a list of the
+            elements; they are written to the mirror, if any, in batches of
+            `_MIRROR_BATCH_SIZE` as they are read.
+        **kwargs
+            Passed through to `_request` (normally just `params`).
+
+        Yields
+        ------
+        Any
+            The decoded elements, in order.
+
+        Raises
+        ------
+        ValueError
+            The request failed, or the body is not a JSON array.
+        """
+        batch = [] if save_as and self.mirror is not None else None
+        async with self._request("get", url, headers=headers, auth=auth, **kwargs) as r:
+            if not r.ok:
+                error_details = await r.text()
+                raise ValueError(
+                    f"Request failed with status {r.status}: {error_details}"
+                )
+            async for element in iter_json_array(r.content):
+                if batch is not None:
+                    batch.append(element)
+                    if len(batch) >= self._MIRROR_BATCH_SIZE:
+                        await self._save_to_mirror(save_as, batch)
+                        batch = []
+                yield element
+        if batch:
+            await self._save_to_mirror(save_as, batch)
+
+    async def _save_to_mirror(self, method: str, *args: Any) -> None:
+        """Call `self.mirror.<method>(*args)` in a worker thread, if the
+        client has a mirror.
+
+        Parameters
+        ----------
+        method : str
+            Name of a `SQLiteMirror.save_*` method.
+        *args
+            Its arguments.
+        """
+        if self.mirror is not None:
+            await asyncio.to_thread(getattr(self.mirror, method), *args)
+
+    def _rate_limiter_for(self, url: str) -> TokenBucket | None:
+        """Return the limiter requests to `url` must wait on, if any.
+        Subclasses talking to more than one host override this."""
+        return self.rate_limiter
+
+    async def _throttle(self, url: str) -> None:
+        """Wait for the rate limiter covering `url`, if there is one."""
+        limiter = self._rate_limiter_for(url)
+        if limiter is not None:
+            await limiter.acquire()
+
+    @contextlib.asynccontextmanager
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict | None = None,
+        auth: bool = True,
+        retry: bool | None = None,
+        **kwargs,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Send a request and yield the response.
+
+        For `auth=True`, `auth_headers` are sent along with any extra
+        `headers`, and if the server answers 401 Unauthorized the client logs
+        in again once and replays the request with the new token; a second
+        401 is yielded to the caller like any other response.
+
+        Every attempt first waits for the rate limiter covering `url` (see
+        `_rate_limiter_for`). Responses with a status in
+        `retry_policy.retry_statuses`, and connection errors or timeouts, are
+        retried as `self.retry_policy` allows (see `spond.retry`). Once
+        retries are exhausted, the last response is yielded or the last
+        exception raised.
+
+        ```python
+        async with self._request("get", url, params=params) as r:
+            data = await self._read_json(r)
+        ```
+
+        Parameters
+        ----------
+        method : str
+            Lower-case HTTP method, e.g. `"get"`; the name of the
+            `aiohttp.ClientSession` method to call.
+        url : str
+            Absolute request URL.
+        headers : dict, optional
+            Headers to send in addition to (or overriding) `auth_headers`.
+        auth : bool, optional
+            Whether to send `auth_headers` and re-login on 401. Disable for
+            hosts with their own authentication, such as the chat server.
+            Defaults to True.
+        retry : bool, optional
+            Whether transient failures may be retried. Defaults to `None`,
+            meaning only if `method` is in `retry_policy.retry_methods`.
+        **kwargs
+            Passed through to the session method (`params`, `json`, ...).
+
+        Yields
+        ------
+        aiohttp.ClientResponse
+            The response, valid until the `async with` block exits.
+        """
+        send = getattr(self.clientsession, method)
+        policy = self.retry_policy
+        if retry is None:
+            retry = method in policy.retry_methods
+        retries = 0
+        relogged_in = False
+        delivered = False
+        while True:
+            token = self.token
+            request_headers = (
+                {**self.auth_headers, **(headers or {})} if auth else headers
+            )
+            can_retry = retry and retries < policy.max_retries
+            await self._throttle(url)
+            try:
+                async with send(url, headers=request_headers, **kwargs) as r:
+                    if auth and r.status == 401 and not relogged_in:
+                        relogged_in = True
+                        await self._relogin(token)
+                        continue
+                    if r.status not in policy.retry_statuses:
+                        delivered = True
+                    elif can_retry:
+                        delay = policy.delay(retries, r.headers.get("Retry-After"))
+                        self.retry_metrics.record_retry(r.status, delay)
+                    else:
+                        self.retry_metrics.exhausted += retry
+                        delivered = True
+                    if delivered:
+                        yield r
+                        return
+            except (aiohttp.ClientConnectionError, TimeoutError) as e:
+                # Errors raised by the caller's `async with` body are theirs.
+                if delivered:
+                    raise
+                if not can_retry:
+                    self.retry_metrics.exhausted += retry
+                    raise
+                delay = policy.delay(retries)
+                self.retry_metrics.record_retry(type(e).__name__, delay)
+            retries += 1
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _extract_access_token_expiration(login_result: dict) -> datetime | None:
+        """Pull the access token's expiry time out of a `/auth2/login`
+        response, if present and parseable.
+
+        Parameters
+        ----------
+        login_result : dict
+            Parsed JSON body from the login endpoint.
+
+        Returns
+        -------
+        datetime or None
+            Timezone-aware expiry time (naive values are taken as UTC), or
+            `None` if the response doesn't carry a usable `expiration`.
+        """
+        access = login_result.get("accessToken")
+        expiration = access.get("expiration") if isinstance(access, dict) else None
+        if not isinstance(expiration, str):
+            return None
+        try:
+            parsed = datetime.fromisoformat(expiration)
+        except ValueError:
+            return None
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
 
     @staticmethod
     def _extract_access_token(login_result: dict) -> str:
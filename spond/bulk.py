@@ -0,0 +1,91 @@
+"""Per-item results of bulk operations.
+
+Bulk methods such as `spond.spond.Spond.change_responses` run one API call
+per item, several at a time, and report each item's outcome as an
+`ItemResult` instead of stopping at the first failure:
+
+```python
+results, responses = await s.change_responses(changes, concurrency=5)
+for r in results.failed:
+    print(r.item, r.error)
+```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
+_I = TypeVar("_I")
+
+
+class ItemResult(NamedTuple, Generic[_I]):
+    """The outcome of one item of a bulk operation."""
+
+    item: _I
+    """The input item, as passed to the bulk method."""
+    value: Any
+    """What the API call for the item returned; `None` if it failed."""
+    error: Exception | None
+    """Why the item failed; `None` if it succeeded."""
+    elapsed: float
+    """Seconds from starting the item's call to its completion."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item succeeded."""
+        return self.error is None
+
+
+class BulkResults(list[ItemResult[_I]]):
+    """`ItemResult`s of a bulk operation, in input order."""
+
+    @property
+    def succeeded(self) -> list[ItemResult[_I]]:
+        """Results of the items that succeeded."""
+        return [r for r in self if r.ok]
+
+    @property
+    def failed(self) -> list[ItemResult[_I]]:
+        """Results of the items that failed."""
+        return [r for r in self if not r.ok]
+
+
+async def _run_bounded(
+    items: Iterable[_I],
+    operation: Callable[[_I], Awaitable[Any]],
+    concurrency: int,
+) -> BulkResults[_I]:
+    """Await `operation(item)` for every item, at most `concurrency` at once,
+    and collect each outcome; an exception fails only its own item.
+
+    Parameters
+    ----------
+    items : Iterable
+        Inputs to the operation.
+    operation : Callable
+        Coroutine function run once per item.
+    concurrency : int
+        Maximum number of operations in flight; values below 1 count as 1.
+
+    Returns
+    -------
+    BulkResults
+        One `ItemResult` per item, in input order.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run(item: _I) -> ItemResult[_I]:
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                value = await operation(item)
+            except Exception as e:
+                return ItemResult(item, None, e, time.monotonic() - start)
+            return ItemResult(item, value, None, time.monotonic() - start)
+
+    return BulkResults(await asyncio.gather(*(run(item) for item in items)))
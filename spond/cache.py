@@ -0,0 +1,220 @@
+"""In-memory cache of API responses, keyed by endpoint and parameters.
+
+Pass a `ResponseCache` to `spond.spond.Spond` as `response_cache` and the
+`get_events`, `fetch_event`, `get_posts`, `get_groups`, `get_messages` and
+`get_profile` calls are answered from it while a response for the same
+parameters is fresh. Each endpoint has its own time-to-live, and once
+`max_entries` responses are cached the least recently used one is evicted.
+
+```python
+from spond.cache import ResponseCache
+from spond.spond import Spond
+
+cache = ResponseCache(ttls={"events": 30, "groups": 600})
+s = Spond(username="...", password="...", response_cache=cache)
+await s.get_events(group_id=a)  # fetched
+await s.get_events(group_id=b)  # fetched
+await s.get_events(group_id=a)  # cached
+cache.invalidate("events")      # next get_events() call fetches again
+```
+
+The client invalidates affected endpoints itself after its own writes
+(`update_event`, `change_response`, `send_message`). Cached objects are shared
+between callers, so treat them as read-only.
+
+If the server sent an `ETag` or `Last-Modified` validator with a response, the
+entry is kept after its TTL runs out and the next request for it is made
+conditional (`If-None-Match` / `If-Modified-Since`). A `304 Not Modified`
+answer then renews the cached response instead of downloading it again;
+`TransferMetrics` counts how often that happened and the bytes it saved.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+DEFAULT_TTLS: Mapping[str, float] = {
+    "events": 60.0,
+    "event": 60.0,
+    "posts": 60.0,
+    "groups": 300.0,
+    "messages": 30.0,
+    "profile": 300.0,
+}
+"""Default seconds a response stays fresh, by endpoint."""
+
+
+class CachedResponse(NamedTuple):
+    """A cached response and what's needed to revalidate it."""
+
+    expires_at: float
+    """`time.monotonic()` value after which the response is stale."""
+    value: Any
+    """The decoded response body."""
+    validators: Mapping[str, str]
+    """Conditional-request headers to revalidate with, e.g.
+    `{"If-None-Match": '"abc"'}`; empty if the server sent no validators."""
+    size: int
+    """Size of the response body on the wire, in bytes; 0 if unknown."""
+
+
+@dataclass
+class TransferMetrics:
+    """Running totals of conditional-request savings."""
+
+    not_modified: int = 0
+    """Responses renewed by a `304 Not Modified` answer."""
+    bytes_saved: int = 0
+    """Body bytes those 304 answers avoided downloading."""
+
+
+class ResponseCache:
+    """LRU cache of decoded responses with a per-endpoint TTL."""
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        ttls: Mapping[str, float] | None = None,
+        default_ttl: float = 60.0,
+    ) -> None:
+        """Create an empty cache.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Maximum number of responses kept, across all endpoints. Defaults
+            to 128.
+        ttls : Mapping[str, float], optional
+            Seconds a response stays fresh, by endpoint name (`"events"`,
+            `"event"`, `"posts"`, `"groups"`, `"messages"`, `"profile"`). Merged over
+            `DEFAULT_TTLS`; 0 disables caching for an endpoint.
+        default_ttl : float, optional
+            TTL for endpoints not named in either mapping. Defaults to 60.
+        """
+        self.max_entries = max_entries
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[tuple[str, Hashable], CachedResponse] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, endpoint: str, key: Hashable) -> tuple[bool, Any]:
+        """Look up a fresh response.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint name, e.g. `"events"`.
+        key : Hashable
+            Identifies the request parameters.
+
+        Returns
+        -------
+        tuple[bool, Any]
+            `(True, value)` on a hit, `(False, None)` if there is no fresh
+            entry. (A cached value may itself be `None`.)
+        """
+        entry = self._entries.get((endpoint, key))
+        if entry is None:
+            return False, None
+        if entry.expires_at <= time.monotonic():
+            if not entry.validators:
+                del self._entries[(endpoint, key)]
+            return False, None
+        self._entries.move_to_end((endpoint, key))
+        return True, entry.value
+
+    def get_stale(self, endpoint: str, key: Hashable) -> CachedResponse | None:
+        """Return the entry for `key` even if it has expired, provided it can
+        be revalidated; `None` otherwise.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint name, e.g. `"events"`.
+        key : Hashable
+            Identifies the request parameters.
+
+        Returns
+        -------
+        CachedResponse or None
+            The entry, whose `validators` are non-empty.
+        """
+        entry = self._entries.get((endpoint, key))
+        if entry is None or not entry.validators:
+            return None
+        return entry
+
+    def put(
+        self,
+        endpoint: str,
+        key: Hashable,
+        value: Any,
+        validators: Mapping[str, str] | None = None,
+        size: int = 0,
+    ) -> None:
+        """Store `value` as the response for `key`, evicting the least
+        recently used entries if the cache is full.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint name, e.g. `"events"`.
+        key : Hashable
+            Identifies the request parameters.
+        value : Any
+            The decoded response.
+        validators : Mapping[str, str], optional
+            Conditional-request headers to revalidate the response with once
+            it expires.
+        size : int, optional
+            Size of the response body on the wire, in bytes, if known.
+        """
+        ttl = self.ttls.get(endpoint, self.default_ttl)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        self._entries[(endpoint, key)] = CachedResponse(
+            time.monotonic() + ttl, value, dict(validators or {}), size
+        )
+        self._entries.move_to_end((endpoint, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        """Drop cached responses.
+
+        Parameters
+        ----------
+        endpoint : str, optional
+            Only drop responses for this endpoint. Drops everything if
+            omitted.
+        """
+        if endpoint is None:
+            self._entries.clear()
+            return
+        for cached in [k for k in self._entries if k[0] == endpoint]:
+            del self._entries[cached]
+
+    def values(self, endpoint: str) -> Iterator[Any]:
+        """Iterate over the fresh responses cached for `endpoint`, most
+        recently used first.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint name, e.g. `"events"`.
+
+        Yields
+        ------
+        Any
+            Cached decoded responses.
+        """
+        now = time.monotonic()
+        for (cached_endpoint, _), entry in reversed(list(self._entries.items())):
+            if cached_endpoint == endpoint and entry.expires_at > now:
+                yield entry.value
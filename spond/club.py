@@ -8,12 +8,23 @@ class for this API and `spond.spond.Spond` for everything else.
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import aclosing
 from typing import TYPE_CHECKING, ClassVar
 
 from .base import _SpondBase
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    import aiohttp
+
     from . import JSONDict
+    from .base import ConnectionOptions, DecodeOptions
+    from .mirror import SQLiteMirror
+    from .rate_limit import TokenBucket
+    from .retry import RetryPolicy
+    from .token_store import TokenStore
 
 
 class SpondClub(_SpondBase):
@@ -36,15 +47,27 @@ class SpondClub(_SpondBase):
         txs = await sc.get_transactions(club_id="ABCD1234...", max_items=50)
         for t in txs:
             print(t["paidAt"], t["paymentName"], t["paidByName"])
-        await sc.clientsession.close()
+        await sc.close()
 
     asyncio.run(main())
     ```
     """
 
     _API_BASE_URL: ClassVar = "https://api.spond.com/club/v1/"
+    _TRANSACTIONS_PAGE_SIZE: ClassVar = 25
 
-    def __init__(self, username: str, password: str) -> None:
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        session: aiohttp.ClientSession | None = None,
+        connection_options: ConnectionOptions | None = None,
+        token_store: TokenStore | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: TokenBucket | None = None,
+        mirror: SQLiteMirror | None = None,
+        decode_options: DecodeOptions | None = None,
+    ) -> None:
         """Construct a Spond Club client.
 
         Parameters
@@ -55,27 +78,60 @@ class SpondClub(_SpondBase):
             for the API calls to return data.
         password : str
             Spond account password.
+        session : aiohttp.ClientSession, optional
+            Existing session to share, e.g. with a `spond.spond.Spond` client for the
+            same account. The client won't close a session it didn't open.
+        connection_options : spond.base.ConnectionOptions, optional
+            Connection-pool limits, keep-alive and DNS-cache settings for the
+            session the client opens when `session` is not given.
+        token_store : spond.token_store.TokenStore, optional
+            Token store to consult before logging in and to save new tokens
+            to, so other processes can reuse them.
+        retry_policy : spond.retry.RetryPolicy, optional
+            Backoff and retry rules for transient failures (429, 5xx,
+            connection errors). Defaults to `RetryPolicy()`.
+        rate_limiter : spond.rate_limit.TokenBucket, optional
+            Limits requests to the club API; may be shared with other
+            clients. Unlimited if omitted.
+        mirror : spond.mirror.SQLiteMirror, optional
+            Local database that fetched transactions are written through to.
+            Nothing is mirrored if omitted.
+        decode_options : spond.base.DecodeOptions, optional
+            JSON decoder for responses, and the body size above which it
+            runs in a worker thread. Defaults to `DecodeOptions()`.
         """
-        super().__init__(username, password, self._API_BASE_URL)
-        self.transactions: list[JSONDict] | None = None
+        super().__init__(
+            username,
+            password,
+            self._API_BASE_URL,
+            session,
+            connection_options,
+            token_store,
+            retry_policy,
+            rate_limiter,
+            mirror=mirror,
+            decode_options=decode_options,
+        )
+        self.transactions: dict[str, list[JSONDict]] = {}
 
     @_SpondBase.require_authentication
     async def get_transactions(
-        self, club_id: str, skip: int | None = None, max_items: int = 100
+        self,
+        club_id: str,
+        skip: int | None = None,
+        max_items: int = 100,
+        concurrency: int = 1,
     ) -> list[JSONDict]:
         """Retrieve transactions/payments for a Spond Club.
 
         Spond's transactions endpoint returns at most 25 records per request,
-        so this method paginates internally (via recursion on `skip`) until
-        either `max_items` is reached or the server returns an empty page.
+        so this method pages through `iter_transactions()` until either
+        `max_items` transactions are collected or the server returns an empty
+        page.
 
-        **Caching caveat**: results accumulate on `self.transactions` and
-        the cache is **not** keyed by `club_id` — calling this method again
-        with a different `club_id` on the same instance will append that
-        club's transactions to the same list, mixing the two. If you query
-        multiple clubs from one client, reset the cache between calls
-        (`sc.transactions = None`) or use a fresh `SpondClub` instance per
-        club.
+        The result is cached on `self.transactions[club_id]`, replacing
+        whatever an earlier call cached for that club, so several clubs can
+        be queried from one client without their transactions mixing.
 
         Each transaction dict typically includes at least `id`, `paidAt`,
         `paymentName`, and `paidByName`. See `examples/transactions.py` for
@@ -88,39 +144,116 @@ class SpondClub(_SpondBase):
             `groupId` used elsewhere in the Spond API — find it in the URL
             of the Spond Club web UI.
         skip : int, optional
-            Pagination cursor (number of records to skip). Normally left as
-            `None`; the method increments it itself on recursive calls. Only
-            override if you know what you're doing.
+            Number of records to skip before the first one returned. Normally
+            left as `None` to start from the most recent transaction.
         max_items : int, optional
-            Stop fetching once at least this many transactions are
-            accumulated. Defaults to 100. The final list may be slightly
-            longer than `max_items` since the server returns pages of 25.
+            Stop fetching once this many transactions are collected. Defaults
+            to 100.
+        concurrency : int, optional
+            Number of pages to request at once. Defaults to 1 (one page after
+            another). See `iter_transactions()`.
 
         Returns
         -------
         list[JSONDict]
-            All transactions accumulated so far (across recursive page
-            fetches). Empty list if the club has no transactions.
+            Up to `max_items` transactions. Empty list if the club has no
+            transactions.
+        """
+        transactions: list[JSONDict] = []
+        if max_items > 0:
+            async with aclosing(
+                self.iter_transactions(
+                    club_id=club_id, skip=skip or 0, concurrency=concurrency
+                )
+            ) as pages:
+                async for transaction in pages:
+                    transactions.append(transaction)
+                    if len(transactions) >= max_items:
+                        break
+        self.transactions[club_id] = transactions
+        return transactions
+
+    @_SpondBase.require_authentication
+    async def iter_transactions(
+        self, club_id: str, skip: int = 0, concurrency: int = 1
+    ) -> AsyncIterator[JSONDict]:
+        """Iterate over all transactions/payments for a Spond Club.
+
+        Pages of up to 25 records are requested one after another, and each
+        page's transactions are yielded as soon as it arrives, so callers can
+        process (or stop) long before the last page is fetched. Nothing is
+        cached on `self.transactions`.
+
+        With `concurrency` above 1, that many consecutive pages are requested
+        at once (the endpoint is offset-based, so their `skip` offsets are
+        known up front). Pages are still yielded in server order, and
+        iteration stops at the first empty page of a batch; pages after it
+        are discarded. This trades up to `concurrency - 1` wasted requests at
+        the end for far fewer serial round trips on large clubs.
+
+        ```python
+        async for t in sc.iter_transactions(club_id="ABCD1234..."):
+            print(t["paidAt"], t["paymentName"])
+        ```
+
+        Parameters
+        ----------
+        club_id : str
+            Identifier for the club (see `get_transactions()`).
+        skip : int, optional
+            Number of records to skip before the first one yielded. Defaults
+            to 0.
+        concurrency : int, optional
+            Maximum number of page requests in flight at once. Defaults to 1.
+
+        Yields
+        ------
+        JSONDict
+            Transactions in the order the server returns them. Iteration
+            ends at the first empty page or unsuccessful response.
         """
-        if self.transactions is None:
-            self.transactions = []
+        page_size = self._TRANSACTIONS_PAGE_SIZE
+        while True:
+            offsets = [skip + i * page_size for i in range(max(concurrency, 1))]
+            pages = await asyncio.gather(
+                *(self._fetch_transactions(club_id, offset) for offset in offsets)
+            )
+            for i, (offset, page) in enumerate(zip(offsets, pages, strict=True)):
+                if not page:
+                    return
+                await self._save_to_mirror("save_transactions", club_id, page)
+                for transaction in page:
+                    yield transaction
+                skip = offset + len(page)
+                if len(page) < page_size:
+                    later = pages[i + 1 :]
+                    if later and not any(later):
+                        return
+                    # Later offsets in this batch assumed a full page here;
+                    # resume from where the short page actually ended.
+                    break
+
+    async def _fetch_transactions(self, club_id: str, skip: int) -> list[JSONDict]:
+        """GET one page of transactions starting at offset `skip`.
+
+        Parameters
+        ----------
+        club_id : str
+            Identifier for the club.
+        skip : int
+            Number of records to skip.
 
+        Returns
+        -------
+        list[JSONDict]
+            The page's transactions; empty if there are none left or the
+            request was unsuccessful.
+        """
         url = f"{self.api_url}transactions"
-        params = None if skip is None else {"skip": skip}
-        headers = {**self.auth_headers, "X-Spond-Clubid": club_id}
-
-        async with self.clientsession.get(url, headers=headers, params=params) as r:
-            if r.status == 200:
-                t = await r.json()
-                if len(t) == 0:
-                    return self.transactions
-
-                self.transactions.extend(t)
-                if len(self.transactions) < max_items:
-                    return await self.get_transactions(
-                        club_id=club_id,
-                        skip=len(t) if skip is None else skip + len(t),
-                        max_items=max_items,
-                    )
-
-        return self.transactions
+        params = {"skip": skip} if skip else None
+        headers = {"X-Spond-Clubid": club_id}
+
+        async with self._request("get", url, headers=headers, params=params) as r:
+            if r.status != 200:
+                return []
+            return await self._read_json(r)
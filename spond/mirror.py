@@ -0,0 +1,453 @@
+"""Local SQLite mirror of Spond data.
+
+Pass a `SQLiteMirror` as `mirror` to `spond.spond.Spond` or
+`spond.club.SpondClub` and every group, event, post and transaction the
+client fetches is also written to a SQLite database, along with members,
+guardians and event responses. Reports can then query the mirror instead of
+the API:
+
+```python
+from spond.mirror import SQLiteMirror
+from spond.spond import Spond
+
+mirror = SQLiteMirror("~/.cache/spond/mirror.db")
+s = Spond(username="...", password="...", mirror=mirror)
+await s.get_groups()
+await s.get_events(group_id=gid, min_start=season_start, max_events=1000)
+...
+for event in mirror.events(group_id=gid, min_start=season_start):
+    statuses = mirror.responses(event["id"])
+```
+
+The database uses write-ahead logging, so other processes can read it while
+a client writes. Rows are only ever inserted or replaced, never deleted: an
+event removed from Spond stays in the mirror until `clear()` is called.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable
+
+    from . import JSONDict
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS groups (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS members (
+    group_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    profile_id TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (group_id, id)
+);
+CREATE INDEX IF NOT EXISTS members_id ON members (id);
+CREATE INDEX IF NOT EXISTS members_profile_id ON members (profile_id);
+CREATE TABLE IF NOT EXISTS guardians (
+    group_id TEXT NOT NULL,
+    member_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    profile_id TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (group_id, member_id, id)
+);
+CREATE INDEX IF NOT EXISTS guardians_member_id ON guardians (member_id);
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT PRIMARY KEY,
+    group_id TEXT,
+    start_timestamp TEXT,
+    cancelled INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_start ON events (start_timestamp);
+CREATE INDEX IF NOT EXISTS events_group_start ON events (group_id, start_timestamp);
+CREATE TABLE IF NOT EXISTS responses (
+    event_id TEXT NOT NULL,
+    member_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    PRIMARY KEY (event_id, member_id)
+);
+CREATE INDEX IF NOT EXISTS responses_member_id ON responses (member_id);
+CREATE TABLE IF NOT EXISTS posts (
+    id TEXT PRIMARY KEY,
+    group_id TEXT,
+    timestamp TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS posts_group_timestamp ON posts (group_id, timestamp);
+CREATE TABLE IF NOT EXISTS transactions (
+    club_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    paid_at TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (club_id, id)
+);
+CREATE INDEX IF NOT EXISTS transactions_paid_at ON transactions (club_id, paid_at);
+"""
+
+_TABLES = (
+    "groups",
+    "members",
+    "guardians",
+    "events",
+    "responses",
+    "posts",
+    "transactions",
+)
+
+
+class SQLiteMirror:
+    """SQLite database that clients write fetched data through to.
+
+    Methods are synchronous; clients call the `save_*` methods in a worker
+    thread. One instance may be shared by several clients and threads.
+    Query methods return the objects as the API returned them.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Open (or create) the mirror database at `path`.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Location of the database file, or `":memory:"` for a private
+            in-memory database. Missing parent directories are created.
+        """
+        if str(path) != ":memory:":
+            path = Path(path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> SQLiteMirror:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def clear(self) -> None:
+        """Delete everything from the mirror."""
+        with self._lock, self._conn:
+            for table in _TABLES:
+                self._conn.execute(f"DELETE FROM {table}")
+
+    def save_groups(self, groups: Iterable[JSONDict]) -> None:
+        """Insert or replace groups, replacing their members and guardians.
+
+        Parameters
+        ----------
+        groups : Iterable[JSONDict]
+            Groups as returned by `Spond.get_groups()`.
+        """
+        with self._lock, self._conn:
+            for group in groups:
+                gid = group["id"]
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO groups VALUES (?, ?, ?)",
+                    (gid, group.get("name"), json.dumps(group)),
+                )
+                self._conn.execute("DELETE FROM members WHERE group_id = ?", (gid,))
+                self._conn.execute("DELETE FROM guardians WHERE group_id = ?", (gid,))
+                for member in group.get("members", []):
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO members VALUES (?, ?, ?, ?)",
+                        (gid, member["id"], _profile_id(member), json.dumps(member)),
+                    )
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO guardians VALUES (?, ?, ?, ?, ?)",
+                        (
+                            (
+                                gid,
+                                member["id"],
+                                guardian["id"],
+                                _profile_id(guardian),
+                                json.dumps(guardian),
+                            )
+                            for guardian in member.get("guardians", [])
+                        ),
+                    )
+
+    def save_events(self, events: Iterable[JSONDict]) -> None:
+        """Insert or replace events and their responses.
+
+        Parameters
+        ----------
+        events : Iterable[JSONDict]
+            Events as returned by `Spond.get_events()`.
+        """
+        with self._lock, self._conn:
+            for event in events:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?)",
+                    (
+                        event["id"],
+                        event.get("recipients", {}).get("group", {}).get("id"),
+                        event.get("startTimestamp"),
+                        bool(event.get("cancelled")),
+                        json.dumps(event),
+                    ),
+                )
+                if "responses" in event:
+                    self._replace_responses(event["id"], event["responses"])
+
+    def save_responses(self, event_id: str, responses: JSONDict) -> None:
+        """Replace the responses recorded for one event.
+
+        Parameters
+        ----------
+        event_id : str
+            UID of the event.
+        responses : JSONDict
+            The event's `responses` object, as returned by
+            `Spond.change_response()`.
+        """
+        with self._lock, self._conn:
+            self._replace_responses(event_id, responses)
+            row = self._conn.execute(
+                "SELECT data FROM events WHERE id = ?", (event_id,)
+            ).fetchone()
+            if row is not None:
+                event = json.loads(row[0])
+                event["responses"] = responses
+                self._conn.execute(
+                    "UPDATE events SET data = ? WHERE id = ?",
+                    (json.dumps(event), event_id),
+                )
+
+    def save_posts(self, posts: Iterable[JSONDict]) -> None:
+        """Insert or replace posts.
+
+        Parameters
+        ----------
+        posts : Iterable[JSONDict]
+            Posts as returned by `Spond.get_posts()`.
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO posts VALUES (?, ?, ?, ?)",
+                (
+                    (p["id"], p.get("groupId"), p.get("timestamp"), json.dumps(p))
+                    for p in posts
+                ),
+            )
+
+    def save_transactions(self, club_id: str, transactions: Iterable[JSONDict]) -> None:
+        """Insert or replace a club's transactions.
+
+        Parameters
+        ----------
+        club_id : str
+            Identifier for the club.
+        transactions : Iterable[JSONDict]
+            Transactions as returned by `SpondClub.get_transactions()`.
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO transactions VALUES (?, ?, ?, ?)",
+                (
+                    (club_id, t["id"], t.get("paidAt"), json.dumps(t))
+                    for t in transactions
+                ),
+            )
+
+    def groups(self) -> list[JSONDict]:
+        """Return every mirrored group, ordered by name."""
+        return self._select("SELECT data FROM groups ORDER BY name")
+
+    def group(self, uid: str) -> JSONDict:
+        """Return the mirrored group with id `uid`.
+
+        Raises
+        ------
+        KeyError
+            No group with that id has been mirrored.
+        """
+        return self._select_one("group", "SELECT data FROM groups WHERE id = ?", uid)
+
+    def members(self, group_id: str | None = None) -> list[JSONDict]:
+        """Return mirrored members, of one group or of all groups.
+
+        Parameters
+        ----------
+        group_id : str, optional
+            Only return members of this group.
+        """
+        if group_id is None:
+            return self._select("SELECT data FROM members")
+        return self._select("SELECT data FROM members WHERE group_id = ?", group_id)
+
+    def member(self, uid: str) -> JSONDict:
+        """Return the mirrored member with id `uid`.
+
+        Raises
+        ------
+        KeyError
+            No member with that id has been mirrored.
+        """
+        return self._select_one("member", "SELECT data FROM members WHERE id = ?", uid)
+
+    def guardians(self, member_id: str) -> list[JSONDict]:
+        """Return the mirrored guardians of the member with id `member_id`."""
+        return self._select("SELECT data FROM guardians WHERE member_id = ?", member_id)
+
+    def events(
+        self,
+        group_id: str | None = None,
+        min_start: datetime | None = None,
+        max_start: datetime | None = None,
+        include_cancelled: bool = True,
+    ) -> list[JSONDict]:
+        """Return mirrored events in ascending start order.
+
+        Parameters
+        ----------
+        group_id : str, optional
+            Only return events of this group.
+        min_start, max_start : datetime, optional
+            Only return events starting at or after / at or before this
+            time. Naive datetimes are taken to be UTC.
+        include_cancelled : bool, optional
+            Include cancelled events. Defaults to True.
+        """
+        clauses, args = [], []
+        if group_id is not None:
+            clauses.append("group_id = ?")
+            args.append(group_id)
+        if min_start is not None:
+            clauses.append("start_timestamp >= ?")
+            args.append(_timestamp(min_start))
+        if max_start is not None:
+            clauses.append("start_timestamp <= ?")
+            args.append(_timestamp(max_start))
+        if not include_cancelled:
+            clauses.append("NOT cancelled")
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._select(
+            f"SELECT data FROM events{where} ORDER BY start_timestamp", *args
+        )
+
+    def event(self, uid: str) -> JSONDict:
+        """Return the mirrored event with id `uid`.
+
+        Raises
+        ------
+        KeyError
+            No event with that id has been mirrored.
+        """
+        return self._select_one("event", "SELECT data FROM events WHERE id = ?", uid)
+
+    def responses(self, event_id: str) -> dict[str, str]:
+        """Return each member's response to an event.
+
+        Returns
+        -------
+        dict[str, str]
+            Member id to status: `"accepted"`, `"declined"`, `"unanswered"`,
+            `"waitinglist"` or `"unconfirmed"` (the `responses` lists of the
+            event, without the `Ids` suffix).
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT member_id, status FROM responses WHERE event_id = ?",
+                (event_id,),
+            ).fetchall()
+        return dict(rows)
+
+    def member_responses(self, member_id: str) -> dict[str, str]:
+        """Return a member's response to each mirrored event they were
+        invited to.
+
+        Returns
+        -------
+        dict[str, str]
+            Event id to status, as for `responses()`.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT event_id, status FROM responses WHERE member_id = ?",
+                (member_id,),
+            ).fetchall()
+        return dict(rows)
+
+    def posts(self, group_id: str | None = None) -> list[JSONDict]:
+        """Return mirrored posts, newest first.
+
+        Parameters
+        ----------
+        group_id : str, optional
+            Only return posts on this group's wall.
+        """
+        if group_id is None:
+            return self._select("SELECT data FROM posts ORDER BY timestamp DESC")
+        return self._select(
+            "SELECT data FROM posts WHERE group_id = ? ORDER BY timestamp DESC",
+            group_id,
+        )
+
+    def transactions(self, club_id: str) -> list[JSONDict]:
+        """Return a club's mirrored transactions, most recently paid first."""
+        return self._select(
+            "SELECT data FROM transactions WHERE club_id = ? ORDER BY paid_at DESC",
+            club_id,
+        )
+
+    def _replace_responses(self, event_id: str, responses: JSONDict) -> None:
+        """Replace the `responses` rows of one event; caller holds the lock
+        and the transaction."""
+        self._conn.execute("DELETE FROM responses WHERE event_id = ?", (event_id,))
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+            (
+                (event_id, member_id, key.removesuffix("Ids"))
+                for key, member_ids in responses.items()
+                if key.endswith("Ids") and isinstance(member_ids, list)
+                for member_id in member_ids
+            ),
+        )
+
+    def _select(self, sql: str, *args: Any) -> list[JSONDict]:
+        """Run a query selecting one `data` column and decode each row."""
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def _select_one(self, kind: str, sql: str, uid: str) -> JSONDict:
+        """Like `_select` for a lookup by id, raising `KeyError` on no match."""
+        rows = self._select(sql, uid)
+        if not rows:
+            errmsg = f"No {kind} with id='{uid}' in the mirror."
+            raise KeyError(errmsg)
+        return rows[0]
+
+
+def _profile_id(person: JSONDict) -> str | None:
+    """Return the id of the account profile linked to a member or guardian."""
+    profile = person.get("profile")
+    return profile.get("id") if isinstance(profile, dict) else None
+
+
+def _timestamp(dt: datetime) -> str:
+    """Format `dt` like the API's `startTimestamp` values, for comparison."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(UTC)
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
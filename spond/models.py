@@ -0,0 +1,359 @@
+"""Compact typed views of API objects.
+
+The clients return plain `JSONDict`s. For large accounts, wrap them in these
+models instead: fields live in `__slots__` rather than a dict per object,
+timestamps are parsed into `datetime`s when first read, and `raw` rebuilds
+the original dict whenever it's needed.
+
+```python
+from spond.models import Event, Group
+
+groups = [Group(g) for g in await s.get_groups()]
+s.groups = None  # let the raw dicts go
+for member in groups[0].members:
+    print(member.full_name, member.profile_id)
+
+events = [Event(e) for e in await s.get_events()]
+upcoming = sorted(events, key=lambda e: e.start)
+```
+
+Each model has attributes for the fields listed in its docstring (`None`
+where the API left a field out); any other keys are kept aside and restored
+by `raw`. Models are read-only views: change the raw dict and wrap it again
+rather than assigning attributes.
+
+Nested lists of objects, such as a group's `members`, are wrapped when the
+parent is, not when first accessed: wrapping lazily would mean keeping the
+raw dicts alive alongside the models, which is exactly the memory these
+models are meant to save. Only timestamps are parsed on access.
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from . import JSONDict
+
+
+@functools.lru_cache(maxsize=4096)
+def _shared(value: tuple) -> tuple:
+    """Return one shared copy of `value`, for tuples many objects repeat:
+    sets of absent keys, and small lists such as `subGroups` ids. Bounded, so
+    a long-running process doesn't keep every tuple it ever saw."""
+    return value
+
+
+def _is_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, str | int | float)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an API timestamp such as `"2026-01-01T10:00:00Z"`. Cached, since
+    many objects share a timestamp and `datetime`s are immutable."""
+    return datetime.fromisoformat(value)
+
+
+class _Timestamp:
+    """Read-only attribute exposing a raw timestamp slot as a `datetime`."""
+
+    def __init__(self, slot: str) -> None:
+        self.slot = slot
+
+    def __get__(self, instance: _Model | None, owner: type) -> Any:
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot)
+        return _parse_timestamp(value) if isinstance(value, str) else None
+
+
+class _Model:
+    """Base for the models: maps JSON keys to slots, and back via `raw`."""
+
+    __slots__ = ("_absent", "_extra")
+
+    _FIELDS: ClassVar[dict[str, str]] = {}
+    """JSON key to the slot holding its value."""
+    _LISTS: ClassVar[dict[str, type[_Model]]] = {}
+    """Keys holding lists of objects, to the model wrapping each one."""
+    _TUPLES: ClassVar[frozenset[str]] = frozenset()
+    """Keys holding lists of plain values, kept as shared tuples (lists that
+    hold anything but scalars are kept as they are)."""
+    _REFS: ClassVar[frozenset[str]] = frozenset()
+    """Keys holding a `{"id": ...}` reference, kept as just the id."""
+    _NAMES: ClassVar[frozenset[str]] = frozenset()
+    """Keys holding strings that often repeat, such as names; interned."""
+
+    def __init__(self, data: JSONDict) -> None:
+        """Wrap `data`, an object as returned by the API.
+
+        Parameters
+        ----------
+        data : JSONDict
+            The raw object. It is not kept, so it may be dropped afterwards.
+        """
+        extra = None
+        for key, value in data.items():
+            slot = self._FIELDS.get(key)
+            if slot is None:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+                continue
+            if key in self._LISTS and isinstance(value, list):
+                value = [self._LISTS[key](item) for item in value]
+            elif (
+                key in self._TUPLES
+                and isinstance(value, list)
+                and all(_is_scalar(v) for v in value)
+            ):
+                value = _shared(tuple(value))
+            elif (
+                key in self._REFS and isinstance(value, dict) and value.keys() == {"id"}
+            ):
+                value = value["id"]
+            elif key in self._NAMES and isinstance(value, str):
+                value = sys.intern(value)
+            object.__setattr__(self, slot, value)
+        absent = tuple(key for key in self._FIELDS if key not in data)
+        for key in absent:
+            object.__setattr__(self, self._FIELDS[key], None)
+        self._absent = _shared(absent)
+        self._extra = extra
+
+    @classmethod
+    def from_list(cls, items: Iterable[JSONDict] | None) -> list[Self]:
+        """Wrap every object in `items`; an empty list for `None`, as the
+        clients return when there is nothing to list."""
+        return [cls(item) for item in items or ()]
+
+    @property
+    def raw(self) -> JSONDict:
+        """The object as returned by the API, rebuilt as a new dict."""
+        data = {}
+        for key, slot in self._FIELDS.items():
+            if key in self._absent:
+                continue
+            value = getattr(self, slot)
+            if key in self._LISTS and isinstance(value, list):
+                value = [item.raw for item in value]
+            elif key in self._TUPLES and isinstance(value, tuple):
+                value = list(value)
+            elif key in self._REFS and isinstance(value, str):
+                value = {"id": value}
+            data[key] = value
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in ("_absent", "_extra"):
+            object.__setattr__(self, name, value)
+            return
+        errmsg = f"{type(self).__name__} is read-only; modify `raw` and re-wrap."
+        raise AttributeError(errmsg)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.raw == other.raw
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={getattr(self, 'id', None)!r})"
+
+
+class Guardian(_Model):
+    """A guardian of a member: `id`, `first_name`, `last_name`, `email`,
+    `phone_number`, `profile`."""
+
+    __slots__ = ("id", "first_name", "last_name", "email", "phone_number", "_profile")
+    _FIELDS: ClassVar = {
+        "id": "id",
+        "firstName": "first_name",
+        "lastName": "last_name",
+        "email": "email",
+        "phoneNumber": "phone_number",
+        "profile": "_profile",
+    }
+    _REFS: ClassVar = frozenset({"profile"})
+    _NAMES: ClassVar = frozenset({"firstName", "lastName"})
+
+    @property
+    def profile(self) -> JSONDict | None:
+        """The linked account profile, e.g. `{"id": ...}`; `None` without
+        one."""
+        if isinstance(self._profile, str):
+            return {"id": self._profile}
+        return self._profile
+
+    @property
+    def full_name(self) -> str:
+        """First and last name joined by a space, as `get_person` matches."""
+        return f"{self.first_name} {self.last_name}"
+
+    @property
+    def profile_id(self) -> str | None:
+        """Id of the linked account profile; `None` without one."""
+        if isinstance(self._profile, dict):
+            return self._profile.get("id")
+        return self._profile
+
+
+class Member(Guardian):
+    """A group member: the `Guardian` fields plus `guardians` (a list of
+    `Guardian`), `subgroups` (a tuple of subgroup ids) and `roles` (a tuple
+    of role ids; left a list if it holds objects)."""
+
+    __slots__ = ("guardians", "subgroups", "roles")
+    _FIELDS: ClassVar = {
+        **Guardian._FIELDS,
+        "guardians": "guardians",
+        "subGroups": "subgroups",
+        "roles": "roles",
+    }
+    _LISTS: ClassVar = {"guardians": Guardian}
+    _TUPLES: ClassVar = frozenset({"subGroups", "roles"})
+
+
+class Group(_Model):
+    """A group: `id`, `name`, `activity`, `members` (a list of `Member`),
+    `subgroups` and `roles`."""
+
+    __slots__ = ("id", "name", "activity", "members", "subgroups", "roles")
+    _FIELDS: ClassVar = {
+        "id": "id",
+        "name": "name",
+        "activity": "activity",
+        "members": "members",
+        "subGroups": "subgroups",
+        "roles": "roles",
+    }
+    _LISTS: ClassVar = {"members": Member}
+
+    def member(self, uid: str) -> Member:
+        """Return the member with id `uid`.
+
+        Raises
+        ------
+        KeyError
+            No member of this group has that id.
+        """
+        for member in self.members or ():
+            if member.id == uid:
+                return member
+        errmsg = f"No member with id='{uid}' in group '{self.id}'."
+        raise KeyError(errmsg)
+
+
+class Event(_Model):
+    """An event: `id`, `heading`, `description`, `type`, `start`, `end`,
+    `meetup` (`datetime`s), `cancelled`, `updated`, `location`,
+    `responses`, `recipients` and `owners`."""
+
+    __slots__ = (
+        "id",
+        "heading",
+        "description",
+        "type",
+        "_start",
+        "_end",
+        "_meetup",
+        "cancelled",
+        "updated",
+        "location",
+        "responses",
+        "recipients",
+        "owners",
+    )
+    _FIELDS: ClassVar = {
+        "id": "id",
+        "heading": "heading",
+        "description": "description",
+        "type": "type",
+        "startTimestamp": "_start",
+        "endTimestamp": "_end",
+        "meetupTimestamp": "_meetup",
+        "cancelled": "cancelled",
+        "updated": "updated",
+        "location": "location",
+        "responses": "responses",
+        "recipients": "recipients",
+        "owners": "owners",
+    }
+
+    start = _Timestamp("_start")
+    """`startTimestamp` as a `datetime`."""
+    end = _Timestamp("_end")
+    """`endTimestamp` as a `datetime`."""
+    meetup = _Timestamp("_meetup")
+    """`meetupTimestamp` (when participants should arrive) as a `datetime`;
+    `None` for events without one."""
+
+    @property
+    def group_id(self) -> str | None:
+        """Id of the group the event was sent to."""
+        group = (self.recipients or {}).get("group")
+        return group.get("id") if isinstance(group, dict) else None
+
+
+class Post(_Model):
+    """A group-wall post: `id`, `group_id`, `title`, `body`, `timestamp`
+    (a `datetime`), `type` and `comments`."""
+
+    __slots__ = ("id", "group_id", "title", "body", "_timestamp", "type", "comments")
+    _FIELDS: ClassVar = {
+        "id": "id",
+        "groupId": "group_id",
+        "title": "title",
+        "body": "body",
+        "timestamp": "_timestamp",
+        "type": "type",
+        "comments": "comments",
+    }
+
+    timestamp = _Timestamp("_timestamp")
+    """When the post was made."""
+
+
+class Chat(_Model):
+    """A chat: `id`, `name`, `type`, `group_id`, `participants`, `message`
+    and `newest` (a `datetime`)."""
+
+    __slots__ = ("id", "name", "type", "group_id", "participants", "message", "_newest")
+    _FIELDS: ClassVar = {
+        "id": "id",
+        "name": "name",
+        "type": "type",
+        "groupId": "group_id",
+        "participants": "participants",
+        "message": "message",
+        "newestTimestamp": "_newest",
+    }
+
+    newest = _Timestamp("_newest")
+    """When the latest message was sent."""
+
+
+class Transaction(_Model):
+    """A Spond Club transaction: `id`, `paid_at` (a `datetime`),
+    `payment_name`, `paid_by_name` and `amount`."""
+
+    __slots__ = ("id", "_paid_at", "payment_name", "paid_by_name", "amount")
+    _FIELDS: ClassVar = {
+        "id": "id",
+        "paidAt": "_paid_at",
+        "paymentName": "payment_name",
+        "paidByName": "paid_by_name",
+        "amount": "amount",
+    }
+
+    paid_at = _Timestamp("_paid_at")
+    """When the payment was made."""
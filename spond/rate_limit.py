@@ -0,0 +1,70 @@
+"""Client-side rate limiting.
+
+A `TokenBucket` lets requests through at a sustained `rate` per second, with
+bursts of up to `burst` requests after idle periods. Pass one to a client as
+`rate_limiter` and every request the client sends to its API (including
+retries and logins) waits for a token first; `spond.spond.Spond` takes a
+separate `chat_rate_limiter` for the chat server. Coroutines share a bucket
+fairly, in the order they asked, and one bucket may be passed to several
+clients to put them under a common limit.
+
+```python
+from spond.club import SpondClub
+from spond.rate_limit import TokenBucket
+from spond.spond import Spond
+
+core = TokenBucket(rate=5, burst=10)
+s = Spond(username="...", password="...", rate_limiter=core)
+sc = SpondClub(username="...", password="...", rate_limiter=TokenBucket(rate=2))
+```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared by the coroutines of one event loop."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Create a bucket that starts full.
+
+        Parameters
+        ----------
+        rate : float
+            Tokens added per second, i.e. the sustained request rate.
+        burst : int, optional
+            Capacity of the bucket, i.e. how many requests may go out back to
+            back after an idle period. Defaults to 1.
+
+        Raises
+        ------
+        ValueError
+            `rate` is not positive or `burst` is less than 1.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("TokenBucket needs rate > 0 and burst >= 1.")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it.
+
+        Waiters are served in the order they called, so a steady stream of
+        new callers can't starve an earlier one.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
@@ -0,0 +1,109 @@
+"""Retrying requests that fail transiently.
+
+Every request a client sends through `_SpondBase._request` follows the
+client's `RetryPolicy`: rate-limit (429) and server-error (5xx) responses, and
+connection errors, are retried with exponential backoff and jitter, waiting
+at least as long as any `Retry-After` header asks. By default only
+idempotent methods are retried, so a POST that may have reached the server is
+never sent twice. Each client counts its retries in a `RetryMetrics`.
+
+```python
+from spond.retry import RetryPolicy
+from spond.spond import Spond
+
+s = Spond(username="...", password="...", retry_policy=RetryPolicy(max_retries=5))
+...
+print(s.retry_metrics)
+```
+"""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request.
+
+    Pass `RetryPolicy(max_retries=0)` to disable retries.
+    """
+
+    max_retries: int = 3
+    """Retries after the first attempt; 0 disables retrying."""
+    backoff_base: float = 0.5
+    """Seconds the first retry waits at most; doubled for each later retry."""
+    max_delay: float = 60.0
+    """Upper bound in seconds on any single wait, `Retry-After` included."""
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    """Response statuses that are retried."""
+    retry_methods: frozenset[str] = frozenset(
+        {"get", "head", "options", "put", "delete"}
+    )
+    """Lower-case HTTP methods that are retried; idempotent ones by default."""
+
+    def delay(self, retry: int, retry_after: str | None = None) -> float:
+        """Return how many seconds to wait before retry number `retry`.
+
+        Uses "full jitter": a random wait between 0 and
+        `backoff_base * 2**retry`, raised to `retry_after` if the server
+        asked for longer, then capped at `max_delay`.
+
+        Parameters
+        ----------
+        retry : int
+            Zero-based index of the upcoming retry.
+        retry_after : str, optional
+            Value of the response's `Retry-After` header, either a number of
+            seconds or an HTTP date.
+
+        Returns
+        -------
+        float
+            Seconds to wait.
+        """
+        backoff = random.uniform(0, self.backoff_base * 2**retry)
+        requested = self._parse_retry_after(retry_after)
+        return min(max(backoff, requested), self.max_delay)
+
+    @staticmethod
+    def _parse_retry_after(retry_after: str | None) -> float:
+        """Convert a `Retry-After` header value to seconds from now; 0 if
+        absent or unparseable."""
+        if not retry_after:
+            return 0.0
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return 0.0
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        return max((when - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+@dataclass
+class RetryMetrics:
+    """Running totals of the retries a client has made."""
+
+    retries: int = 0
+    """Requests re-sent after a retryable failure."""
+    exhausted: int = 0
+    """Requests that still failed after the last retry the policy allowed."""
+    delay: float = 0.0
+    """Total seconds spent waiting between attempts."""
+    reasons: Counter[int | str] = field(default_factory=Counter)
+    """Retries by cause: the response status, or the exception class name."""
+
+    def record_retry(self, reason: int | str, delay: float) -> None:
+        """Count one retry caused by `reason`, waiting `delay` seconds."""
+        self.retries += 1
+        self.delay += delay
+        self.reasons[reason] += 1
@@ -9,15 +9,29 @@ events, posts, and chats. For the separate Spond Club finance API, see
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar
+import copy
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from . import JSONDict
 from ._event_template import _EVENT_TEMPLATE
 from .base import _SpondBase
+from .bulk import _run_bounded
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable, Mapping
     from datetime import datetime
 
+    import aiohttp
+
+    from .base import ConnectionOptions, DecodeOptions
+    from .bulk import BulkResults
+    from .cache import ResponseCache
+    from .mirror import SQLiteMirror
+    from .rate_limit import TokenBucket
+    from .retry import RetryPolicy
+    from .token_store import TokenStore
+
 
 class Spond(_SpondBase):
     """Async client for the Spond consumer API.
@@ -26,6 +40,9 @@ class Spond(_SpondBase):
     `require_authentication` decorator inherited from `spond.base._SpondBase`);
     you do not need to call `login()` explicitly.
 
+    Concurrent calls to the same `get_*` method with the same arguments share
+    a single HTTP request and receive the same result object.
+
     Several `get_*` methods cache their last response on the instance
     (`self.groups`, `self.events`, `self.posts`, `self.messages`,
     `self.profile`). This lets lookup helpers like `get_group(uid)` and
@@ -33,15 +50,31 @@ class Spond(_SpondBase):
     refresh, set the relevant attribute to `None` and call the `get_*` method
     again, or call the underlying `get_*s()` method directly.
 
-    Remember to close the underlying aiohttp session when finished:
+    These attributes only hold the most recent response. To keep responses
+    for several parameter combinations, and answer repeat calls without a
+    request, pass a `spond.cache.ResponseCache` as `response_cache`.
+
+    Remember to close the underlying aiohttp session when finished, either
+    with `await s.close()` or by using the client as a context manager:
 
     ```python
-    s = Spond(username="...", password="...")
-    try:
+    async with Spond(username="...", password="...") as s:
         groups = await s.get_groups()
         ...
-    finally:
-        await s.clientsession.close()
+    ```
+
+    To reuse one connection pool across several clients (e.g. `Spond` and
+    `spond.club.SpondClub` for the same account), create the session once
+    and pass it to each; the clients then leave closing it to you:
+
+    ```python
+    from spond.base import ConnectionOptions
+
+    session = ConnectionOptions(limit_per_host=10).create_session()
+    s = Spond(username="...", password="...", session=session)
+    sc = SpondClub(username="...", password="...", session=session)
+    ...
+    await session.close()
     ```
 
     Example
@@ -55,7 +88,7 @@ class Spond(_SpondBase):
         groups = await s.get_groups() or []
         for g in groups:
             print(g["name"])
-        await s.clientsession.close()
+        await s.close()
 
     asyncio.run(main())
     ```
@@ -67,14 +100,27 @@ class Spond(_SpondBase):
     _EVENT: ClassVar = "event"
     _GROUP: ClassVar = "group"
 
-    def __init__(self, username: str, password: str) -> None:
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        session: aiohttp.ClientSession | None = None,
+        connection_options: ConnectionOptions | None = None,
+        token_store: TokenStore | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: TokenBucket | None = None,
+        chat_rate_limiter: TokenBucket | None = None,
+        response_cache: ResponseCache | None = None,
+        mirror: SQLiteMirror | None = None,
+        decode_options: DecodeOptions | None = None,
+    ) -> None:
         """Construct a Spond client.
 
         The credentials are stored on the instance and used to obtain an access
-        token on the first authenticated call. An aiohttp `ClientSession` is
-        opened immediately; close it via `await s.clientsession.close()`
-        (where `s` is the constructed instance) when finished, to avoid
-        `Unclosed client session` warnings.
+        token on the first authenticated call. Unless an existing `session`
+        is passed in, an aiohttp `ClientSession` is opened immediately; close
+        it via `await s.close()` (where `s` is the constructed instance) when
+        finished, to avoid `Unclosed client session` warnings.
 
         Parameters
         ----------
@@ -83,32 +129,131 @@ class Spond(_SpondBase):
         password : str
             Spond account password. For accounts with 2FA enabled, login will
             currently fail — Spond's TOTP flow is not yet supported.
+        session : aiohttp.ClientSession, optional
+            Existing session to share, e.g. with a `SpondClub` client for the
+            same account. The client won't close a session it didn't open.
+        connection_options : spond.base.ConnectionOptions, optional
+            Connection-pool limits, keep-alive and DNS-cache settings for the
+            session the client opens when `session` is not given.
+        token_store : spond.token_store.TokenStore, optional
+            Token store to consult before logging in and to save new tokens
+            to, so other processes can reuse them.
+        retry_policy : spond.retry.RetryPolicy, optional
+            Backoff and retry rules for transient failures (429, 5xx,
+            connection errors). Defaults to `RetryPolicy()`.
+        rate_limiter : spond.rate_limit.TokenBucket, optional
+            Limits requests to the core API; may be shared with other
+            clients. Unlimited if omitted.
+        chat_rate_limiter : spond.rate_limit.TokenBucket, optional
+            Limits requests to the chat server. Unlimited if omitted.
+        response_cache : spond.cache.ResponseCache, optional
+            Cache for `get_events`, `fetch_event`, `get_posts`,
+            `get_groups`, `get_messages` and `get_profile` responses, keyed
+            by their parameters. No caching if omitted.
+        mirror : spond.mirror.SQLiteMirror, optional
+            Local database that fetched groups, events and posts are written
+            through to. Nothing is mirrored if omitted.
+        decode_options : spond.base.DecodeOptions, optional
+            JSON decoder for responses, and the body size above which it
+            runs in a worker thread. Defaults to `DecodeOptions()`.
         """
-        super().__init__(username, password, self._API_BASE_URL)
+        super().__init__(
+            username,
+            password,
+            self._API_BASE_URL,
+            session,
+            connection_options,
+            token_store,
+            retry_policy,
+            rate_limiter,
+            response_cache,
+            mirror,
+            decode_options,
+        )
+        self.chat_rate_limiter = chat_rate_limiter
         self._chat_url = None
         self._auth = None
-        self.groups: list[JSONDict] | None = None
-        self.events: list[JSONDict] | None = None
+        self._groups: list[JSONDict] | None = None
+        self._group_index: dict[str, JSONDict] | None = None
+        self._person_index: dict[str, JSONDict] | None = None
+        self._events: list[JSONDict] | None = None
+        self._event_index: dict[str, JSONDict] | None = None
         self.posts: list[JSONDict] | None = None
         self.messages: list[JSONDict] | None = None
         self.profile: JSONDict | None = None
 
+    @property
+    def groups(self) -> list[JSONDict] | None:
+        """Cached response from the last `get_groups()` call.
+
+        Assigning a new value (including `None`) also drops the lookup
+        indexes used by `get_group()` and `get_person()`, so they are rebuilt
+        from the new groups on the next lookup. Mutating the cached list in
+        place does not.
+        """
+        return self._groups
+
+    @groups.setter
+    def groups(self, groups: list[JSONDict] | None) -> None:
+        if groups is self._groups:
+            return
+        self._groups = groups
+        self._group_index = None
+        self._person_index = None
+
+    @property
+    def events(self) -> list[JSONDict] | None:
+        """Cached response from the last `get_events()` call.
+
+        Assigning a new value (including `None`) also drops the id index used
+        by `get_event()`, so it is rebuilt from the new events on the next
+        lookup. Mutating the cached list in place does not.
+        """
+        return self._events
+
+    @events.setter
+    def events(self, events: list[JSONDict] | None) -> None:
+        if events is self._events:
+            return
+        self._events = events
+        self._event_index = None
+
     async def _login_chat(self) -> None:
         """Perform the secondary handshake with Spond's chat server.
 
         The chat API lives on a separate host and uses its own short-lived
         token (`self._auth`) rather than the regular Bearer token used by the
-        core API. This method is called lazily by `get_messages`,
-        `send_message`, and `_continue_chat` on their first use; the resulting
-        `self._chat_url` and `self._auth` are cached for the lifetime of the
-        client.
+        core API. This method is called lazily, via `_ensure_chat_login`, by
+        `get_messages`, `send_message`, and `_continue_chat` on their first
+        use; the resulting `self._chat_url` and `self._auth` are cached for
+        the lifetime of the client.
         """
         api_chat_url = f"{self.api_url}chat"
-        r = await self.clientsession.post(api_chat_url, headers=self.auth_headers)
-        result = await r.json()
+        # Repeating the handshake is harmless, so it may be retried too.
+        async with self._request("post", api_chat_url, retry=True) as r:
+            result = await self._read_json(r)
         self._chat_url = result["url"]
         self._auth = result["auth"]
 
+    def _rate_limiter_for(self, url: str) -> TokenBucket | None:
+        """Use `chat_rate_limiter` for the chat server and `rate_limiter` for
+        the core API."""
+        if self._chat_url and url.startswith(self._chat_url):
+            return self.chat_rate_limiter
+        return self.rate_limiter
+
+    def _invalidate_cache(self, endpoint: str) -> None:
+        """Drop `endpoint`'s cached responses after a write that changes
+        them, if a `response_cache` is configured."""
+        if self.response_cache is not None:
+            self.response_cache.invalidate(endpoint)
+
+    async def _ensure_chat_login(self) -> None:
+        """Run the chat handshake (`_login_chat`) unless it has already
+        succeeded. Concurrent callers share a single handshake."""
+        if not self._auth:
+            await self._single_flight("chat", self._login_chat)
+
     @_SpondBase.require_authentication
     async def get_profile(self) -> JSONDict:
         """Retrieve the authenticated user's profile.
@@ -123,9 +268,10 @@ class Spond(_SpondBase):
             The profile object as returned by the Spond API.
         """
         url = f"{self._API_BASE_URL}profile"
-        async with self.clientsession.get(url, headers=self.auth_headers) as r:
-            self.profile = await r.json()
-            return self.profile
+        self.profile = await self._get_json(
+            url, raise_for_status=False, cache_as="profile"
+        )
+        return self.profile
 
     @_SpondBase.require_authentication
     async def get_groups(self) -> list[JSONDict] | None:
@@ -144,9 +290,35 @@ class Spond(_SpondBase):
             account has no groups at all.
         """
         url = f"{self.api_url}groups/"
-        async with self.clientsession.get(url, headers=self.auth_headers) as r:
-            self.groups = await r.json()
-            return self.groups
+        self.groups = await self._get_json(
+            url, raise_for_status=False, cache_as="groups"
+        )
+        if self.groups and isinstance(self.groups, list):
+            await self._save_to_mirror("save_groups", self.groups)
+        return self.groups
+
+    @_SpondBase.require_authentication
+    async def stream_groups(self) -> AsyncIterator[JSONDict]:
+        """Iterate over the user's groups as they are read from the response.
+
+        Same groups as `get_groups()`, but each one is decoded and yielded as
+        soon as it has arrived (see `spond.stream`), so the whole response
+        is never held at once. Nothing is cached on `self.groups`.
+
+        Yields
+        ------
+        JSONDict
+            Groups, shaped as in `get_groups()`.
+
+        Raises
+        ------
+        ValueError
+            Raised when the request to the API fails.
+        """
+        url = f"{self.api_url}groups/"
+        async with aclosing(self._stream_json(url, save_as="save_groups")) as groups:
+            async for group in groups:
+                yield group
 
     async def get_group(self, uid: str) -> JSONDict:
         """Look up a single group by its unique id.
@@ -176,9 +348,11 @@ class Spond(_SpondBase):
     async def get_person(self, user: str) -> JSONDict:
         """Look up a member or guardian by any of several identifiers.
 
-        Searches every member of every cached group (and each member's
-        `guardians` list). The first match wins. The cache `self.groups` is
-        populated by `get_groups()` if empty.
+        Looks the identifier up in an index of every member of every cached
+        group (and each member's `guardians` list), built on first use and
+        rebuilt whenever `self.groups` is replaced. If several people share
+        an identifier, the first one in group/member order wins. The cache
+        `self.groups` is populated by `get_groups()` if empty.
 
         Parameters
         ----------
@@ -204,42 +378,66 @@ class Spond(_SpondBase):
         """
         if not self.groups:
             await self.get_groups()
-        for group in self.groups:
+        if self._person_index is None:
+            self._person_index = self._build_person_index(self.groups or [])
+        try:
+            return self._person_index[user]
+        except KeyError:
+            errmsg = f"No person matched with identifier '{user}'."
+            raise KeyError(errmsg) from None
+
+    @classmethod
+    def _build_person_index(cls, groups: list[JSONDict]) -> dict[str, JSONDict]:
+        """Map every identifier accepted by `get_person` to its member or
+        guardian dict.
+
+        Groups, members and each member's `guardians` are visited in the same
+        order `get_person` has always searched them, and an identifier is
+        only recorded the first time it is seen, so lookups keep the
+        first-match-wins semantics of a linear scan.
+
+        Parameters
+        ----------
+        groups : list[JSONDict]
+            Groups as returned by `get_groups()`.
+
+        Returns
+        -------
+        dict[str, JSONDict]
+            Identifier to person dict.
+        """
+        index: dict[str, JSONDict] = {}
+        for group in groups:
             for member in group["members"]:
-                if self._match_person(member, user):
-                    return member
-                if "guardians" in member:
-                    for guardian in member["guardians"]:
-                        if self._match_person(guardian, user):
-                            return guardian
-        errmsg = f"No person matched with identifier '{user}'."
-        raise KeyError(errmsg)
+                for person in (member, *member.get("guardians", ())):
+                    for key in cls._person_keys(person):
+                        index.setdefault(key, person)
+        return index
 
     @staticmethod
-    def _match_person(person: JSONDict, match_str: str) -> bool:
-        """Return True if `match_str` matches any of the person's identifiers.
+    def _person_keys(person: JSONDict) -> list[str]:
+        """Return the identifiers `get_person` accepts for `person`.
 
-        Used internally by `get_person` to scan group members and guardians.
         See `get_person` for the list of accepted identifier forms.
 
         Parameters
         ----------
         person : JSONDict
             A member or guardian dict from a group's `members` list.
-        match_str : str
-            The identifier to test against.
 
         Returns
         -------
-        bool
-            True on first matching identifier; False otherwise.
-        """
-        return (
-            person["id"] == match_str
-            or ("email" in person and person["email"]) == match_str
-            or person["firstName"] + " " + person["lastName"] == match_str
-            or ("profile" in person and person["profile"]["id"] == match_str)
-        )
+        list[str]
+            The person's `id`, email (if present), full name and
+            `profile.id` (if present).
+        """
+        keys = [person["id"]]
+        if person.get("email"):
+            keys.append(person["email"])
+        keys.append(person["firstName"] + " " + person["lastName"])
+        if "profile" in person:
+            keys.append(person["profile"]["id"])
+        return keys
 
     @_SpondBase.require_authentication
     async def get_posts(
@@ -279,24 +477,62 @@ class Spond(_SpondBase):
             Raised when the request to the API fails.
         """
         url = f"{self.api_url}posts/"
-        params: dict[str, str] = {
+        params = self._post_params(group_id, max_posts, include_comments)
+        self.posts = await self._get_json(url, params=params, cache_as="posts")
+        if self.posts and isinstance(self.posts, list):
+            await self._save_to_mirror("save_posts", self.posts)
+        return self.posts
+
+    @_SpondBase.require_authentication
+    async def stream_posts(
+        self,
+        group_id: str | None = None,
+        max_posts: int = 20,
+        include_comments: bool = True,
+    ) -> AsyncIterator[JSONDict]:
+        """Iterate over group-wall posts as they are read from the response.
+
+        Same posts as `get_posts()`, but each one is decoded and yielded as
+        soon as it has arrived (see `spond.stream`), so a large `max_posts`
+        doesn't need the whole response in memory. Nothing is cached on
+        `self.posts`.
+
+        Parameters
+        ----------
+        group_id, max_posts, include_comments
+            Same as for `get_posts()`.
+
+        Yields
+        ------
+        JSONDict
+            Posts, shaped as in `get_posts()`.
+
+        Raises
+        ------
+        ValueError
+            Raised when the request to the API fails.
+        """
+        url = f"{self.api_url}posts/"
+        params = self._post_params(group_id, max_posts, include_comments)
+        async with aclosing(
+            self._stream_json(url, save_as="save_posts", params=params)
+        ) as posts:
+            async for post in posts:
+                yield post
+
+    @staticmethod
+    def _post_params(
+        group_id: str | None, max_posts: int, include_comments: bool
+    ) -> dict[str, str]:
+        """Translate `get_posts()` arguments into `posts/` query parameters."""
+        params = {
             "type": "PLAIN",
             "max": str(max_posts),
             "includeComments": str(include_comments).lower(),
         }
         if group_id:
             params["groupId"] = group_id
-
-        async with self.clientsession.get(
-            url, headers=self.auth_headers, params=params
-        ) as r:
-            if not r.ok:
-                error_details = await r.text()
-                raise ValueError(
-                    f"Request failed with status {r.status}: {error_details}"
-                )
-            self.posts = await r.json()
-            return self.posts
+        return params
 
     @_SpondBase.require_authentication
     async def get_messages(self, max_chats: int = 100) -> list[JSONDict] | None:
@@ -320,17 +556,54 @@ class Spond(_SpondBase):
             A list of chat objects ordered by most recent activity. `None` if
             the account has no chats.
         """
-        if not self._auth:
-            await self._login_chat()
+        await self._ensure_chat_login()
         url = f"{self._chat_url}/chats/"
-        async with self.clientsession.get(
+        self.messages = await self._get_json(
             url,
             headers={"auth": self._auth},
+            auth=False,
+            raise_for_status=False,
+            cache_as="messages",
             params={"max": str(max_chats)},
-        ) as r:
-            self.messages = await r.json()
+        )
         return self.messages
 
+    @_SpondBase.require_authentication
+    async def stream_messages(self, max_chats: int = 100) -> AsyncIterator[JSONDict]:
+        """Iterate over recent chats as they are read from the response.
+
+        Same chats as `get_messages()`, but each one is decoded and yielded as
+        soon as it has arrived (see `spond.stream`). Nothing is cached on
+        `self.messages`.
+
+        Parameters
+        ----------
+        max_chats : int, optional
+            Maximum number of chats to return. Defaults to 100.
+
+        Yields
+        ------
+        JSONDict
+            Chats ordered by most recent activity.
+
+        Raises
+        ------
+        ValueError
+            Raised when the request to the chat server fails.
+        """
+        await self._ensure_chat_login()
+        url = f"{self._chat_url}/chats/"
+        async with aclosing(
+            self._stream_json(
+                url,
+                headers={"auth": self._auth},
+                auth=False,
+                params={"max": str(max_chats)},
+            )
+        ) as chats:
+            async for chat in chats:
+                yield chat
+
     @_SpondBase.require_authentication
     async def _continue_chat(self, chat_id: str, text: str) -> JSONDict:
         """Append a text message to an existing chat thread.
@@ -350,12 +623,15 @@ class Spond(_SpondBase):
         JSONDict
             The Spond API response for the send operation.
         """
-        if not self._auth:
-            await self._login_chat()
+        await self._ensure_chat_login()
         url = f"{self._chat_url}/messages"
         data = {"chatId": chat_id, "text": text, "type": "TEXT"}
-        r = await self.clientsession.post(url, json=data, headers={"auth": self._auth})
-        return await r.json()
+        async with self._request(
+            "post", url, headers={"auth": self._auth}, auth=False, json=data
+        ) as r:
+            result = await self._read_json(r)
+        self._invalidate_cache("messages")
+        return result
 
     @_SpondBase.require_authentication
     async def send_message(
@@ -407,8 +683,7 @@ class Spond(_SpondBase):
             of the authenticated user's groups (propagated from
             `get_person`).
         """
-        if self._auth is None:
-            await self._login_chat()
+        await self._ensure_chat_login()
 
         if chat_id is not None:
             return await self._continue_chat(chat_id, text)
@@ -419,16 +694,94 @@ class Spond(_SpondBase):
             )
 
         user_obj = await self.get_person(user)
-        user_uid = user_obj["profile"]["id"]
+        return await self._start_chat(user_obj["profile"]["id"], group_uid, text)
+
+    @_SpondBase.require_authentication
+    async def send_messages(
+        self,
+        text: str,
+        users: Iterable[str],
+        group_uid: str,
+        concurrency: int = 5,
+    ) -> BulkResults[str]:
+        """Send the same message to many people, each in their own new
+        chat, e.g. a reminder to every parent in a group.
+
+        Recipients are resolved against the cached groups (fetched once if
+        needed) and the chat handshake is done once up front; the messages
+        are then sent at most `concurrency` at a time. Pass a
+        `chat_rate_limiter` to the client to also pace them. A recipient
+        that can't be resolved or whose message fails doesn't stop the
+        others.
+
+        ```python
+        results = await s.send_messages("Training moved to 18:00", parents, gid)
+        for r in results.failed:
+            print(r.item, r.error)
+        ```
+
+        Parameters
+        ----------
+        text : str
+            Message body to send.
+        users : Iterable[str]
+            Recipients, in any form accepted by `get_person()`.
+        group_uid : str
+            UID of the group that scopes the new chats.
+        concurrency : int, optional
+            Maximum number of messages in flight at once. Defaults to 5.
+
+        Returns
+        -------
+        spond.bulk.BulkResults[str]
+            One `spond.bulk.ItemResult` per recipient, in input order, whose
+            `value` is the API response for the send and whose `elapsed`
+            is the time its delivery took. Unknown recipients fail with
+            `KeyError`.
+        """
+        await self._ensure_chat_login()
+        if not self.groups:
+            await self.get_groups()
+
+        async def send(user: str) -> JSONDict:
+            user_obj = await self.get_person(user)
+            return await self._start_chat(user_obj["profile"]["id"], group_uid, text)
+
+        return await _run_bounded(users, send, concurrency)
+
+    async def _start_chat(self, recipient: str, group_uid: str, text: str) -> JSONDict:
+        """Start a new chat with a text message.
+
+        Internal helper used by `send_message` and `send_messages`; the
+        caller has already done the chat handshake.
+
+        Parameters
+        ----------
+        recipient : str
+            Profile id of the recipient.
+        group_uid : str
+            UID of the group that scopes the chat.
+        text : str
+            Message body to send.
+
+        Returns
+        -------
+        JSONDict
+            The Spond API response for the send operation.
+        """
         url = f"{self._chat_url}/messages"
         data = {
             "text": text,
             "type": "TEXT",
-            "recipient": user_uid,
+            "recipient": recipient,
             "groupId": group_uid,
         }
-        r = await self.clientsession.post(url, json=data, headers={"auth": self._auth})
-        return await r.json()
+        async with self._request(
+            "post", url, headers={"auth": self._auth}, auth=False, json=data
+        ) as r:
+            result = await self._read_json(r)
+        self._invalidate_cache("messages")
+        return result
 
     @_SpondBase.require_authentication
     async def get_events(
@@ -453,7 +806,8 @@ class Spond(_SpondBase):
         it inherits these defaults — an event that doesn't appear in the
         first `max_events` results or is excluded by `include_scheduled=False`
         is unreachable through `get_event()`. If you need broader visibility,
-        call this method directly with appropriate filters.
+        call this method directly with appropriate filters, or use
+        `iter_events()` to page through every matching event.
 
         Parameters
         ----------
@@ -506,36 +860,229 @@ class Spond(_SpondBase):
             status code indicates an error (e.g., 4xx or 5xx). The error message
             includes the HTTP status code and the response body for debugging purposes.
         """
+        params = self._event_params(
+            group_id=group_id,
+            subgroup_id=subgroup_id,
+            include_scheduled=include_scheduled,
+            include_hidden=include_hidden,
+            max_end=max_end,
+            min_end=min_end,
+            max_start=max_start,
+            min_start=min_start,
+        )
+        params["max"] = str(max_events)
+        self.events = await self._fetch_events(params, cache_as="events")
+        if self.events and isinstance(self.events, list):
+            await self._save_to_mirror("save_events", self.events)
+        return self.events
+
+    @_SpondBase.require_authentication
+    async def stream_events(
+        self,
+        group_id: str | None = None,
+        subgroup_id: str | None = None,
+        include_scheduled: bool = False,
+        include_hidden: bool = False,
+        max_end: datetime | None = None,
+        min_end: datetime | None = None,
+        max_start: datetime | None = None,
+        min_start: datetime | None = None,
+        max_events: int = 100,
+    ) -> AsyncIterator[JSONDict]:
+        """Iterate over events as they are read from the response.
+
+        Same events, in the same order, as `get_events()` with the same
+        arguments, but from a single request whose events are each decoded
+        and yielded as soon as they have arrived (see `spond.stream`). With
+        e.g. `max_events=5000`, processing starts with the first event and
+        the whole list is never held at once. Nothing is cached on
+        `self.events`.
+
+        To go through an unbounded window of events in several smaller
+        requests instead, use `iter_events()`.
+
+        ```python
+        async for event in s.stream_events(group_id=gid, max_events=5000):
+            ...
+        ```
+
+        Parameters
+        ----------
+        group_id, subgroup_id, include_scheduled, include_hidden, max_end, min_end, max_start, min_start, max_events
+            Same as for `get_events()`.
+
+        Yields
+        ------
+        JSONDict
+            Events, shaped as in `get_events()`.
+
+        Raises
+        ------
+        ValueError
+            Raised when the request to the API fails.
+        """
+        params = self._event_params(
+            group_id=group_id,
+            subgroup_id=subgroup_id,
+            include_scheduled=include_scheduled,
+            include_hidden=include_hidden,
+            max_end=max_end,
+            min_end=min_end,
+            max_start=max_start,
+            min_start=min_start,
+        )
+        params["max"] = str(max_events)
         url = f"{self.api_url}sponds/"
-        params = {
-            "max": str(max_events),
-            "scheduled": str(include_scheduled),
-        }
+        async with aclosing(
+            self._stream_json(url, save_as="save_events", params=params)
+        ) as events:
+            async for event in events:
+                yield event
+
+    @_SpondBase.require_authentication
+    async def iter_events(
+        self,
+        group_id: str | None = None,
+        subgroup_id: str | None = None,
+        include_scheduled: bool = False,
+        include_hidden: bool = False,
+        max_end: datetime | None = None,
+        min_end: datetime | None = None,
+        max_start: datetime | None = None,
+        min_start: datetime | None = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[JSONDict]:
+        """Iterate over every event matching the filters, page by page.
+
+        Unlike `get_events()`, there is no cap on the number of events: pages
+        of `page_size` events are requested in ascending start order, each
+        starting at the `startTimestamp` of the last event seen, and events
+        are yielded as each page arrives. Events sharing that boundary
+        timestamp are de-duplicated by id, so each event is yielded once.
+        Only the current page is held in memory and nothing is cached on
+        `self.events`.
+
+        ```python
+        async for event in s.iter_events(group_id=gid, min_start=season_start):
+            ...
+        ```
+
+        Parameters
+        ----------
+        group_id, subgroup_id, include_scheduled, include_hidden, max_end, min_end, max_start, min_start
+            Same filters as `get_events()`.
+        page_size : int, optional
+            Number of events requested per page. Defaults to 100. Uses `max`
+            API parameter.
+
+        Yields
+        ------
+        JSONDict
+            Events in ascending `startTimestamp` order, with the same shape as
+            elements returned by `get_events()`.
+
+        Raises
+        ------
+        ValueError
+            Raised when a request to the API fails.
+        """
+        params = self._event_params(
+            group_id=group_id,
+            subgroup_id=subgroup_id,
+            include_scheduled=include_scheduled,
+            include_hidden=include_hidden,
+            max_end=max_end,
+            min_end=min_end,
+            max_start=max_start,
+            min_start=min_start,
+        )
+        params["order"] = "asc"
+        limit = page_size
+        cursor = None
+        boundary_ids: set[str] = set()
+        while True:
+            page = await self._fetch_events({**params, "max": str(limit)}) or []
+            if page:
+                await self._save_to_mirror("save_events", page)
+            new_events = [e for e in page if e["id"] not in boundary_ids]
+            for event in new_events:
+                if event["startTimestamp"] != cursor:
+                    cursor = event["startTimestamp"]
+                    boundary_ids = set()
+                boundary_ids.add(event["id"])
+                yield event
+            if len(page) < limit:
+                return
+            # A full page of events that were all seen already means more
+            # events share one start time than fit in a page; widen the page
+            # rather than asking for the same one again.
+            limit = limit * 2 if not new_events else page_size
+            params["minStartTimestamp"] = cursor
+
+    @classmethod
+    def _event_params(
+        cls,
+        group_id: str | None,
+        subgroup_id: str | None,
+        include_scheduled: bool,
+        include_hidden: bool,
+        max_end: datetime | None,
+        min_end: datetime | None,
+        max_start: datetime | None,
+        min_start: datetime | None,
+    ) -> dict[str, str]:
+        """Translate `get_events()` filters into `sponds/` query parameters.
+
+        See `get_events()` for the meaning of each filter. The `max`
+        parameter is left for the caller to set.
+
+        Returns
+        -------
+        dict[str, str]
+            Query parameters for the `sponds/` endpoint.
+        """
+        params = {"scheduled": str(include_scheduled)}
         if max_end:
-            params["maxEndTimestamp"] = max_end.strftime(self._DT_FORMAT)
+            params["maxEndTimestamp"] = max_end.strftime(cls._DT_FORMAT)
         if max_start:
-            params["maxStartTimestamp"] = max_start.strftime(self._DT_FORMAT)
+            params["maxStartTimestamp"] = max_start.strftime(cls._DT_FORMAT)
         if min_end:
-            params["minEndTimestamp"] = min_end.strftime(self._DT_FORMAT)
+            params["minEndTimestamp"] = min_end.strftime(cls._DT_FORMAT)
         if min_start:
-            params["minStartTimestamp"] = min_start.strftime(self._DT_FORMAT)
+            params["minStartTimestamp"] = min_start.strftime(cls._DT_FORMAT)
         if group_id:
             params["groupId"] = group_id
         if subgroup_id:
             params["subGroupId"] = subgroup_id
         if include_hidden:
             params["includeHidden"] = "true"
+        return params
 
-        async with self.clientsession.get(
-            url, headers=self.auth_headers, params=params
-        ) as r:
-            if not r.ok:
-                error_details = await r.text()
-                raise ValueError(
-                    f"Request failed with status {r.status}: {error_details}"
-                )
-            self.events = await r.json()
-            return self.events
+    async def _fetch_events(
+        self, params: dict[str, str], cache_as: str | None = None
+    ) -> list[JSONDict] | None:
+        """GET one page of events from the `sponds/` endpoint.
+
+        Parameters
+        ----------
+        params : dict[str, str]
+            Query parameters, as built by `_event_params()` plus `max`.
+        cache_as : str, optional
+            Endpoint name for `response_cache`, as for `_get_json()`. Not
+            cached if omitted.
+
+        Returns
+        -------
+        list[JSONDict] or None
+            The parsed response body.
+
+        Raises
+        ------
+        ValueError
+            Raised when the request to the API fails.
+        """
+        url = f"{self.api_url}sponds/"
+        return await self._get_json(url, params=params, cache_as=cache_as)
 
     async def get_event(self, uid: str) -> JSONDict:
         """Look up a single event by its unique id.
@@ -564,14 +1111,47 @@ class Spond(_SpondBase):
         """
         return await self._get_entity(self._EVENT, uid)
 
+    @_SpondBase.require_authentication
+    async def fetch_event(self, uid: str) -> JSONDict:
+        """Fetch a single event directly from `sponds/{uid}`.
+
+        Unlike `get_event()`, this doesn't depend on the event being in the
+        cached events list, and costs one small request however many events
+        the account has. The result is cached in `response_cache` (if any)
+        under the `"event"` endpoint, but not on `self.events`.
+
+        Parameters
+        ----------
+        uid : str
+            UID of the event.
+
+        Returns
+        -------
+        JSONDict
+            The event's details, with the same shape as elements returned by
+            `get_events()`.
+
+        Raises
+        ------
+        ValueError
+            Raised when the request to the API fails, e.g. because there is
+            no event with that id.
+        """
+        url = f"{self.api_url}sponds/{uid}"
+        return await self._get_json(url, cache_as="event")
+
     @_SpondBase.require_authentication
     async def update_event(self, uid: str, updates: JSONDict) -> JSONDict:
         """Update an existing event by merging changes into the current state.
 
-        The implementation fetches the event via `_get_entity()`, copies the
-        fields present in `_EVENT_TEMPLATE` from the existing event as the
-        base, then overlays any keys provided in `updates`. The merged event
-        is POSTed back to `sponds/{uid}`.
+        The current state is fetched from `sponds/{uid}` just before the
+        update, bypassing `self.events` and `response_cache`, so the merge
+        never starts from a stale copy and undoes someone else's change. The
+        fields present in `_EVENT_TEMPLATE` are copied from it, and `updates`
+        is deep-merged on top: nested dicts such as `location` only have the
+        given keys replaced, while other values (lists included) replace the
+        current value outright. The merged event is POSTed back to
+        `sponds/{uid}`.
 
         Parameters
         ----------
@@ -579,32 +1159,122 @@ class Spond(_SpondBase):
             UID of the event to update.
         updates : JSONDict
             Mapping of keys to new values. Only keys present in
-            `_EVENT_TEMPLATE` are honoured. Example:
+            `_EVENT_TEMPLATE` are honoured, and `None` values are ignored.
+            Example:
 
             ```python
             await s.update_event(uid, {"description": "New description"})
+            await s.update_event(uid, {"location": {"feature": "Hall B"}})
             ```
 
         Returns
         -------
         JSONDict
             The Spond API response from the POST — the updated event as
-            persisted server-side.
+            persisted server-side. If the event is cached in `self.events`,
+            it is replaced there by this response.
+
+        Raises
+        ------
+        ValueError
+            Raised when fetching the event fails.
         """
-        event = await self._get_entity(self._EVENT, uid)
         url = f"{self.api_url}sponds/{uid}"
+        event = await self._get_json(url)
+
+        base_event = self._event_payload(event, updates)
+        async with self._request("post", url, json=base_event) as r:
+            result = await self._read_json(r)
+        self._invalidate_cache("events")
+        self._invalidate_cache("event")
+        if isinstance(result, dict) and "id" in result:
+            self._replace_cached_event(result)
+            await self._save_to_mirror("save_events", [result])
+        return result
+
+    @_SpondBase.require_authentication
+    async def update_events(
+        self,
+        updates: Mapping[str, JSONDict],
+        concurrency: int = 5,
+    ) -> BulkResults[str]:
+        """Update many events at once, e.g. to move a week of training to a
+        new venue.
+
+        Runs `update_event()` for each event, at most `concurrency` at a
+        time. Requests follow the client's `retry_policy` (which only
+        retries the POSTs if `"post"` is among its `retry_methods`), and a
+        failed update doesn't stop the others. As with `update_event()`,
+        events in `self.events` are replaced by the server's updated
+        versions, so the list needn't be fetched again.
+
+        ```python
+        venue = {"location": {"feature": "Hall B", "address": "Street 2"}}
+        results = await s.update_events({uid: venue for uid in week_uids})
+        ```
 
-        base_event = self._EVENT_TEMPLATE.copy()
-        for key in base_event:
-            if event.get(key) is not None and not updates.get(key):
-                base_event[key] = event[key]
-            elif updates.get(key) is not None:
-                base_event[key] = updates[key]
+        Parameters
+        ----------
+        updates : Mapping[str, JSONDict]
+            Changes to make, by event UID, as for `update_event()`.
+        concurrency : int, optional
+            Maximum number of events being updated at once. Defaults to 5.
 
-        async with self.clientsession.post(
-            url, json=base_event, headers=self.auth_headers
-        ) as r:
-            return await r.json()
+        Returns
+        -------
+        spond.bulk.BulkResults[str]
+            One `spond.bulk.ItemResult` per event UID, in input order, whose
+            `value` is the updated event as persisted server-side.
+        """
+        return await _run_bounded(
+            updates, lambda uid: self.update_event(uid, updates[uid]), concurrency
+        )
+
+    def _cached_event(self, uid: str) -> JSONDict | None:
+        """Return the event with id `uid` from `self.events`, or `None` if
+        it isn't cached there. Never makes a request."""
+        if not self.events:
+            return None
+        if self._event_index is None:
+            self._event_index = self._index_by_id(self.events)
+        return self._event_index.get(uid)
+
+    def _replace_cached_event(self, event: JSONDict) -> None:
+        """Put `event` in place of the cached event with the same id in
+        `self.events` (and its id index), if there is one."""
+        cached = self._cached_event(event["id"])
+        if cached is None:
+            return
+        i = next(i for i, e in enumerate(self.events) if e is cached)
+        self.events[i] = event
+        self._event_index[event["id"]] = event
+
+    @classmethod
+    def _event_payload(cls, event: JSONDict, updates: JSONDict) -> JSONDict:
+        """Build the body `update_event` POSTs: the `_EVENT_TEMPLATE` fields
+        of `event` (template defaults where it has none), with `updates`
+        deep-merged on top. Shares no mutable state with its inputs.
+
+        Parameters
+        ----------
+        event : JSONDict
+            The event's current state.
+        updates : JSONDict
+            Changes, as passed to `update_event()`.
+
+        Returns
+        -------
+        JSONDict
+            The merged event.
+        """
+        payload = {}
+        for key, default in cls._EVENT_TEMPLATE.items():
+            current = event.get(key)
+            value = copy.deepcopy(default if current is None else current)
+            if updates.get(key) is not None:
+                value = _deep_merge(value, updates[key])
+            payload[key] = value
+        return payload
 
     @_SpondBase.require_authentication
     async def get_event_attendance_xlsx(self, uid: str) -> bytes:
@@ -634,7 +1304,7 @@ class Spond(_SpondBase):
             ```
         """
         url = f"{self.api_url}sponds/{uid}/export"
-        async with self.clientsession.get(url, headers=self.auth_headers) as r:
+        async with self._request("get", url) as r:
             return await r.read()
 
     @_SpondBase.require_authentication
@@ -667,10 +1337,65 @@ class Spond(_SpondBase):
             (`acceptedIds`, `declinedIds`, `unansweredIds`, etc.).
         """
         url = f"{self.api_url}sponds/{uid}/responses/{user}"
-        async with self.clientsession.put(
-            url, headers=self.auth_headers, json=payload
-        ) as r:
-            return await r.json()
+        async with self._request("put", url, json=payload) as r:
+            result = await self._read_json(r)
+        self._invalidate_cache("events")
+        self._invalidate_cache("event")
+        if isinstance(result, dict):
+            await self._save_to_mirror("save_responses", uid, result)
+        return result
+
+    @_SpondBase.require_authentication
+    async def change_responses(
+        self,
+        changes: Iterable[tuple[str, str, JSONDict]],
+        concurrency: int = 5,
+    ) -> tuple[BulkResults[tuple[str, str, JSONDict]], dict[str, JSONDict]]:
+        """Change many members' responses at once, e.g. to mark attendance
+        for a whole squad.
+
+        Runs `change_response()` for each change, at most `concurrency` at a
+        time. A failed change doesn't stop the others; check each item's
+        result. Concurrent changes to one event can be answered in a
+        different order from the one the server applied them in, so once
+        they are all done, each event that was changed is fetched once more
+        with `fetch_event()` for its final `responses`.
+
+        ```python
+        results, responses = await s.change_responses(
+            [(event_id, member_id, {"accepted": "true"}) for member_id in squad]
+        )
+        for r in results.failed:
+            print(r.item[1], r.error)
+        ```
+
+        Parameters
+        ----------
+        changes : Iterable[tuple[str, str, JSONDict]]
+            `(uid, user, payload)` tuples, as for `change_response()`.
+        concurrency : int, optional
+            Maximum number of requests in flight at once. Defaults to 5.
+
+        Returns
+        -------
+        tuple[spond.bulk.BulkResults, dict[str, JSONDict]]
+            One `spond.bulk.ItemResult` per change, in input order, whose
+            `value` is the event's `responses` object right after that
+            change; and the final `responses` object of each event with at
+            least one successful change, by event UID. Events whose final
+            fetch failed are left out.
+        """
+        results = await _run_bounded(
+            changes, lambda item: self.change_response(*item), concurrency
+        )
+        changed = list(dict.fromkeys(r.item[0] for r in results.succeeded))
+        fetched = await _run_bounded(changed, self.fetch_event, concurrency)
+        responses: dict[str, JSONDict] = {}
+        for r in fetched.succeeded:
+            if isinstance(r.value, dict) and isinstance(r.value.get("responses"), dict):
+                responses[r.item] = r.value["responses"]
+                await self._save_to_mirror("save_responses", r.item, responses[r.item])
+        return results, responses
 
     @_SpondBase.require_authentication
     async def _get_entity(self, entity_type: str, uid: str) -> JSONDict:
@@ -678,7 +1403,10 @@ class Spond(_SpondBase):
 
         Routes to the relevant cache (`self.events` or `self.groups`),
         triggers a fetch via `get_events()` / `get_groups()` if the cache is
-        empty, then linearly scans for a matching `id`. Raises `KeyError`
+        empty, then looks the `id` up in an index of that cache, built on
+        first use and dropped whenever the cache is replaced. Failing that,
+        responses for other parameters held in `response_cache` (if any) are
+        searched too. Raises `KeyError`
         cleanly (rather than `TypeError`) when the cache remains empty after
         the fetch attempt — the underlying `get_*s()` method may legitimately
         return `None` if the account has no events/groups available.
@@ -706,20 +1434,58 @@ class Spond(_SpondBase):
         if entity_type == self._EVENT:
             if not self.events:
                 await self.get_events()
-            entities = self.events
+            if self._event_index is None:
+                self._event_index = self._index_by_id(self.events or [])
+            index = self._event_index
         elif entity_type == self._GROUP:
             if not self.groups:
                 await self.get_groups()
-            entities = self.groups
+            if self._group_index is None:
+                self._group_index = self._index_by_id(self.groups or [])
+            index = self._group_index
         else:
             errmsg = f"Entity type '{entity_type}' is not supported."
             raise NotImplementedError(errmsg)
 
+        if uid in index:
+            return index[uid]
+        if self.response_cache is not None:
+            # Other filters may have fetched it, e.g. another group's events.
+            endpoint = "events" if entity_type == self._EVENT else "groups"
+            for entities in self.response_cache.values(endpoint):
+                for entity in entities or []:
+                    if entity["id"] == uid:
+                        return entity
         errmsg = f"No {entity_type} with id='{uid}'."
-        if not entities:
-            raise KeyError(errmsg)
+        raise KeyError(errmsg)
+
+    @staticmethod
+    def _index_by_id(entities: list[JSONDict]) -> dict[str, JSONDict]:
+        """Map each entity's `id` to the entity, keeping the first one if an
+        id appears more than once (as a linear scan would).
+
+        Parameters
+        ----------
+        entities : list[JSONDict]
+            Cached events or groups.
 
+        Returns
+        -------
+        dict[str, JSONDict]
+            Id to entity dict.
+        """
+        index: dict[str, JSONDict] = {}
         for entity in entities:
-            if entity["id"] == uid:
-                return entity
-        raise KeyError(errmsg)
+            index.setdefault(entity["id"], entity)
+        return index
+
+
+def _deep_merge(base: Any, overlay: Any) -> Any:
+    """Return a copy of `base` with `overlay` merged in: dicts are merged key
+    by key, recursively, and any other `overlay` value replaces `base`."""
+    if not isinstance(base, dict) or not isinstance(overlay, dict):
+        return copy.deepcopy(overlay)
+    merged = copy.deepcopy(base)
+    for key, value in overlay.items():
+        merged[key] = _deep_merge(base.get(key), value)
+    return merged
@@ -0,0 +1,256 @@
+"""Incrementally maintained attendance statistics.
+
+`AttendanceStats` keeps counts of response states per member, per group and
+per subgroup for a changing set of events. Events are added, replaced or
+removed one at a time, each costing only its own responses, and rates are
+read from the running counts, so a rolling window never has to be recounted
+from scratch:
+
+```python
+from datetime import UTC, datetime, timedelta
+
+from spond.stats import AttendanceStats
+
+stats = AttendanceStats(await s.get_groups())
+async for event in s.iter_events(group_id=gid, min_start=season_start):
+    stats.add(event)
+...
+stats.expire(before=datetime.now(UTC) - timedelta(weeks=4))
+stats.rate("accepted", member_id="MEMBER_ID")  # e.g. 0.8
+stats.counts(subgroup_id="SUBGROUP_ID")  # e.g. Counter({"accepted": 40, ...})
+```
+
+It pairs with `spond.sync.EventSync`: pass each run's changes to `apply()`.
+Cancelled events are not counted.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import Counter
+from datetime import datetime
+from typing import TYPE_CHECKING, NamedTuple
+
+from .attendance import _response_lists
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from . import JSONDict
+    from .sync import EventChanges
+
+
+class _Counted(NamedTuple):
+    """What one event added to the counts, to take it away again."""
+
+    group_id: str | None
+    start: datetime | None
+    responses: tuple[tuple[str, str], ...]
+    """`(member_id, state)` pairs."""
+
+
+class AttendanceStats:
+    """Running counts of response states over a set of events."""
+
+    def __init__(self, groups: Iterable[JSONDict] | None = None) -> None:
+        """Create empty statistics.
+
+        Parameters
+        ----------
+        groups : Iterable[JSONDict], optional
+            Groups as returned by `get_groups()`, giving each member's
+            subgroups (their `subGroups` ids). Without them, only member,
+            group and overall counts are kept.
+        """
+        self._subgroups: dict[str, tuple[str, ...]] = {}
+        for group in groups or ():
+            for member in group.get("members", ()):
+                self._subgroups.setdefault(
+                    member["id"], tuple(member.get("subGroups", ()))
+                )
+        self._events: dict[str, _Counted] = {}
+        self._starts: list[tuple[datetime, str]] = []
+        """Heap of `(start, event_id)`; may hold stale entries."""
+        self._total: Counter[str] = Counter()
+        self._members: dict[str, Counter[str]] = {}
+        self._groups: dict[str, Counter[str]] = {}
+        self._subgroup_counts: dict[str, Counter[str]] = {}
+
+    def add(self, event: JSONDict) -> None:
+        """Count an event's responses, replacing any earlier version of it.
+
+        A cancelled event is removed instead, if it was counted.
+
+        Parameters
+        ----------
+        event : JSONDict
+            Event as returned by `get_events()` or `iter_events()`.
+        """
+        uid = event["id"]
+        self.remove(uid)
+        if event.get("cancelled"):
+            return
+        group = (event.get("recipients") or {}).get("group")
+        start = event.get("startTimestamp")
+        counted = _Counted(
+            group.get("id") if isinstance(group, dict) else None,
+            datetime.fromisoformat(start) if start else None,
+            tuple(
+                (member_id, state)
+                for state, member_ids in _response_lists(event)
+                for member_id in member_ids
+            ),
+        )
+        self._events[uid] = counted
+        if counted.start is not None:
+            heapq.heappush(self._starts, (counted.start, uid))
+            if len(self._starts) > 2 * len(self._events) + 16:
+                self._rebuild_starts()
+        self._update(counted, 1)
+
+    def remove(self, uid: str) -> None:
+        """Stop counting the event with id `uid`; no-op if not counted."""
+        counted = self._events.pop(uid, None)
+        if counted is not None:
+            self._update(counted, -1)
+
+    def apply(self, changes: EventChanges) -> None:
+        """Bring the counts up to date with an `EventSync` changeset."""
+        for event in (*changes.added, *changes.updated, *changes.cancelled):
+            self.add(event)
+        for uid in changes.removed:
+            self.remove(uid)
+
+    def expire(self, before: datetime) -> list[str]:
+        """Remove the events starting before `before`, e.g. to keep a
+        rolling window of recent events.
+
+        Only the events removed are visited.
+
+        Parameters
+        ----------
+        before : datetime
+            Timezone-aware cut-off.
+
+        Returns
+        -------
+        list[str]
+            Ids of the removed events.
+        """
+        removed = []
+        while self._starts and self._starts[0][0] < before:
+            start, uid = heapq.heappop(self._starts)
+            counted = self._events.get(uid)
+            # Skip entries left behind by events since replaced or removed.
+            if counted is not None and counted.start == start:
+                self.remove(uid)
+                removed.append(uid)
+        return removed
+
+    def _rebuild_starts(self) -> None:
+        """Drop the stale entries that replaced events left in `_starts`."""
+        self._starts = [
+            (counted.start, uid)
+            for uid, counted in self._events.items()
+            if counted.start is not None
+        ]
+        heapq.heapify(self._starts)
+
+    def counts(
+        self,
+        member_id: str | None = None,
+        group_id: str | None = None,
+        subgroup_id: str | None = None,
+    ) -> Counter[str]:
+        """Return how many responses of each state were counted.
+
+        Give at most one of `member_id`, `group_id` or `subgroup_id`; with
+        none, the counts cover every event. A subgroup's counts are its
+        members' responses to events of any group.
+
+        Returns
+        -------
+        Counter[str]
+            State (e.g. `"accepted"`) to count; a copy, empty if nothing was
+            counted.
+
+        Raises
+        ------
+        ValueError
+            More than one of the filters was given.
+        """
+        filters = [
+            (counts, key)
+            for counts, key in (
+                (self._members, member_id),
+                (self._groups, group_id),
+                (self._subgroup_counts, subgroup_id),
+            )
+            if key is not None
+        ]
+        if len(filters) > 1:
+            errmsg = "Give at most one of member_id, group_id and subgroup_id."
+            raise ValueError(errmsg)
+        if not filters:
+            return self._total.copy()
+        counts, key = filters[0]
+        return counts.get(key, Counter()).copy()
+
+    def rate(
+        self,
+        state: str = "accepted",
+        member_id: str | None = None,
+        group_id: str | None = None,
+        subgroup_id: str | None = None,
+    ) -> float | None:
+        """Return the share of counted responses that are `state`.
+
+        Filters are as for `counts()`.
+
+        Parameters
+        ----------
+        state : str, optional
+            Response state, e.g. `"declined"`. Defaults to `"accepted"`.
+
+        Returns
+        -------
+        float or None
+            Between 0 and 1; `None` if no responses were counted.
+        """
+        counts = self.counts(member_id, group_id, subgroup_id)
+        total = counts.total()
+        return counts[state] / total if total else None
+
+    def __len__(self) -> int:
+        """Number of events counted."""
+        return len(self._events)
+
+    def __contains__(self, uid: object) -> bool:
+        return uid in self._events
+
+    def _update(self, counted: _Counted, sign: int) -> None:
+        """Add (`sign=1`) or take away (`sign=-1`) an event's responses."""
+        for member_id, state in counted.responses:
+            _bump(self._total, state, sign)
+            _bump_keyed(self._members, member_id, state, sign)
+            if counted.group_id is not None:
+                _bump_keyed(self._groups, counted.group_id, state, sign)
+            for subgroup_id in self._subgroups.get(member_id, ()):
+                _bump_keyed(self._subgroup_counts, subgroup_id, state, sign)
+
+
+def _bump(counter: Counter[str], state: str, sign: int) -> None:
+    """Change the count of `state` by `sign`, dropping it at zero."""
+    counter[state] += sign
+    if not counter[state]:
+        del counter[state]
+
+
+def _bump_keyed(
+    counters: dict[str, Counter[str]], key: str, state: str, sign: int
+) -> None:
+    """`_bump` the counter for `key`, dropping it once empty."""
+    counter = counters.setdefault(key, Counter())
+    _bump(counter, state, sign)
+    if not counter:
+        del counters[key]
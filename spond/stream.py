@@ -0,0 +1,191 @@
+"""Incremental decoding of JSON array responses.
+
+Listing endpoints such as `sponds/` and `groups/` answer with one JSON array.
+Decoding it in one go means holding the whole body, then the whole decoded
+list, before the caller sees the first item. `iter_json_array` instead splits
+the array into its elements as the body arrives and decodes each one on its
+own, so only the element being read (plus one network chunk) is held at a
+time. The `stream_*` methods of `spond.spond.Spond` are built on it:
+
+```python
+async for event in s.stream_events(max_events=5000):
+    ...
+```
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    import aiohttp
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+
+class _ArrayDecoder:
+    """Decode the top-level elements of a JSON array fed in arbitrary chunks.
+
+    Each element is decoded by the standard library's C scanner as soon as
+    it is complete. An element cut off by the end of a chunk fails to
+    decode; it is only tried again once the text after it has doubled, so
+    even an element spanning many chunks costs at most about twice a single
+    decode.
+    """
+
+    def __init__(self) -> None:
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        """Text received and not yet decoded."""
+        self._pending: list[str] = []
+        """Text received since `_text` was last joined."""
+        self._pending_size = 0
+        self._wanted = 0
+        """Length `_text` must reach before decoding is tried again."""
+        self._expect_element = False
+        self._count = 0
+        """Elements decoded so far."""
+        self.is_array: bool | None = None
+        """Whether the body is an array; `None` until its first character."""
+        self.done = False
+        """Whether the array has been closed."""
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add `chunk` and return the elements it completed, in order."""
+        text = self._utf8.decode(chunk)
+        self._pending.append(text)
+        self._pending_size += len(text)
+        if self.done or len(self._text) + self._pending_size < self._wanted:
+            return []
+        self._text += "".join(self._pending)
+        self._pending.clear()
+        self._pending_size = 0
+        return self._decode()
+
+    def _decode(self) -> list[Any]:
+        text = self._text
+        pos = _WHITESPACE.match(text).end()
+        if self.is_array is None:
+            if pos == len(text):
+                return []
+            self.is_array = text[pos] == "["
+            if not self.is_array:
+                return []
+            pos += 1
+            self._expect_element = True
+        elif not self.is_array:
+            return []
+
+        elements = []
+        while True:
+            pos = _WHITESPACE.match(text, pos).end()
+            if pos == len(text):
+                break
+            if not self._expect_element:
+                if text[pos] == "]":
+                    self.done = True
+                    pos += 1
+                    break
+                if text[pos] != ",":
+                    errmsg = f"Malformed JSON array: expected ',' at {text[pos]!r}."
+                    raise ValueError(errmsg)
+                self._expect_element = True
+                pos += 1
+                continue
+            if text[pos] == "]" and not self._count:
+                self.done = True
+                pos += 1
+                break
+            try:
+                value, end = _DECODER.raw_decode(text, pos)
+            except json.JSONDecodeError:
+                # Most likely cut off by the end of the chunk.
+                self._wanted = pos + 2 * (len(text) - pos)
+                break
+            if isinstance(value, int | float) and (
+                end == len(text) or text[end] in _NUMBER_CHARS
+            ):
+                # A number cut off by the end of the chunk may still parse,
+                # e.g. "2" of "2.5"; wait for the character after it.
+                self._wanted = len(text) + 1
+                break
+            elements.append(value)
+            self._count += 1
+            self._expect_element = False
+            pos = end
+
+        self._text = text[pos:]
+        self._wanted -= pos
+        return elements
+
+    def close(self) -> list[Any]:
+        """Finish the body and return the elements it still held.
+
+        Raises
+        ------
+        ValueError
+            The body is not an array or `null`, or is cut off or malformed.
+        """
+        self._pending.append(self._utf8.decode(b"", final=True))
+        self._text += "".join(self._pending)
+        self._pending.clear()
+        if not self.is_array:
+            value = json.loads(self._text) if self._text.strip() else None
+            if value is None:
+                return []
+            if not isinstance(value, list):
+                errmsg = f"Expected a JSON array, got {type(value).__name__}."
+                raise ValueError(errmsg)
+            return value
+        self._wanted = 0
+        elements = self._decode()
+        if not self.done:
+            if self._expect_element and self._text.strip():
+                # Decode what is left once more, for its error message.
+                _DECODER.raw_decode(self._text.lstrip())
+            errmsg = "Truncated JSON array: the response ended early."
+            raise ValueError(errmsg)
+        return elements
+
+
+async def iter_json_array(
+    content: aiohttp.StreamReader, chunk_size: int = 64 * 1024
+) -> AsyncIterator[Any]:
+    """Decode a JSON array from a response body element by element.
+
+    Elements are always decoded with the standard library's `json`, whatever
+    decoder the client was configured with: decoding element by element
+    needs to know where each one ends.
+
+    Parameters
+    ----------
+    content : aiohttp.StreamReader
+        The response body, e.g. `response.content`.
+    chunk_size : int, optional
+        Bytes read from `content` at a time. Defaults to 64 KiB.
+
+    Yields
+    ------
+    Any
+        The array's elements, decoded, in order. A body of `null` (or an
+        empty one) yields nothing.
+
+    Raises
+    ------
+    ValueError
+        The body is not an array or `null`, or is cut off or malformed.
+        `json.JSONDecodeError` is a subclass.
+    """
+    decoder = _ArrayDecoder()
+    async for chunk in content.iter_chunked(chunk_size):
+        for element in decoder.feed(chunk):
+            yield element
+    for element in decoder.close():
+        yield element
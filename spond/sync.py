@@ -0,0 +1,132 @@
+"""Incremental synchronisation of events.
+
+An `EventSync` remembers the `updated` version of every event it has seen in
+a window of events (the same filters `spond.spond.Spond.iter_events` takes)
+and turns each run into an `EventChanges` changeset: events that are new,
+changed, cancelled, or gone since the previous run. Work downstream of the
+sync (writing a calendar, notifying people, updating a database) then scales
+with the number of changes rather than with the size of the calendar.
+
+```python
+import asyncio
+
+from spond.spond import Spond
+from spond.sync import EventSync
+
+s = Spond(username="...", password="...")
+sync = EventSync(s, group_id=gid, min_start=season_start)
+while True:
+    changes = await sync.sync()
+    for event in changes.added + changes.updated:
+        ...
+    for uid in changes.removed:
+        ...
+    await asyncio.sleep(300)
+```
+
+The Spond API has no "changed since" filter, so every run still lists the
+window; pages arrive in start order and are compared as they are read. The
+versions can be saved between processes via `EventSync.versions` and passed
+back in as `versions`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import JSONDict
+    from .spond import Spond
+
+
+@dataclass
+class EventChanges:
+    """What changed in the synchronised window since the previous run.
+
+    The lists are disjoint. A changeset is falsy when nothing changed.
+    """
+
+    added: list[JSONDict] = field(default_factory=list)
+    """Events not seen before, except cancelled ones."""
+    updated: list[JSONDict] = field(default_factory=list)
+    """Known events with a new `updated` version, except cancelled ones."""
+    cancelled: list[JSONDict] = field(default_factory=list)
+    """New or changed events that are now cancelled."""
+    removed: list[str] = field(default_factory=list)
+    """Ids of known events that are no longer in the window: deleted, or
+    moved outside the filters."""
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.cancelled or self.removed)
+
+
+class EventSync:
+    """Detects changes to a window of events between successive runs."""
+
+    def __init__(
+        self,
+        client: Spond,
+        versions: dict[str, Any] | None = None,
+        page_size: int = 100,
+        **filters: Any,
+    ) -> None:
+        """Create a sync for the events matching `filters`.
+
+        Parameters
+        ----------
+        client : spond.spond.Spond
+            Client used to list events.
+        versions : dict[str, Any], optional
+            `versions` of an earlier `EventSync` over the same filters, to
+            resume from. Starts empty, so the first run reports every event as
+            added.
+        page_size : int, optional
+            Events requested per page. Defaults to 100.
+        **filters
+            Keyword arguments of `Spond.iter_events()`, e.g. `group_id` or
+            `min_start`.
+        """
+        self.client = client
+        self.versions: dict[str, Any] = dict(versions or {})
+        """`updated` value of each event seen in the last run, by id. JSON
+        serialisable."""
+        self.page_size = page_size
+        self.filters = filters
+
+    async def sync(self) -> EventChanges:
+        """List the window once and compare it with the previous run.
+
+        `versions` only changes once the whole window has been read, so a
+        failed run can simply be repeated.
+
+        Returns
+        -------
+        EventChanges
+            Events added, updated, cancelled and removed since the last run.
+
+        Raises
+        ------
+        ValueError
+            Raised when a request to the API fails.
+        """
+        changes = EventChanges()
+        seen: dict[str, Any] = {}
+        async for event in self.client.iter_events(
+            page_size=self.page_size, **self.filters
+        ):
+            uid = event["id"]
+            version = event.get("updated")
+            seen[uid] = version
+            # An event without a version is always treated as changed.
+            if version is not None and self.versions.get(uid) == version:
+                continue
+            if event.get("cancelled"):
+                changes.cancelled.append(event)
+            elif uid in self.versions:
+                changes.updated.append(event)
+            else:
+                changes.added.append(event)
+        changes.removed = [uid for uid in self.versions if uid not in seen]
+        self.versions = seen
+        return changes
@@ -0,0 +1,169 @@
+"""Persistent storage for access tokens, so new processes can skip login.
+
+Pass a `TokenStore` as `token_store` to `spond.spond.Spond` or
+`spond.club.SpondClub`. Before logging in, the client asks the store for a
+token saved by an earlier login (possibly in another process) and only calls
+`auth2/login` if there is none or it has expired; after each login the new
+token is saved back.
+
+`FileTokenStore` keeps tokens in a JSON file guarded by an OS file lock, so
+several processes can share one file. Implement `TokenStore` to keep them
+somewhere else (a secrets manager, a database, ...).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class StoredToken(NamedTuple):
+    """An access token together with its expiry time."""
+
+    token: str
+    """The bearer-token string."""
+    expiration: datetime | None
+    """When the token stops being accepted; `None` if unknown."""
+
+
+class TokenStore(ABC):
+    """Where a client saves and looks up access tokens between processes.
+
+    Keys identify an account on one API family (see `_SpondBase`), so one
+    store can hold tokens for several accounts. Methods are synchronous and
+    are run in a worker thread by the client, so they may block.
+    """
+
+    @abstractmethod
+    def load(self, key: str) -> StoredToken | None:
+        """Return the token saved under `key`, or `None` if there isn't one.
+
+        Parameters
+        ----------
+        key : str
+            Account identifier chosen by the client.
+
+        Returns
+        -------
+        StoredToken or None
+            The saved token, which may already have expired.
+        """
+
+    @abstractmethod
+    def save(self, key: str, token: StoredToken) -> None:
+        """Save `token` under `key`, replacing any earlier one.
+
+        Parameters
+        ----------
+        key : str
+            Account identifier chosen by the client.
+        token : StoredToken
+            The token to save.
+        """
+
+
+class FileTokenStore(TokenStore):
+    """Token store backed by a JSON file that several processes can share.
+
+    Reads and writes take an exclusive lock on a `<path>.lock` file next to
+    the store, and writes replace the store atomically, so a concurrent
+    reader sees either the old or the new contents. The file is created with
+    owner-only permissions, since the tokens grant full access to the
+    account.
+
+    Example
+    -------
+    ```python
+    from spond.spond import Spond
+    from spond.token_store import FileTokenStore
+
+    store = FileTokenStore("~/.cache/spond/tokens.json")
+    s = Spond(username="...", password="...", token_store=store)
+    ```
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Create a store backed by the JSON file at `path`.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Location of the JSON file. Missing parent directories are
+            created on first use.
+        """
+        self.path = Path(path).expanduser()
+
+    def load(self, key: str) -> StoredToken | None:
+        with self._locked():
+            entry = self._read().get(key)
+        if not isinstance(entry, dict) or not isinstance(entry.get("token"), str):
+            return None
+        expiration = entry.get("expiration")
+        if expiration:
+            # A hand-edited or corrupt expiry is treated like a missing
+            # entry, so the client logs in afresh instead of failing.
+            try:
+                expiration = datetime.fromisoformat(expiration)
+            except (TypeError, ValueError):
+                return None
+            if expiration.tzinfo is None:
+                return None
+        return StoredToken(token=entry["token"], expiration=expiration or None)
+
+    def save(self, key: str, token: StoredToken) -> None:
+        entry = {
+            "token": token.token,
+            "expiration": token.expiration.isoformat() if token.expiration else None,
+        }
+        with self._locked():
+            tokens = self._read()
+            tokens[key] = entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".tokens-")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(tokens, f)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+                raise
+
+    def _read(self) -> dict:
+        """Return the store's contents; empty if missing or unreadable."""
+        try:
+            with self.path.open() as f:
+                tokens = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return tokens if isinstance(tokens, dict) else {}
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an exclusive lock on `<path>.lock` for the duration."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = self.path.with_name(self.path.name + ".lock")
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            yield
+        finally:
+            # Closing the descriptor releases the lock on every platform.
+            os.close(fd)
@@ -0,0 +1,97 @@
+"""Test suite for attendance matrices."""
+
+from __future__ import annotations
+
+import csv
+import io
+from collections import Counter
+
+import pytest
+
+from spond.attendance import AttendanceMatrix
+
+GROUPS = [
+    {
+        "id": "GID1",
+        "members": [
+            {"id": "MID1", "firstName": "Ola", "lastName": "Nordmann"},
+            {
+                "id": "MID2",
+                "firstName": "Per",
+                "lastName": "Hansen",
+                "guardians": [
+                    {
+                        "id": "GUID1",
+                        "firstName": "Kari",
+                        "lastName": "Hansen",
+                        "profile": {"id": "PID1"},
+                    }
+                ],
+            },
+        ],
+    }
+]
+EVENTS = [
+    {
+        "id": "E1",
+        "heading": "Training",
+        "startTimestamp": "2026-01-01T10:00:00Z",
+        "responses": {
+            "acceptedIds": ["MID2", "UNKNOWN"],
+            "declinedIds": ["MID1"],
+            "votes": {},
+        },
+    },
+    {
+        "id": "E2",
+        "heading": "Match",
+        "startTimestamp": "2026-01-08T10:00:00Z",
+        "responses": {"acceptedIds": ["MID1"], "participatedIds": ["MID2"]},
+    },
+]
+
+
+class TestAttendanceMatrix:
+    def test_rows_in_roster_order_then_unknown(self) -> None:
+        matrix = AttendanceMatrix(EVENTS, GROUPS)
+
+        assert matrix.member_ids == ["MID1", "MID2", "UNKNOWN"]
+        assert matrix.event_ids == ["E1", "E2"]
+        assert len(matrix) == 3
+
+    def test_states_and_counts(self) -> None:
+        matrix = AttendanceMatrix(EVENTS, GROUPS)
+
+        assert matrix.state("MID1", "E1") == "declined"
+        assert matrix.state("UNKNOWN", "E2") is None
+        assert matrix.row("MID2") == ["accepted", "participated"]
+        assert matrix.counts("MID1") == Counter({"declined": 1, "accepted": 1})
+        assert matrix.event_counts("E1") == Counter({"accepted": 2, "declined": 1})
+        with pytest.raises(KeyError):
+            matrix.state("MID3", "E1")
+        with pytest.raises(KeyError):
+            matrix.state("MID1", "E3")
+
+    def test_names__resolved_from_groups(self) -> None:
+        matrix = AttendanceMatrix(EVENTS, GROUPS)
+
+        assert matrix.name("MID2") == "Per Hansen"
+        assert matrix.name("PID1") == "Kari Hansen"
+        assert matrix.name("UNKNOWN") == "UNKNOWN"
+        assert AttendanceMatrix(EVENTS).name("MID1") == "MID1"
+
+    def test_to_csv(self) -> None:
+        out = io.StringIO()
+        AttendanceMatrix(EVENTS, GROUPS).to_csv(out)
+
+        assert list(csv.reader(io.StringIO(out.getvalue()))) == [
+            [
+                "Member id",
+                "Name",
+                "2026-01-01T10:00:00Z Training",
+                "2026-01-08T10:00:00Z Match",
+            ],
+            ["MID1", "Ola Nordmann", "declined", "accepted"],
+            ["MID2", "Per Hansen", "accepted", "participated"],
+            ["UNKNOWN", "UNKNOWN", "accepted", ""],
+        ]
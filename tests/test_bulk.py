@@ -0,0 +1,195 @@
+"""Test suite for bulk operations."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from spond.bulk import _run_bounded
+from spond.spond import Spond
+
+MOCK_USERNAME, MOCK_PASSWORD = "MOCK_USERNAME", "MOCK_PASSWORD"
+MOCK_TOKEN = "MOCK_TOKEN"
+
+
+class TestRunBounded:
+    @pytest.mark.asyncio
+    async def test_results_in_input_order_with_failures(self) -> None:
+        state = {"in_flight": 0, "peak": 0}
+
+        async def operation(i: int) -> int:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.001 * (10 - i))
+            state["in_flight"] -= 1
+            if i == 3:
+                raise ValueError("boom")
+            return i * 10
+
+        results = await _run_bounded(range(10), operation, concurrency=4)
+
+        assert [r.item for r in results] == list(range(10))
+        assert [r.value for r in results.succeeded] == [
+            i * 10 for i in range(10) if i != 3
+        ]
+        assert [(r.item, str(r.error)) for r in results.failed] == [(3, "boom")]
+        assert state["peak"] == 4
+        assert all(r.elapsed >= 0 for r in results)
+
+
+class TestChangeResponses:
+    @pytest.mark.asyncio
+    async def test_change_responses__per_item_results_and_final_state(self) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = MOCK_TOKEN
+        accepted: dict[str, list[str]] = {"E1": [], "E2": []}
+
+        async def change_response(uid, user, payload):
+            await asyncio.sleep(0.001)
+            if user == "MBAD":
+                raise ValueError("Request failed with status 403")
+            accepted[uid].append(user)
+            return {"acceptedIds": list(accepted[uid])}
+
+        async def fetch_event(uid):
+            return {"id": uid, "responses": {"acceptedIds": list(accepted[uid])}}
+
+        s.change_response = change_response
+        s.fetch_event = fetch_event
+        payload = {"accepted": "true"}
+        changes = [
+            ("E1", "M1", payload),
+            ("E1", "MBAD", payload),
+            ("E1", "M2", payload),
+            ("E2", "M1", payload),
+        ]
+
+        results, responses = await s.change_responses(changes, concurrency=2)
+
+        assert [r.item for r in results] == changes
+        assert [r.item[1] for r in results.failed] == ["MBAD"]
+        assert sorted(responses["E1"]["acceptedIds"]) == ["M1", "M2"]
+        assert responses["E2"] == {"acceptedIds": ["M1"]}
+        await s.close()
+
+    @pytest.mark.asyncio
+    async def test_change_responses__final_state_despite_out_of_order_replies(
+        self,
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = MOCK_TOKEN
+        accepted: list[str] = []
+
+        async def change_response(uid, user, payload):
+            accepted.append(user)
+            snapshot = {"acceptedIds": list(accepted)}
+            # The first change is applied first but answered last.
+            await asyncio.sleep(0.01 if user == "M1" else 0)
+            return snapshot
+
+        async def fetch_event(uid):
+            return {"id": uid, "responses": {"acceptedIds": list(accepted)}}
+
+        s.change_response = change_response
+        s.fetch_event = fetch_event
+        payload = {"accepted": "true"}
+
+        results, responses = await s.change_responses(
+            [("E1", "M1", payload), ("E1", "M2", payload)], concurrency=2
+        )
+
+        assert results[0].value == {"acceptedIds": ["M1"]}
+        assert responses == {"E1": {"acceptedIds": ["M1", "M2"]}}
+        await s.close()
+
+
+class TestSendMessages:
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.post")
+    async def test_send_messages__resolves_once_and_reports_each(
+        self, mock_post
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = MOCK_TOKEN
+        s._auth = "MOCK_CHAT_AUTH"
+        s._chat_url = "https://chat.example.invalid"
+        s.groups = [
+            {
+                "id": "GID1",
+                "members": [
+                    {
+                        "id": f"MID{i}",
+                        "firstName": "First",
+                        "lastName": f"Last{i}",
+                        "profile": {"id": f"PID{i}"},
+                    }
+                    for i in range(3)
+                ],
+            }
+        ]
+        mock_post.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value={"ok": True}
+        )
+
+        results = await s.send_messages(
+            "hello", ["MID0", "UNKNOWN", "First Last2"], group_uid="GID1"
+        )
+
+        assert [r.item for r in results] == ["MID0", "UNKNOWN", "First Last2"]
+        assert [r.value for r in results.succeeded] == [{"ok": True}] * 2
+        assert [(r.item, type(r.error)) for r in results.failed] == [
+            ("UNKNOWN", KeyError)
+        ]
+        recipients = [c.kwargs["json"]["recipient"] for c in mock_post.call_args_list]
+        assert sorted(recipients) == ["PID0", "PID2"]
+        assert all(
+            c.kwargs["headers"] == {"auth": "MOCK_CHAT_AUTH"}
+            for c in mock_post.call_args_list
+        )
+        await s.close()
+
+
+class TestUpdateEvents:
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    async def test_update_events__updates_cache_with_server_versions(
+        self, mock_get, mock_post
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = MOCK_TOKEN
+        s.events = [
+            {"id": "E1", "heading": "Training"},
+            {"id": "E2", "heading": "Match"},
+        ]
+
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value={"heading": "Current"}
+        )
+
+        def post(url, **kwargs):
+            async def server_event():
+                return {**kwargs["json"], "id": url.rsplit("/", 1)[1], "updated": 2}
+
+            response = MagicMock(status=200, ok=True)
+            response.json = AsyncMock(side_effect=server_event)
+            cm = MagicMock()
+            cm.__aenter__ = AsyncMock(return_value=response)
+            cm.__aexit__ = AsyncMock(return_value=False)
+            return cm
+
+        mock_post.side_effect = post
+        venue = {"location": {"feature": "Hall B"}}
+
+        results = await s.update_events({"E2": venue, "E3": venue}, concurrency=2)
+
+        assert [r.item for r in results] == ["E2", "E3"]
+        assert not results.failed
+        assert mock_get.call_count == 2  # each event fetched on its own
+        assert s.events[0] == {"id": "E1", "heading": "Training"}
+        assert s.events[1]["updated"] == 2
+        assert s.events[1]["location"]["feature"] == "Hall B"
+        assert await s.get_event("E2") is s.events[1]
+        await s.close()
@@ -0,0 +1,268 @@
+"""Test suite for the response cache."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from spond.cache import ResponseCache
+from spond.retry import RetryPolicy
+from spond.spond import Spond
+
+MOCK_USERNAME, MOCK_PASSWORD = "MOCK_USERNAME", "MOCK_PASSWORD"
+MOCK_TOKEN = "MOCK_TOKEN"
+
+
+def _response(status: int = 200, headers: dict | None = None, body=None, size=None):
+    """A `ClientSession.get(...)` return value usable with `async with`."""
+    response = MagicMock(status=status, ok=status < 400, content_length=size)
+    response.headers = headers or {}
+    response.json = AsyncMock(return_value=body)
+    cm = MagicMock()
+    cm.__aenter__ = AsyncMock(return_value=response)
+    cm.__aexit__ = AsyncMock(return_value=False)
+    return cm
+
+
+class TestResponseCache:
+    def test_get__miss_then_hit(self) -> None:
+        cache = ResponseCache()
+
+        assert cache.get("events", "K") == (False, None)
+        cache.put("events", "K", None)
+        assert cache.get("events", "K") == (True, None)
+
+    def test_get__expires_after_endpoint_ttl(self) -> None:
+        cache = ResponseCache(ttls={"events": 10, "groups": 100})
+        with patch("time.monotonic", return_value=1000.0):
+            cache.put("events", "K", ["E"])
+            cache.put("groups", "K", ["G"])
+
+        with patch("time.monotonic", return_value=1050.0):
+            assert cache.get("events", "K") == (False, None)
+            assert cache.get("groups", "K") == (True, ["G"])
+
+    def test_put__zero_ttl_disables_endpoint(self) -> None:
+        cache = ResponseCache(ttls={"messages": 0})
+
+        cache.put("messages", "K", [])
+
+        assert len(cache) == 0
+
+    def test_put__evicts_least_recently_used(self) -> None:
+        cache = ResponseCache(max_entries=2)
+        cache.put("events", "A", 1)
+        cache.put("events", "B", 2)
+        cache.get("events", "A")  # A is now more recent than B
+
+        cache.put("events", "C", 3)
+
+        assert cache.get("events", "B") == (False, None)
+        assert cache.get("events", "A") == (True, 1)
+        assert cache.get("events", "C") == (True, 3)
+
+    def test_invalidate__one_endpoint_or_all(self) -> None:
+        cache = ResponseCache()
+        cache.put("events", "K", 1)
+        cache.put("groups", "K", 2)
+
+        cache.invalidate("events")
+        assert cache.get("events", "K") == (False, None)
+        assert cache.get("groups", "K") == (True, 2)
+
+        cache.invalidate()
+        assert len(cache) == 0
+
+    def test_get__expired_entry_with_validators_kept_for_revalidation(self) -> None:
+        cache = ResponseCache(ttls={"events": 10})
+        with patch("time.monotonic", return_value=1000.0):
+            cache.put("events", "A", 1, {"If-None-Match": '"v1"'}, 100)
+            cache.put("events", "B", 2)
+
+        with patch("time.monotonic", return_value=1050.0):
+            assert cache.get("events", "A") == (False, None)
+            assert cache.get("events", "B") == (False, None)
+            assert cache.get_stale("events", "A").value == 1
+            assert cache.get_stale("events", "B") is None
+            assert list(cache.values("events")) == []
+
+
+class TestSpondResponseCache:
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_get_events__cached_per_parameters(self, mock_get) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD, response_cache=ResponseCache())
+        s.token = MOCK_TOKEN
+        mock_get.side_effect = [
+            _response(body=[{"id": "EA"}]),
+            _response(body=[{"id": "EB"}]),
+        ]
+
+        a = await s.get_events(group_id="GA")
+        await s.get_events(group_id="GB")
+        again = await s.get_events(group_id="GA")
+
+        assert mock_get.call_count == 2
+        assert again is a
+        assert s.events is a
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_get_event__found_in_other_cached_response(self, mock_get) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD, response_cache=ResponseCache())
+        s.token = MOCK_TOKEN
+        mock_get.side_effect = [
+            _response(body=[{"id": "EB"}]),
+            _response(body=[{"id": "EA"}]),
+        ]
+        await s.get_events(group_id="GB")
+        await s.get_events(group_id="GA")
+
+        assert await s.get_event("EB") == {"id": "EB"}
+        assert mock_get.call_count == 2
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.put")
+    @patch("aiohttp.ClientSession.get")
+    async def test_change_response__invalidates_events(
+        self, mock_get, mock_put
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD, response_cache=ResponseCache())
+        s.token = MOCK_TOKEN
+        mock_get.side_effect = [_response(body=[]), _response(body=[])]
+        mock_put.return_value.__aenter__.return_value.json = AsyncMock(return_value={})
+
+        await s.get_events()
+        await s.change_response("EID1", "MID1", {"accepted": "true"})
+        await s.get_events()
+
+        assert mock_get.call_count == 2
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    async def test_update_event__merges_into_uncached_event(
+        self, mock_get, mock_post
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD, response_cache=ResponseCache())
+        s.token = MOCK_TOKEN
+        mock_get.side_effect = [
+            _response(body={"id": "EID1", "heading": "Old", "description": "A"}),
+            _response(body={"id": "EID1", "heading": "New", "description": "A"}),
+        ]
+        mock_post.return_value = _response(body={"id": "EID1"})
+
+        await s.fetch_event("EID1")
+        await s.update_event("EID1", {"description": "B"})
+
+        assert mock_get.call_count == 2
+        payload = mock_post.call_args.kwargs["json"]
+        assert payload["heading"] == "New"
+        assert payload["description"] == "B"
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_get_groups__error_response_not_cached(self, mock_get) -> None:
+        s = Spond(
+            MOCK_USERNAME,
+            MOCK_PASSWORD,
+            response_cache=ResponseCache(),
+            retry_policy=RetryPolicy(max_retries=0),
+        )
+        s.token = MOCK_TOKEN
+        mock_get.side_effect = [
+            _response(status=503, body={"error": "Service Unavailable"}),
+            _response(body=[{"id": "GID1"}]),
+        ]
+
+        assert await s.get_groups() == {"error": "Service Unavailable"}
+        groups = await s.get_groups()
+
+        assert groups == [{"id": "GID1"}]
+        assert mock_get.call_count == 2
+        assert await s.get_groups() is groups
+        assert mock_get.call_count == 2
+        await s.close()
+
+
+class TestConditionalRequests:
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_expired_entry__304_renews_cached_body(self, mock_get) -> None:
+        s = Spond(
+            MOCK_USERNAME,
+            MOCK_PASSWORD,
+            response_cache=ResponseCache(ttls={"groups": 10}),
+        )
+        s.token = MOCK_TOKEN
+        validators = {"ETag": '"v1"', "Last-Modified": "Mon, 12 Oct 2026 10:00:00 GMT"}
+        mock_get.side_effect = [
+            _response(headers=validators, body=[{"id": "GID1"}], size=5000),
+            _response(status=304),
+        ]
+
+        with patch("time.monotonic", return_value=1000.0):
+            first = await s.get_groups()
+        with patch("time.monotonic", return_value=1020.0):
+            second = await s.get_groups()
+            third = await s.get_groups()  # renewed, so no request
+
+        assert second is first and third is first
+        assert mock_get.call_count == 2
+        sent = mock_get.call_args_list[1].kwargs["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+        assert sent["If-Modified-Since"] == "Mon, 12 Oct 2026 10:00:00 GMT"
+        assert s.transfer_metrics.not_modified == 1
+        assert s.transfer_metrics.bytes_saved == 5000
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_expired_entry__changed_body_replaces_cached(self, mock_get) -> None:
+        cache = ResponseCache(ttls={"groups": 10})
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD, response_cache=cache)
+        s.token = MOCK_TOKEN
+        mock_get.side_effect = [
+            _response(headers={"ETag": '"v1"'}, body=[{"id": "GID1"}]),
+            _response(headers={"ETag": '"v2"'}, body=[{"id": "GID2"}]),
+            _response(status=304),
+        ]
+
+        with patch("time.monotonic", return_value=1000.0):
+            await s.get_groups()
+        with patch("time.monotonic", return_value=1020.0):
+            groups = await s.get_groups()
+        with patch("time.monotonic", return_value=1040.0):
+            assert await s.get_groups() is groups
+
+        assert groups == [{"id": "GID2"}]
+        sent = mock_get.call_args_list[2].kwargs["headers"]
+        assert sent["If-None-Match"] == '"v2"'
+        assert s.transfer_metrics.not_modified == 1
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_no_validators__refetched_unconditionally(self, mock_get) -> None:
+        s = Spond(
+            MOCK_USERNAME,
+            MOCK_PASSWORD,
+            response_cache=ResponseCache(ttls={"groups": 10}),
+        )
+        s.token = MOCK_TOKEN
+        mock_get.side_effect = [_response(body=[]), _response(body=[])]
+
+        with patch("time.monotonic", return_value=1000.0):
+            await s.get_groups()
+        with patch("time.monotonic", return_value=1020.0):
+            await s.get_groups()
+
+        sent = mock_get.call_args_list[1].kwargs["headers"]
+        assert "If-None-Match" not in sent
+        assert "If-Modified-Since" not in sent
+        await s.close()
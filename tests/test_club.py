@@ -0,0 +1,135 @@
+"""Test suite for SpondClub class."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from spond.club import SpondClub
+
+MOCK_USERNAME, MOCK_PASSWORD = "MOCK_USERNAME", "MOCK_PASSWORD"
+MOCK_TOKEN = "MOCK_TOKEN"
+
+
+def _mock_pages(mock_get, pages: list[list[dict]]) -> None:
+    """Make successive `ClientSession.get` calls return `pages` in order."""
+    mock_get.return_value.__aenter__.return_value.status = 200
+    mock_get.return_value.__aenter__.return_value.json = AsyncMock(side_effect=pages)
+
+
+def _transactions(start: int, count: int) -> list[dict]:
+    return [{"id": f"TID{i}"} for i in range(start, start + count)]
+
+
+def _fake_fetch(total: int, page_size: int = 25):
+    """Stand-in for `SpondClub._fetch_transactions` over `total` records that
+    answers out of order, recording offsets and peak concurrency."""
+    state = {"in_flight": 0, "peak": 0, "offsets": []}
+
+    async def fetch(club_id: str, skip: int) -> list[dict]:
+        state["offsets"].append(skip)
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        # Later pages answer first, so ordering must not depend on timing.
+        await asyncio.sleep(0.001 * (10 - skip // page_size % 10))
+        state["in_flight"] -= 1
+        return _transactions(skip, max(0, min(page_size, total - skip)))
+
+    return fetch, state
+
+
+class TestTransactionMethods:
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_iter_transactions__pages_until_empty(self, mock_get) -> None:
+        s = SpondClub(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = MOCK_TOKEN
+        _mock_pages(mock_get, [_transactions(0, 25), _transactions(25, 3), []])
+
+        transactions = [t async for t in s.iter_transactions(club_id="CID1")]
+
+        assert transactions == _transactions(0, 28)
+        params = [call.kwargs["params"] for call in mock_get.call_args_list]
+        assert params == [None, {"skip": 25}, {"skip": 28}]
+        assert s.transactions == {}
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_get_transactions__stops_at_max_items(self, mock_get) -> None:
+        s = SpondClub(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = MOCK_TOKEN
+        _mock_pages(mock_get, [_transactions(0, 25), _transactions(25, 25)])
+
+        transactions = await s.get_transactions(club_id="CID1", max_items=30)
+
+        assert transactions == _transactions(0, 30)
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_get_transactions__cache_keyed_by_club(self, mock_get) -> None:
+        s = SpondClub(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = MOCK_TOKEN
+        _mock_pages(mock_get, [_transactions(0, 2), [], _transactions(10, 1), []])
+
+        await s.get_transactions(club_id="CID1")
+        await s.get_transactions(club_id="CID2")
+
+        assert s.transactions == {
+            "CID1": _transactions(0, 2),
+            "CID2": _transactions(10, 1),
+        }
+        headers = [call.kwargs["headers"] for call in mock_get.call_args_list]
+        assert [h["X-Spond-Clubid"] for h in headers] == [
+            "CID1",
+            "CID1",
+            "CID2",
+            "CID2",
+        ]
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_get_transactions__error_status_returns_collected(
+        self, mock_get
+    ) -> None:
+        s = SpondClub(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = MOCK_TOKEN
+        mock_get.return_value.__aenter__.return_value.status = 403
+
+        transactions = await s.get_transactions(club_id="CID1")
+
+        assert transactions == []
+        assert s.transactions == {"CID1": []}
+
+    @pytest.mark.asyncio
+    async def test_iter_transactions__concurrent_pages_in_server_order(
+        self,
+    ) -> None:
+        s = SpondClub(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = MOCK_TOKEN
+        fetch, state = _fake_fetch(total=110)
+        s._fetch_transactions = fetch
+
+        transactions = [
+            t async for t in s.iter_transactions(club_id="CID1", concurrency=4)
+        ]
+
+        assert transactions == _transactions(0, 110)
+        assert state["peak"] == 4
+        # Two batches of four; the second stops at the empty page at 125.
+        assert sorted(state["offsets"]) == [0, 25, 50, 75, 100, 125, 150, 175]
+
+    @pytest.mark.asyncio
+    async def test_get_transactions__concurrent_respects_max_items(self) -> None:
+        s = SpondClub(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = MOCK_TOKEN
+        fetch, _ = _fake_fetch(total=1000)
+        s._fetch_transactions = fetch
+
+        transactions = await s.get_transactions(
+            club_id="CID1", max_items=60, concurrency=3
+        )
+
+        assert transactions == _transactions(0, 60)
@@ -0,0 +1,159 @@
+"""Test suite for the SQLite mirror."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from spond.club import SpondClub
+from spond.mirror import SQLiteMirror
+from spond.spond import Spond
+
+MOCK_USERNAME, MOCK_PASSWORD = "MOCK_USERNAME", "MOCK_PASSWORD"
+MOCK_TOKEN = "MOCK_TOKEN"
+
+GROUP = {
+    "id": "GID1",
+    "name": "Team",
+    "members": [
+        {"id": "MID1", "firstName": "Ola", "profile": {"id": "PID1"}},
+        {
+            "id": "MID2",
+            "firstName": "Kari",
+            "guardians": [{"id": "GUID1", "profile": {"id": "PID2"}}],
+        },
+    ],
+}
+
+
+def _event(uid: str, start: str, **extra) -> dict:
+    return {
+        "id": uid,
+        "startTimestamp": start,
+        "recipients": {"group": {"id": "GID1"}},
+        **extra,
+    }
+
+
+class TestSQLiteMirror:
+    def test_init__wal_mode(self, tmp_path) -> None:
+        with SQLiteMirror(tmp_path / "sub" / "mirror.db"):
+            pass
+
+        conn = sqlite3.connect(tmp_path / "sub" / "mirror.db")
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        conn.close()
+
+    def test_save_groups__members_and_guardians(self) -> None:
+        mirror = SQLiteMirror(":memory:")
+        mirror.save_groups([GROUP])
+        mirror.save_groups([{**GROUP, "members": GROUP["members"][1:]}])
+
+        assert mirror.group("GID1")["name"] == "Team"
+        assert [m["id"] for m in mirror.members("GID1")] == ["MID2"]
+        assert mirror.member("MID2")["firstName"] == "Kari"
+        assert mirror.guardians("MID2") == [{"id": "GUID1", "profile": {"id": "PID2"}}]
+        with pytest.raises(KeyError):
+            mirror.member("MID1")
+
+    def test_events__filtered_and_ordered_by_start(self) -> None:
+        mirror = SQLiteMirror(":memory:")
+        mirror.save_events(
+            [
+                _event("E3", "2026-03-01T10:00:00Z"),
+                _event("E1", "2026-01-01T10:00:00Z"),
+                _event("E2", "2026-02-01T10:00:00Z", cancelled=True),
+            ]
+        )
+
+        assert [e["id"] for e in mirror.events()] == ["E1", "E2", "E3"]
+        assert [
+            e["id"]
+            for e in mirror.events(
+                min_start=datetime(2026, 2, 1, 10, tzinfo=UTC),
+                max_start=datetime(2026, 3, 1, 10, tzinfo=UTC),
+            )
+        ] == ["E2", "E3"]
+        assert [e["id"] for e in mirror.events(include_cancelled=False)] == [
+            "E1",
+            "E3",
+        ]
+        assert mirror.events(group_id="GID2") == []
+
+    def test_responses__by_event_and_by_member(self) -> None:
+        mirror = SQLiteMirror(":memory:")
+        responses = {"acceptedIds": ["MID1"], "declinedIds": ["MID2"], "votes": {}}
+        mirror.save_events([_event("E1", "2026-01-01T10:00:00Z", responses=responses)])
+        mirror.save_responses("E1", {"acceptedIds": ["MID1", "MID2"]})
+
+        assert mirror.responses("E1") == {"MID1": "accepted", "MID2": "accepted"}
+        assert mirror.member_responses("MID2") == {"E1": "accepted"}
+        assert mirror.event("E1")["responses"] == {"acceptedIds": ["MID1", "MID2"]}
+
+    def test_clear__empties_mirror(self) -> None:
+        mirror = SQLiteMirror(":memory:")
+        mirror.save_groups([GROUP])
+        mirror.save_transactions("CID1", [{"id": "TID1"}])
+
+        mirror.clear()
+
+        assert mirror.groups() == []
+        assert mirror.transactions("CID1") == []
+
+
+class TestWriteThrough:
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_get_groups_and_events__written_to_mirror(self, mock_get) -> None:
+        mirror = SQLiteMirror(":memory:")
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD, mirror=mirror)
+        s.token = MOCK_TOKEN
+        event = _event("E1", "2026-01-01T10:00:00Z", responses={"acceptedIds": []})
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(
+            side_effect=[[GROUP], [event]]
+        )
+
+        await s.get_groups()
+        await s.get_events()
+
+        assert mirror.groups() == [GROUP]
+        assert mirror.events() == [event]
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_get_groups__error_response_not_written(self, mock_get) -> None:
+        mirror = SQLiteMirror(":memory:")
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD, mirror=mirror)
+        s.token = MOCK_TOKEN
+        response = mock_get.return_value.__aenter__.return_value
+        response.status = 404
+        response.ok = False
+        response.json = AsyncMock(return_value={"error": "Not Found"})
+
+        assert await s.get_groups() == {"error": "Not Found"}
+        assert mirror.groups() == []
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_get_transactions__written_to_mirror(self, mock_get) -> None:
+        mirror = SQLiteMirror(":memory:")
+        s = SpondClub(MOCK_USERNAME, MOCK_PASSWORD, mirror=mirror)
+        s.token = MOCK_TOKEN
+        transactions = [
+            {"id": "TID1", "paidAt": "2026-01-01T10:00:00Z"},
+            {"id": "TID2", "paidAt": "2026-02-01T10:00:00Z"},
+        ]
+        mock_get.return_value.__aenter__.return_value.status = 200
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(
+            side_effect=[transactions, []]
+        )
+
+        await s.get_transactions(club_id="CID1")
+
+        assert mirror.transactions("CID1") == transactions[::-1]
+        await s.close()
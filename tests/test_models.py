@@ -0,0 +1,87 @@
+"""Test suite for the typed models."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from spond.models import Event, Group, Member, Transaction
+
+MEMBER = {
+    "id": "MID1",
+    "firstName": "Ola",
+    "lastName": "Nordmann",
+    "profile": {"id": "PID1"},
+    "subGroups": ["SGID1"],
+    "roles": [],
+    "guardians": [{"id": "GUID1", "firstName": "Kari", "lastName": "Nordmann"}],
+    "createdTime": "2020-01-01T00:00:00Z",
+}
+GROUP = {
+    "id": "GID1",
+    "name": "Team",
+    "members": [MEMBER, {"id": "MID2", "firstName": "Per"}],
+    "subGroups": [{"id": "SGID1", "name": "Juniors"}],
+}
+
+
+class TestModels:
+    def test_raw__round_trips_including_unknown_keys(self) -> None:
+        group = Group(GROUP)
+
+        assert group.raw == GROUP
+        assert Member(MEMBER).raw["createdTime"] == "2020-01-01T00:00:00Z"
+        assert Group.from_list([GROUP, GROUP])[1] == group
+        assert Group.from_list(None) == []
+
+    def test_attributes(self) -> None:
+        group = Group(GROUP)
+        member = group.member("MID1")
+
+        assert member.full_name == "Ola Nordmann"
+        assert member.profile_id == "PID1"
+        assert member.profile == {"id": "PID1"}
+        assert member.subgroups == ("SGID1",)
+        assert member.guardians[0].last_name == "Nordmann"
+        assert member.guardians[0].profile_id is None
+        other = group.member("MID2")
+        assert other.last_name is None
+        assert "lastName" not in other.raw
+        with pytest.raises(KeyError):
+            group.member("UNKNOWN")
+
+    def test_shares_repeated_values(self) -> None:
+        first, second = Group(GROUP).members[0], Group(GROUP).members[0]
+
+        assert first.subgroups is second.subgroups
+        assert first.last_name is first.guardians[0].last_name
+
+    def test_lists_of_non_scalars__kept_as_lists(self) -> None:
+        member = Member({**MEMBER, "roles": [{"id": "RID1"}]})
+
+        assert member.roles == [{"id": "RID1"}]
+        assert member.raw["roles"] == [{"id": "RID1"}]
+
+    def test_timestamps__parsed_on_access(self) -> None:
+        event = Event(
+            {
+                "id": "E1",
+                "startTimestamp": "2026-01-01T10:00:00Z",
+                "recipients": {"group": {"id": "GID1"}},
+            }
+        )
+
+        assert event.start == datetime(2026, 1, 1, 10, tzinfo=UTC)
+        assert event.meetup is None
+        assert event.group_id == "GID1"
+        assert event.raw["startTimestamp"] == "2026-01-01T10:00:00Z"
+        assert Transaction({"paidAt": "2026-02-01T00:00:00Z"}).paid_at.month == 2
+
+    def test_read_only(self) -> None:
+        member = Member(MEMBER)
+
+        with pytest.raises(AttributeError):
+            member.first_name = "Kari"
+        with pytest.raises(AttributeError):
+            member.nickname = "Kari"
@@ -0,0 +1,63 @@
+"""Test suite for client-side rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from spond.rate_limit import TokenBucket
+from spond.spond import Spond
+
+MOCK_USERNAME, MOCK_PASSWORD = "MOCK_USERNAME", "MOCK_PASSWORD"
+MOCK_TOKEN = "MOCK_TOKEN"
+
+
+class TestTokenBucket:
+    @pytest.mark.parametrize(("rate", "burst"), [(0, 1), (-1, 1), (1, 0)])
+    def test_invalid_settings__raise(self, rate, burst) -> None:
+        with pytest.raises(ValueError):
+            TokenBucket(rate=rate, burst=burst)
+
+    @pytest.mark.asyncio
+    async def test_acquire__burst_then_sustained_rate(self) -> None:
+        bucket = TokenBucket(rate=100, burst=3)
+
+        started = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+        burst_elapsed = time.monotonic() - started
+        await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+        total_elapsed = time.monotonic() - started
+
+        assert burst_elapsed < 0.01
+        # Five more tokens at 100/s need at least 50 ms of refill.
+        assert total_elapsed >= 0.045
+
+
+class TestClientRateLimiting:
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_requests_wait_on_matching_limiter(self, mock_get) -> None:
+        core, chat = TokenBucket(rate=1000), TokenBucket(rate=1000)
+        core.acquire = AsyncMock()
+        chat.acquire = AsyncMock()
+        s = Spond(
+            MOCK_USERNAME,
+            MOCK_PASSWORD,
+            rate_limiter=core,
+            chat_rate_limiter=chat,
+        )
+        s.token = MOCK_TOKEN
+        s._chat_url = "https://chat.example.invalid"
+        s._auth = "MOCK_CHAT_AUTH"
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(return_value=[])
+
+        await s.get_groups()
+        await s.get_profile()
+        await s.get_messages()
+
+        assert core.acquire.await_count == 2
+        assert chat.acquire.await_count == 1
+        await s.close()
@@ -0,0 +1,129 @@
+"""Test suite for request retries."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+
+from spond.retry import RetryPolicy
+from spond.spond import Spond
+
+MOCK_USERNAME, MOCK_PASSWORD = "MOCK_USERNAME", "MOCK_PASSWORD"
+MOCK_TOKEN = "MOCK_TOKEN"
+
+
+def _response(status: int, headers: dict | None = None, body=None) -> MagicMock:
+    """A `ClientSession.get(...)` return value usable with `async with`."""
+    response = MagicMock(status=status, ok=status < 400, headers=headers or {})
+    response.json = AsyncMock(return_value=body)
+    response.text = AsyncMock(return_value=str(body))
+    cm = MagicMock()
+    cm.__aenter__ = AsyncMock(return_value=response)
+    cm.__aexit__ = AsyncMock(return_value=False)
+    return cm
+
+
+class TestRetryPolicy:
+    def test_delay__grows_exponentially_within_cap(self) -> None:
+        policy = RetryPolicy(backoff_base=1.0, max_delay=5.0)
+
+        with patch("random.uniform", side_effect=lambda lo, hi: hi):
+            delays = [policy.delay(retry) for retry in range(5)]
+
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    @pytest.mark.parametrize(
+        ("retry_after", "expected"),
+        [("7", 7.0), ("1.5", 1.5), ("-3", 0.0), ("soon", 0.0), (None, 0.0)],
+    )
+    def test_delay__honours_retry_after_seconds(self, retry_after, expected) -> None:
+        policy = RetryPolicy(backoff_base=0.0)
+
+        assert policy.delay(0, retry_after) == expected
+
+    def test_delay__honours_retry_after_http_date(self) -> None:
+        policy = RetryPolicy(backoff_base=0.0)
+        when = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+
+        assert 25 < policy.delay(0, when) <= 30
+
+    def test_delay__retry_after_capped(self) -> None:
+        policy = RetryPolicy(backoff_base=0.0, max_delay=10.0)
+
+        assert policy.delay(0, "3600") == 10.0
+
+
+@patch("spond.base.asyncio.sleep", new_callable=AsyncMock)
+class TestRequestRetries:
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_get__retries_transient_statuses(self, mock_get, mock_sleep) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = MOCK_TOKEN
+        mock_get.side_effect = [
+            _response(429, {"Retry-After": "2"}),
+            _response(503),
+            _response(200, body=[{"id": "GID1"}]),
+        ]
+
+        groups = await s.get_groups()
+
+        assert groups == [{"id": "GID1"}]
+        assert mock_get.call_count == 3
+        assert mock_sleep.await_args_list[0].args == (2.0,)
+        assert s.retry_metrics.retries == 2
+        assert s.retry_metrics.reasons == {429: 1, 503: 1}
+        assert s.retry_metrics.exhausted == 0
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_get__gives_up_after_max_retries(self, mock_get, mock_sleep) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD, retry_policy=RetryPolicy(max_retries=2))
+        s.token = MOCK_TOKEN
+        mock_get.side_effect = [_response(500) for _ in range(3)]
+
+        with pytest.raises(ValueError, match="500"):
+            await s.get_events()
+
+        assert mock_get.call_count == 3
+        assert s.retry_metrics.retries == 2
+        assert s.retry_metrics.exhausted == 1
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_get__retries_connection_errors(self, mock_get, mock_sleep) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = MOCK_TOKEN
+        mock_get.side_effect = [
+            aiohttp.ServerDisconnectedError(),
+            _response(200, body={"id": "PROFILE"}),
+        ]
+
+        assert await s.get_profile() == {"id": "PROFILE"}
+        assert s.retry_metrics.reasons == {"ServerDisconnectedError": 1}
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    async def test_post__not_retried_by_default(
+        self, mock_get, mock_post, mock_sleep
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = MOCK_TOKEN
+        mock_get.return_value = _response(200, body={"id": "EID1"})
+        mock_post.side_effect = [_response(503, body={"error": "unavailable"})]
+
+        result = await s.update_event("EID1", {"heading": "New"})
+
+        assert result == {"error": "unavailable"}
+        mock_post.assert_called_once()
+        mock_sleep.assert_not_awaited()
+        assert s.retry_metrics.retries == 0
+        await s.close()
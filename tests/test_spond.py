@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import json
+import threading
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiohttp
 import pytest
 
 from spond import AuthenticationError
-from spond.base import _SpondBase
+from spond.base import ConnectionOptions, DecodeOptions, _SpondBase
+from spond.club import SpondClub
 from spond.spond import Spond
+from spond.token_store import FileTokenStore, StoredToken
 
 if TYPE_CHECKING:
     from spond import JSONDict
@@ -20,6 +28,21 @@ MOCK_TOKEN = "MOCK_TOKEN"
 MOCK_PAYLOAD = {"accepted": "false", "declineMessage": "sick cannot make it"}
 
 
+class _CleanupClient(Spond):
+    """Has a decorated generator recording whether its cleanup ran. Defined
+    before the decorator is mocked out below."""
+
+    cleaned_up = False
+
+    @_SpondBase.require_authentication
+    async def numbers(self):
+        try:
+            yield 1
+            yield 2
+        finally:
+            self.cleaned_up = True
+
+
 # Mock the `require_authentication` decorator to bypass authentication
 def mock_require_authentication(func):
     async def wrapper(*args, **kwargs):
@@ -113,16 +136,90 @@ class TestEventMethods:
         with pytest.raises(KeyError):
             await s.get_event("ID1")
 
+    @pytest.mark.asyncio
+    async def test_get_event__index_rebuilt_when_events_replaced(
+        self, mock_events: list[JSONDict], mock_token
+    ) -> None:
+        """Replacing `self.events` must not leave stale lookups behind."""
+
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.events = mock_events
+        s.token = mock_token
+        assert (await s.get_event("ID1"))["name"] == "Event One"
+
+        s.events = [{"id": "ID1", "name": "Event One (moved)"}]
+
+        assert (await s.get_event("ID1"))["name"] == "Event One (moved)"
+        with pytest.raises(KeyError):
+            await s.get_event("ID2")
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_iter_events__pages_from_last_start_timestamp(
+        self, mock_get, mock_token
+    ) -> None:
+        """Each page starts at the previous page's last `startTimestamp`;
+        events repeated on that boundary are yielded once."""
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = mock_token
+
+        e1 = {"id": "ID1", "startTimestamp": "2026-01-01T10:00:00Z"}
+        e2 = {"id": "ID2", "startTimestamp": "2026-01-02T10:00:00Z"}
+        e3 = {"id": "ID3", "startTimestamp": "2026-01-03T10:00:00Z"}
+        mock_get.return_value.__aenter__.return_value.ok = True
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(
+            side_effect=[[e1, e2], [e2, e3], [e3]]
+        )
+
+        events = [e async for e in s.iter_events(group_id="GID1", page_size=2)]
+
+        assert events == [e1, e2, e3]
+        params = [call.kwargs["params"] for call in mock_get.call_args_list]
+        assert [p.get("minStartTimestamp") for p in params] == [
+            None,
+            "2026-01-02T10:00:00Z",
+            "2026-01-03T10:00:00Z",
+        ]
+        assert all(p["groupId"] == "GID1" and p["order"] == "asc" for p in params)
+        assert s.events is None
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_iter_events__widens_page_when_no_progress(
+        self, mock_get, mock_token
+    ) -> None:
+        """A full page that only repeats boundary events must not be
+        requested again unchanged."""
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = mock_token
+
+        ts = "2026-01-01T10:00:00Z"
+        e1, e2, e3 = ({"id": f"ID{i}", "startTimestamp": ts} for i in (1, 2, 3))
+        mock_get.return_value.__aenter__.return_value.ok = True
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(
+            side_effect=[[e1, e2], [e1, e2], [e1, e2, e3]]
+        )
+
+        events = [e async for e in s.iter_events(page_size=2)]
+
+        assert events == [e1, e2, e3]
+        params = [call.kwargs["params"] for call in mock_get.call_args_list]
+        assert [p["max"] for p in params] == ["2", "2", "4"]
+
     @pytest.mark.asyncio
     @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
     async def test_update_event__returns_api_response(
-        self, mock_post, mock_token
+        self, mock_get, mock_post, mock_token
     ) -> None:
         """`update_event()` should return the POST response, not the cached
         events list (regression test for #239)."""
         s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
         s.token = mock_token
-        s.events = [{"id": "ID1", "heading": "Old"}]  # cached event for _get_entity
+        s.events = [{"id": "ID1", "heading": "Old"}]
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value={"id": "ID1", "heading": "Old"}
+        )
 
         api_response = {
             "id": "ID1",
@@ -138,6 +235,7 @@ class TestEventMethods:
         assert result == api_response
         # The cached events list should NOT be what we returned.
         assert result is not s.events
+        assert s.events == [api_response]
 
     @pytest.mark.asyncio
     @patch("aiohttp.ClientSession.put")
@@ -171,6 +269,101 @@ class TestEventMethods:
         )
         assert response == mock_response_data
 
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    async def test_update_event__event_fetched_directly(
+        self, mock_get, mock_post, mock_token
+    ) -> None:
+        """The event is fetched on its own rather than via a list of
+        events."""
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = mock_token
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value={"id": "ID9", "heading": "Old"}
+        )
+        mock_post.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value={"id": "ID9"}
+        )
+
+        await s.update_event(uid="ID9", updates={"description": "New"})
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args.args[0] == "https://api.spond.com/core/v1/sponds/ID9"
+        body = mock_post.call_args.kwargs["json"]
+        assert (body["heading"], body["description"]) == ("Old", "New")
+        assert s.events is None
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    async def test_update_event__deep_merges_without_sharing_state(
+        self, mock_get, mock_post, mock_token
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = mock_token
+        location = {"id": "LID1", "feature": "Hall A", "address": "Street 1"}
+        event = {"id": "ID1", "heading": "Old", "location": location}
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value=event
+        )
+        mock_post.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value={"id": "ID1"}
+        )
+
+        await s.update_event(
+            uid="ID1",
+            updates={"location": {"feature": "Hall B"}, "commentsDisabled": True},
+        )
+
+        body = mock_post.call_args.kwargs["json"]
+        assert body["location"] == {
+            "id": "LID1",
+            "feature": "Hall B",
+            "address": "Street 1",
+        }
+        assert body["heading"] == "Old"
+        assert body["commentsDisabled"] is True
+        body["tasks"]["assignedTasks"].clear()
+        assert location["feature"] == "Hall A"
+        assert s._EVENT_TEMPLATE["tasks"]["assignedTasks"]
+        assert s._EVENT_TEMPLATE["location"]["feature"] is None
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    async def test_update_event__consecutive_updates_keep_earlier_changes(
+        self, mock_get, mock_post, mock_token
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = mock_token
+        server = {"id": "ID1", "heading": "H1", "description": "old"}
+        s.events = [dict(server)]
+
+        async def current():
+            return dict(server)
+
+        def post(url, **kwargs):
+            server.update(kwargs["json"], id="ID1")
+            response = MagicMock(status=200, ok=True)
+            response.json = AsyncMock(return_value=dict(server))
+            cm = MagicMock()
+            cm.__aenter__ = AsyncMock(return_value=response)
+            cm.__aexit__ = AsyncMock(return_value=False)
+            return cm
+
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(
+            side_effect=current
+        )
+        mock_post.side_effect = post
+
+        await s.update_event("ID1", {"description": "new"})
+        await s.update_event("ID1", {"heading": "H2"})
+
+        assert (server["heading"], server["description"]) == ("H2", "new")
+        assert s.events[0]["description"] == "new"
+        assert (await s.get_event("ID1"))["heading"] == "H2"
+
 
 class TestGroupMethods:
     @pytest.fixture
@@ -245,11 +438,112 @@ class TestGroupMethods:
             await s.get_group("ID1")
 
 
+class TestPersonMethods:
+    @pytest.fixture
+    def mock_groups(self) -> list[JSONDict]:
+        """Mock groups with a guardian and a name shared across groups."""
+        return [
+            {
+                "id": "GID1",
+                "members": [
+                    {
+                        "id": "MID1",
+                        "firstName": "Ola",
+                        "lastName": "Thoresen",
+                        "email": "ola@example.invalid",
+                        "profile": {"id": "PID1"},
+                        "guardians": [
+                            {
+                                "id": "GUID1",
+                                "firstName": "Kari",
+                                "lastName": "Thoresen",
+                                "profile": {"id": "PID2"},
+                            },
+                        ],
+                    },
+                ],
+            },
+            {
+                "id": "GID2",
+                "members": [
+                    {
+                        "id": "MID2",
+                        "firstName": "Ola",
+                        "lastName": "Thoresen",
+                    },
+                ],
+            },
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("identifier", "expected_id"),
+        [
+            ("MID1", "MID1"),
+            ("ola@example.invalid", "MID1"),
+            ("PID1", "MID1"),
+            ("GUID1", "GUID1"),
+            ("Kari Thoresen", "GUID1"),
+            ("PID2", "GUID1"),
+            ("MID2", "MID2"),
+        ],
+    )
+    async def test_get_person__matches_each_identifier(
+        self, mock_groups: list[JSONDict], mock_token, identifier, expected_id
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.groups = mock_groups
+        s.token = mock_token
+
+        person = await s.get_person(identifier)
+
+        assert person["id"] == expected_id
+
+    @pytest.mark.asyncio
+    async def test_get_person__first_match_wins(
+        self, mock_groups: list[JSONDict], mock_token
+    ) -> None:
+        """A full name shared by two members resolves to the first one."""
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.groups = mock_groups
+        s.token = mock_token
+
+        person = await s.get_person("Ola Thoresen")
+
+        assert person["id"] == "MID1"
+
+    @pytest.mark.asyncio
+    async def test_get_person__no_match_raises_exception(
+        self, mock_groups: list[JSONDict], mock_token
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.groups = mock_groups
+        s.token = mock_token
+
+        with pytest.raises(KeyError):
+            await s.get_person("Nobody")
+
+    @pytest.mark.asyncio
+    async def test_get_person__index_rebuilt_when_groups_replaced(
+        self, mock_groups: list[JSONDict], mock_token
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.groups = mock_groups
+        s.token = mock_token
+        assert (await s.get_person("Ola Thoresen"))["id"] == "MID1"
+
+        s.groups = mock_groups[1:]
+
+        assert (await s.get_person("Ola Thoresen"))["id"] == "MID2"
+        with pytest.raises(KeyError):
+            await s.get_person("MID1")
+
+
 class TestSendMessage:
     """Tests for `Spond.send_message()` — covers the fixes in #238."""
 
     @pytest.mark.asyncio
-    @patch("aiohttp.ClientSession.post", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.post")
     async def test_send_message__continues_chat_when_chat_id_given(
         self, mock_post, mock_token
     ) -> None:
@@ -261,9 +555,9 @@ class TestSendMessage:
         s._chat_url = "https://chat.example.invalid"
 
         api_response = {"ok": True, "messageId": "MID1"}
-        # _continue_chat does `r = await session.post(...)` (no `async with`),
-        # so the post mock must be AsyncMock and r.json must be AsyncMock too.
-        mock_post.return_value.json = AsyncMock(return_value=api_response)
+        mock_post.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value=api_response
+        )
 
         result = await s.send_message(text="hello", chat_id="CHAT1")
 
@@ -431,12 +725,19 @@ class TestPostMethods:
         assert call_params["includeComments"] == "false"
 
     @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
-    async def test_get_posts__api_error_raises(self, mock_get, mock_token) -> None:
-        """Test that a failed API response raises ValueError."""
+    async def test_get_posts__api_error_raises(
+        self, mock_get, mock_post, mock_token
+    ) -> None:
+        """Test that a failed API response raises ValueError (a 401 that
+        persists after the one re-login attempt included)."""
         s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
         s.token = mock_token
 
+        mock_post.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value={"accessToken": {"token": "NEW"}}
+        )
         mock_get.return_value.__aenter__.return_value.ok = False
         mock_get.return_value.__aenter__.return_value.status = 401
         mock_get.return_value.__aenter__.return_value.text = AsyncMock(
@@ -445,6 +746,7 @@ class TestPostMethods:
 
         with pytest.raises(ValueError, match="401"):
             await s.get_posts()
+        assert mock_get.call_count == 2
 
 
 class TestLogin:
@@ -512,6 +814,7 @@ class TestLogin:
             json={"email": MOCK_USERNAME, "password": MOCK_PASSWORD},
         )
         assert s.token == "ABC"
+        assert s.token_expiration == datetime(2026, 5, 14, 12, 0, tzinfo=UTC)
 
     @pytest.mark.asyncio
     @patch("aiohttp.ClientSession.post")
@@ -526,6 +829,374 @@ class TestLogin:
         assert s.token is None
 
 
+class TestSession:
+    @pytest.mark.asyncio
+    async def test_close__closes_owned_session(self) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+
+        await s.close()
+
+        assert s.clientsession.closed
+
+    @pytest.mark.asyncio
+    async def test_close__leaves_shared_session_open(self) -> None:
+        session = aiohttp.ClientSession()
+        async with (
+            Spond(MOCK_USERNAME, MOCK_PASSWORD, session=session) as s,
+            SpondClub(MOCK_USERNAME, MOCK_PASSWORD, session=session) as sc,
+        ):
+            assert s.clientsession is sc.clientsession is session
+
+        assert not session.closed
+        await session.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.post")
+    async def test_failed_login__leaves_shared_session_open(self, mock_post) -> None:
+        mock_post.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value={"error": "Invalid credentials"}
+        )
+        session = aiohttp.ClientSession()
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD, session=session)
+
+        with pytest.raises(AuthenticationError):
+            await s.get_profile()
+
+        assert not session.closed
+        await session.close()
+
+    @pytest.mark.asyncio
+    async def test_connection_options__applied_to_connector(self) -> None:
+        options = ConnectionOptions(limit=7, limit_per_host=3, ttl_dns_cache=60)
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD, connection_options=options)
+
+        connector = s.clientsession.connector
+        assert (connector.limit, connector.limit_per_host) == (7, 3)
+        await s.close()
+
+    @pytest.mark.asyncio
+    async def test_session_and_connection_options__raises(self) -> None:
+        session = aiohttp.ClientSession()
+        with pytest.raises(ValueError, match="not both"):
+            Spond(
+                MOCK_USERNAME,
+                MOCK_PASSWORD,
+                session=session,
+                connection_options=ConnectionOptions(),
+            )
+        await session.close()
+
+
+class TestDecoding:
+    @staticmethod
+    def _response(body: bytes, content_length: int | None) -> MagicMock:
+        response = MagicMock(content_length=content_length)
+        response.content_type = "application/json"
+        response.read = AsyncMock(return_value=body)
+        response.text = AsyncMock(return_value=body.decode())
+        response.json = AsyncMock(side_effect=lambda loads: loads(body.decode()))
+        return response
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("content_length", [11, None])
+    async def test_small_body__decoded_on_loop(self, content_length) -> None:
+        calls = []
+
+        def loads(body):
+            calls.append(threading.current_thread())
+            return json.loads(body)
+
+        s = Spond(
+            MOCK_USERNAME,
+            MOCK_PASSWORD,
+            decode_options=DecodeOptions(loads=loads, offload_threshold=100),
+        )
+
+        result = await s._read_json(self._response(b'{"id": "X"}', content_length))
+
+        assert result == {"id": "X"}
+        assert calls == [threading.main_thread()]
+        await s.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("content_length", [1000, None])
+    async def test_large_body__decoded_in_worker_thread(self, content_length) -> None:
+        calls = []
+
+        def loads(body):
+            calls.append(threading.current_thread())
+            return json.loads(body)
+
+        s = Spond(
+            MOCK_USERNAME,
+            MOCK_PASSWORD,
+            decode_options=DecodeOptions(loads=loads, offload_threshold=100),
+        )
+        body = json.dumps([{"id": f"ID{i}"} for i in range(100)]).encode()
+
+        result = await s._read_json(self._response(body, content_length))
+
+        assert len(result) == 100
+        assert len(calls) == 1 and calls[0] is not threading.main_thread()
+        await s.close()
+
+    @pytest.mark.asyncio
+    async def test_empty_chunked_body__none(self) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+
+        assert await s._read_json(self._response(b"  ", None)) is None
+        await s.close()
+
+
+class TestTokenRefresh:
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    async def test_401__relogs_in_once_and_replays(self, mock_get, mock_post) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = "STALE"
+        mock_post.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value={"accessToken": {"token": "NEW"}}
+        )
+        response = mock_get.return_value.__aenter__.return_value
+        statuses = iter([401, 200])
+        mock_get.return_value.__aenter__.side_effect = lambda: _set_status(
+            response, next(statuses)
+        )
+        response.json = AsyncMock(return_value={"id": "PROFILE"})
+
+        profile = await s.get_profile()
+
+        assert profile == {"id": "PROFILE"}
+        mock_post.assert_called_once()
+        sent_tokens = [
+            c.kwargs["headers"]["Authorization"] for c in mock_get.call_args_list
+        ]
+        assert sent_tokens == ["Bearer STALE", "Bearer NEW"]
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    async def test_expired_token__logs_in_before_request(
+        self, mock_get, mock_post
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = "STALE"
+        s.token_expiration = datetime.now(UTC) - timedelta(seconds=1)
+        mock_post.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value={"accessToken": {"token": "NEW"}}
+        )
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(return_value={})
+
+        await s.get_profile()
+
+        mock_post.assert_called_once()
+        headers = mock_get.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Bearer NEW"
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    async def test_nearly_expired_token__refreshes_in_background(
+        self, mock_get, mock_post
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = "OLD"
+        s.token_expiration = datetime.now(UTC) + timedelta(minutes=5)
+        mock_post.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value={"accessToken": {"token": "NEW"}}
+        )
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(return_value={})
+
+        await s.get_profile()
+
+        # The call itself went out with the still-valid token...
+        headers = mock_get.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Bearer OLD"
+        # ...while a fresh one was fetched alongside it.
+        await s._refresh_task
+        assert s.token == "NEW"
+        await s.close()
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    @patch("aiohttp.ClientSession.post")
+    async def test_concurrent_calls_on_cold_client__log_in_once(
+        self, mock_post, mock_get
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+
+        async def slow_login_response():
+            await asyncio.sleep(0.01)
+            return {"accessToken": {"token": "ABC"}}
+
+        mock_post.return_value.__aenter__.return_value.json = AsyncMock(
+            side_effect=slow_login_response
+        )
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(return_value={})
+
+        # Distinct requests, so they aren't coalesced into one GET.
+        await asyncio.gather(*(s.get_posts(max_posts=i) for i in range(50)))
+
+        mock_post.assert_called_once()
+        assert mock_get.call_count == 50
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.post")
+    async def test_concurrent_failed_login__raises_for_every_caller(
+        self, mock_post
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        mock_post.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value={"error": "Invalid credentials"}
+        )
+
+        results = await asyncio.gather(
+            *(s.get_profile() for _ in range(5)), return_exceptions=True
+        )
+
+        mock_post.assert_called_once()
+        assert all(isinstance(r, AuthenticationError) for r in results)
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_concurrent_chat_calls__handshake_once(
+        self, mock_get, mock_token
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = mock_token
+        handshakes = 0
+
+        async def login_chat():
+            nonlocal handshakes
+            handshakes += 1
+            await asyncio.sleep(0.01)
+            s._chat_url = "https://chat.example.invalid"
+            s._auth = "MOCK_CHAT_AUTH"
+
+        s._login_chat = login_chat
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(return_value=[])
+
+        await asyncio.gather(*(s.get_messages() for _ in range(20)))
+
+        assert handshakes == 1
+        await s.close()
+
+
+class TestRequestCoalescing:
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_identical_concurrent_gets__share_one_request(
+        self, mock_get, mock_token
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = mock_token
+
+        async def slow_groups():
+            await asyncio.sleep(0.01)
+            return [{"id": "GID1"}]
+
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(
+            side_effect=slow_groups
+        )
+
+        results = await asyncio.gather(*(s.get_groups() for _ in range(10)))
+
+        mock_get.assert_called_once()
+        assert all(r is results[0] for r in results)
+        assert s.groups is results[0]
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_different_params__not_coalesced(self, mock_get, mock_token) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = mock_token
+        mock_get.return_value.__aenter__.return_value.ok = True
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(return_value=[])
+
+        await asyncio.gather(
+            s.get_events(group_id="GID1"),
+            s.get_events(group_id="GID1"),
+            s.get_events(group_id="GID2"),
+        )
+
+        assert mock_get.call_count == 2
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_sequential_gets__not_coalesced(self, mock_get, mock_token) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = mock_token
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(return_value=[])
+
+        await s.get_groups()
+        await s.get_groups()
+
+        assert mock_get.call_count == 2
+        await s.close()
+
+
+def _set_status(response, status: int):
+    response.status = status
+    return response
+
+
+class TestTokenStore:
+    LOGIN_RESPONSE: JSONDict = {
+        "accessToken": {"token": "NEW", "expiration": "2099-01-01T00:00:00Z"},
+    }
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    @patch("aiohttp.ClientSession.post")
+    async def test_valid_stored_token__skips_login(
+        self, mock_post, mock_get, tmp_path
+    ) -> None:
+        store = FileTokenStore(tmp_path / "tokens.json")
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD, token_store=store)
+        expiration = datetime.now(UTC) + timedelta(hours=1)
+        store.save(s._token_store_key, StoredToken("STORED", expiration))
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(return_value={})
+
+        await s.get_profile()
+
+        mock_post.assert_not_called()
+        assert s.token == "STORED"
+        assert s.token_expiration == expiration
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    @patch("aiohttp.ClientSession.post")
+    async def test_expired_stored_token__logs_in_and_saves(
+        self, mock_post, mock_get, tmp_path
+    ) -> None:
+        store = FileTokenStore(tmp_path / "tokens.json")
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD, token_store=store)
+        expired = datetime.now(UTC) - timedelta(seconds=1)
+        store.save(s._token_store_key, StoredToken("STALE", expired))
+        mock_post.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value=self.LOGIN_RESPONSE
+        )
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(return_value={})
+
+        await s.get_profile()
+
+        mock_post.assert_called_once()
+        assert s.token == "NEW"
+        assert store.load(s._token_store_key) == StoredToken(
+            "NEW", datetime(2099, 1, 1, tzinfo=UTC)
+        )
+        await s.close()
+
+
 class TestRequireAuthenticationDecorator:
     """The `require_authentication` decorator must preserve the wrapped
     method's metadata (signature, docstring, name) so `inspect`-based
@@ -553,3 +1224,25 @@ class TestRequireAuthenticationDecorator:
     def test_decorator_preserves_name(self) -> None:
         """`__name__` must be the method's, not 'wrapper'."""
         assert Spond.get_events.__name__ == "get_events"
+
+    def test_decorator_preserves_async_generators(self) -> None:
+        """Decorated async-generator methods must stay async generators so
+        they can be used with `async for`."""
+        import inspect
+
+        assert inspect.isasyncgenfunction(Spond.iter_events)
+        assert Spond.iter_events.__name__ == "iter_events"
+
+    @pytest.mark.asyncio
+    async def test_decorator_closes_wrapped_generator(self, mock_token) -> None:
+        """Closing a decorated generator early must run the wrapped
+        generator's cleanup straight away, not when it is garbage
+        collected."""
+        s = _CleanupClient(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = mock_token
+        async with contextlib.aclosing(s.numbers()) as numbers:
+            async for _ in numbers:
+                break
+
+        assert s.cleaned_up
+        await s.close()
@@ -0,0 +1,93 @@
+"""Test suite for incremental attendance statistics."""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import UTC, datetime
+
+import pytest
+
+from spond.stats import AttendanceStats
+from spond.sync import EventChanges
+
+GROUPS = [
+    {
+        "id": "GID1",
+        "members": [
+            {"id": "MID1", "subGroups": ["SGID1"]},
+            {"id": "MID2", "subGroups": ["SGID1", "SGID2"]},
+            {"id": "MID3"},
+        ],
+    }
+]
+
+
+def _event(uid: str, day: int, accepted: list, declined: list, **extra) -> dict:
+    return {
+        "id": uid,
+        "startTimestamp": f"2026-01-{day:02d}T10:00:00Z",
+        "recipients": {"group": {"id": "GID1"}},
+        "responses": {"acceptedIds": accepted, "declinedIds": declined},
+        **extra,
+    }
+
+
+class TestAttendanceStats:
+    def test_counts_and_rates(self) -> None:
+        stats = AttendanceStats(GROUPS)
+        stats.add(_event("E1", 1, ["MID1", "MID2"], ["MID3"]))
+        stats.add(_event("E2", 8, ["MID1"], ["MID2"]))
+
+        assert len(stats) == 2
+        assert stats.counts() == Counter({"accepted": 3, "declined": 2})
+        assert stats.counts(member_id="MID2") == Counter(accepted=1, declined=1)
+        assert stats.counts(group_id="GID1") == stats.counts()
+        assert stats.counts(subgroup_id="SGID1") == Counter(accepted=3, declined=1)
+        assert stats.rate(member_id="MID1") == 1.0
+        assert stats.rate("declined", subgroup_id="SGID2") == 0.5
+        assert stats.rate(member_id="UNKNOWN") is None
+        with pytest.raises(ValueError):
+            stats.counts(member_id="MID1", group_id="GID1")
+
+    def test_add_replaces_and_remove_undoes(self) -> None:
+        stats = AttendanceStats(GROUPS)
+        stats.add(_event("E1", 1, ["MID1"], []))
+
+        stats.add(_event("E1", 1, [], ["MID1"]))
+        assert stats.counts(member_id="MID1") == Counter(declined=1)
+
+        stats.remove("E1")
+        stats.remove("E1")
+        assert "E1" not in stats
+        assert stats.counts() == Counter()
+        assert stats.counts(subgroup_id="SGID1") == Counter()
+
+    def test_apply__sync_changes(self) -> None:
+        stats = AttendanceStats(GROUPS)
+        stats.add(_event("E1", 1, ["MID1"], []))
+        stats.add(_event("E2", 2, ["MID1"], []))
+
+        stats.apply(
+            EventChanges(
+                added=[_event("E3", 3, ["MID2"], [])],
+                cancelled=[_event("E2", 2, ["MID1"], [], cancelled=True)],
+                removed=["E1"],
+            )
+        )
+
+        assert "E3" in stats
+        assert len(stats) == 1
+        assert stats.counts() == Counter(accepted=1)
+
+    def test_expire__rolling_window(self) -> None:
+        stats = AttendanceStats(GROUPS)
+        for day in range(1, 29):
+            stats.add(_event(f"E{day}", day, ["MID1"], []))
+        stats.add(_event("E5", 5, [], ["MID1"]))  # replaced: stale heap entry
+
+        removed = stats.expire(before=datetime(2026, 1, 22, tzinfo=UTC))
+
+        assert sorted(removed, key=lambda uid: int(uid[1:])) == [
+            f"E{day}" for day in range(1, 22)
+        ]
+        assert stats.counts(member_id="MID1") == Counter(accepted=7)
@@ -0,0 +1,124 @@
+"""Test suite for incremental JSON array decoding."""
+
+from __future__ import annotations
+
+import json
+from contextlib import aclosing
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from spond.mirror import SQLiteMirror
+from spond.spond import Spond
+from spond.stream import iter_json_array
+
+MOCK_USERNAME, MOCK_PASSWORD = "MOCK_USERNAME", "MOCK_PASSWORD"
+MOCK_TOKEN = "MOCK_TOKEN"
+
+ELEMENTS = [
+    {"id": "E1", "heading": 'Quote \\" and ], "', "tags": [1, 2.5e3, {"x": []}]},
+    {"id": "E2", "heading": "Æøå 🏃"},
+    12345,
+    "s,]",
+    None,
+    [],
+    True,
+]
+
+
+class _Content:
+    """An `aiohttp.StreamReader` stand-in yielding `body` in fixed chunks."""
+
+    def __init__(self, body: bytes, size: int) -> None:
+        self.body = body
+        self.size = size
+
+    async def iter_chunked(self, n: int):
+        for i in range(0, len(self.body), self.size):
+            yield self.body[i : i + self.size]
+
+
+async def _decode(body: bytes, size: int = 3) -> list:
+    return [e async for e in iter_json_array(_Content(body, size))]
+
+
+class TestIterJsonArray:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [1, 2, 7, 64, 100_000])
+    async def test_elements__across_chunk_boundaries(self, size) -> None:
+        body = json.dumps(ELEMENTS, ensure_ascii=False).encode()
+
+        assert await _decode(body, size) == ELEMENTS
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("body", [b"", b" null ", b"[]", b" [ ]\n"])
+    async def test_empty(self, body) -> None:
+        assert await _decode(body) == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "body", [b"[1,,2]", b"[1,]", b'[{"a": 1}', b"[1 2]", b'{"a": 1}']
+    )
+    async def test_malformed__raises(self, body) -> None:
+        with pytest.raises(ValueError):
+            await _decode(body)
+
+
+class TestStreamMethods:
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_stream_events__yields_and_mirrors_without_caching(
+        self, mock_get
+    ) -> None:
+        mirror = SQLiteMirror(":memory:")
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD, mirror=mirror)
+        s.token = MOCK_TOKEN
+        s._MIRROR_BATCH_SIZE = 2
+        events = [
+            {"id": f"E{i}", "startTimestamp": f"2026-01-0{i}T10:00:00Z"}
+            for i in range(1, 6)
+        ]
+        response = mock_get.return_value.__aenter__.return_value
+        response.ok = True
+        response.content = _Content(json.dumps(events).encode(), 50)
+
+        streamed = [e async for e in s.stream_events(group_id="GID1", max_events=5)]
+
+        assert streamed == events
+        assert mock_get.call_args.kwargs["params"]["max"] == "5"
+        assert mock_get.call_args.kwargs["params"]["groupId"] == "GID1"
+        assert [e["id"] for e in mirror.events()] == [e["id"] for e in events]
+        assert s.events is None
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_stream_events__closing_early_releases_response(
+        self, mock_get
+    ) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = MOCK_TOKEN
+        response = mock_get.return_value.__aenter__.return_value
+        response.ok = True
+        response.content = _Content(b'[{"id": "E1"}, {"id": "E2"}]', 4)
+
+        async with aclosing(s.stream_events()) as events:
+            async for _ in events:
+                break
+
+        mock_get.return_value.__aexit__.assert_awaited_once()
+        await s.close()
+
+    @pytest.mark.asyncio
+    @patch("aiohttp.ClientSession.get")
+    async def test_stream_groups__failed_request_raises(self, mock_get) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        s.token = MOCK_TOKEN
+        response = mock_get.return_value.__aenter__.return_value
+        response.ok = False
+        response.status = 403
+        response.text = AsyncMock(return_value="Forbidden")
+
+        with pytest.raises(ValueError, match="403"):
+            [g async for g in s.stream_groups()]
+        await s.close()
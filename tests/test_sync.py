@@ -0,0 +1,94 @@
+"""Test suite for incremental event sync."""
+
+from __future__ import annotations
+
+import pytest
+
+from spond.spond import Spond
+from spond.sync import EventChanges, EventSync
+
+MOCK_USERNAME, MOCK_PASSWORD = "MOCK_USERNAME", "MOCK_PASSWORD"
+MOCK_TOKEN = "MOCK_TOKEN"
+
+
+def _serve(s: Spond, runs: list[list[dict]]) -> list[dict]:
+    """Make each call of `s.iter_events` yield the next list in `runs`, and
+    return the list of keyword arguments it was called with."""
+    calls = []
+
+    async def iter_events(**kwargs):
+        calls.append(kwargs)
+        for event in runs.pop(0):
+            yield event
+
+    s.iter_events = iter_events
+    return calls
+
+
+class TestEventSync:
+    @pytest.mark.asyncio
+    async def test_sync__reports_changeset_between_runs(self) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        e1 = {"id": "E1", "updated": 1}
+        e2 = {"id": "E2", "updated": 5}
+        e3 = {"id": "E3", "updated": 7}
+        e2_changed = {"id": "E2", "updated": 6}
+        e3_cancelled = {"id": "E3", "updated": 8, "cancelled": True}
+        e4 = {"id": "E4", "updated": 1}
+        calls = _serve(s, [[e1, e2, e3], [e2_changed, e3_cancelled, e4], [e2_changed]])
+        sync = EventSync(s, group_id="GID1", page_size=50)
+
+        first = await sync.sync()
+        second = await sync.sync()
+        third = await sync.sync()
+
+        assert first == EventChanges(added=[e1, e2, e3])
+        assert second == EventChanges(
+            added=[e4], updated=[e2_changed], cancelled=[e3_cancelled], removed=["E1"]
+        )
+        assert third == EventChanges(removed=["E3", "E4"])
+        assert sync.versions == {"E2": 6}
+        assert calls == [{"group_id": "GID1", "page_size": 50}] * 3
+        await s.close()
+
+    @pytest.mark.asyncio
+    async def test_sync__no_changes_is_falsy(self) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        events = [{"id": "E1", "updated": 1}, {"id": "E2", "updated": 2}]
+        _serve(s, [events])
+        sync = EventSync(s, versions={"E1": 1, "E2": 2})
+
+        changes = await sync.sync()
+
+        assert not changes
+        await s.close()
+
+    @pytest.mark.asyncio
+    async def test_sync__event_without_version_always_updated(self) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+        event = {"id": "E1"}
+        _serve(s, [[event], [event]])
+        sync = EventSync(s)
+
+        await sync.sync()
+        changes = await sync.sync()
+
+        assert changes == EventChanges(updated=[event])
+        await s.close()
+
+    @pytest.mark.asyncio
+    async def test_sync__failed_run_keeps_versions(self) -> None:
+        s = Spond(MOCK_USERNAME, MOCK_PASSWORD)
+
+        async def iter_events(**kwargs):
+            yield {"id": "E2", "updated": 1}
+            raise ValueError("Request failed with status 503")
+
+        s.iter_events = iter_events
+        sync = EventSync(s, versions={"E1": 1})
+
+        with pytest.raises(ValueError):
+            await sync.sync()
+
+        assert sync.versions == {"E1": 1}
+        await s.close()
@@ -0,0 +1,55 @@
+"""Test suite for token stores."""
+
+from __future__ import annotations
+
+import json
+import stat
+from datetime import UTC, datetime
+
+import pytest
+
+from spond.token_store import FileTokenStore, StoredToken
+
+EXPIRATION = datetime(2026, 5, 14, 12, 0, tzinfo=UTC)
+
+
+class TestFileTokenStore:
+    def test_load__missing_file_returns_none(self, tmp_path) -> None:
+        store = FileTokenStore(tmp_path / "tokens.json")
+
+        assert store.load("KEY") is None
+
+    def test_save_then_load__round_trips(self, tmp_path) -> None:
+        store = FileTokenStore(tmp_path / "nested" / "tokens.json")
+
+        store.save("KEY1", StoredToken("ABC", EXPIRATION))
+        store.save("KEY2", StoredToken("DEF", None))
+
+        reopened = FileTokenStore(tmp_path / "nested" / "tokens.json")
+        assert reopened.load("KEY1") == StoredToken("ABC", EXPIRATION)
+        assert reopened.load("KEY2") == StoredToken("DEF", None)
+        assert reopened.load("KEY3") is None
+
+    def test_save__file_readable_by_owner_only(self, tmp_path) -> None:
+        path = tmp_path / "tokens.json"
+        FileTokenStore(path).save("KEY", StoredToken("ABC", EXPIRATION))
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    def test_load__corrupt_file_returns_none(self, tmp_path) -> None:
+        path = tmp_path / "tokens.json"
+        path.write_text("not json")
+        store = FileTokenStore(path)
+
+        assert store.load("KEY") is None
+        store.save("KEY", StoredToken("ABC", None))
+        assert json.loads(path.read_text()) == {
+            "KEY": {"token": "ABC", "expiration": None}
+        }
+
+    @pytest.mark.parametrize("expiration", ["soon", 12345, "2026-05-14T12:00:00"])
+    def test_load__bad_expiration_returns_none(self, tmp_path, expiration) -> None:
+        path = tmp_path / "tokens.json"
+        path.write_text(json.dumps({"KEY": {"token": "ABC", "expiration": expiration}}))
+
+        assert FileTokenStore(path).load("KEY") is None